@@ -0,0 +1,72 @@
+"""
+Бенчмарк анимированных тайлов: 1 000 - 100 000 анимированных спрайтов.
+
+Сравнивает то, как arcade анимирует тайлы Tiled сам
+(TextureAnimationSprite.update_animation у каждого спрайта каждый кадр),
+с animation_system: общие часы, кадр считается раз на группу тайлов
+с одной анимацией, текстуры меняются только при смене кадра.
+Статичные спрайты в систему не попадают, их стоимость - 0.
+
+Запуск из корня проекта:
+    python -m benchmarks.animation
+"""
+import time
+
+import arcade
+from arcade import TextureAnimation, TextureAnimationSprite, TextureKeyframe
+
+from src.systems.animation_system import AnimationSystem
+
+COUNTS = (1_000, 10_000, 100_000)
+KINDS = 8  # Разных анимаций (вода, факелы, ...)
+FRAMES = 120
+DT = 1 / 60
+
+
+def make_animations():
+    animations = []
+    for kind in range(KINDS):
+        textures = [arcade.make_soft_square_texture(16, (kind * 30, frame * 60, 0), name=f"anim_{kind}_{frame}")
+                    for frame in range(4)]
+        animations.append([TextureKeyframe(texture, duration=150 + kind * 25) for texture in textures])
+    return animations
+
+
+def make_sprites(count, animations):
+    sprites = []
+    for index in range(count):
+        # У каждого тайла свой TextureAnimation, как при загрузке карты arcade
+        keyframes = animations[index % KINDS]
+        sprites.append(TextureAnimationSprite(animation=TextureAnimation(list(keyframes))))
+    return sprites
+
+
+def main():
+    animations = make_animations()
+    print(f"{'спрайтов':>9} | {'update_animation, мс':>20} | {'animation_system, мс':>20} | "
+          f"{'смен текстур/кадр':>17} | {'add_layer, мс':>13}")
+    for count in COUNTS:
+        sprites = make_sprites(count, animations)
+        start = time.perf_counter()
+        for _ in range(FRAMES):
+            for sprite in sprites:
+                sprite.update_animation(DT)
+        arcade_ms = (time.perf_counter() - start) / FRAMES * 1000
+
+        sprites = make_sprites(count, animations)
+        system = AnimationSystem()
+        start = time.perf_counter()
+        system.add_layer(sprites)
+        add_ms = (time.perf_counter() - start) * 1000
+
+        changed = 0
+        start = time.perf_counter()
+        for _ in range(FRAMES):
+            changed += system.update(DT)
+        system_ms = (time.perf_counter() - start) / FRAMES * 1000
+
+        print(f"{count:>9} | {arcade_ms:20.3f} | {system_ms:20.3f} | {changed / FRAMES:17.0f} | {add_ms:13.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Микро-бенчмарк камеры: 1 000 000 вызовов следования за игроком.
+
+Сравнивает старую логику GameplayState.update (зажим и lerp каждый кадр)
+с Camera.follow_player (кэш границ + пропуск, когда игрок стоит).
+
+Запуск из корня проекта:
+    python -m benchmarks.camera_follow
+"""
+import time
+
+import arcade
+
+from src.world.camera import Camera
+
+UPDATES = 1_000_000
+MAP_WIDTH, MAP_HEIGHT = 10500, 3500
+TILE_SIZE = 64
+
+
+def legacy_follow(camera, map_bounds, target_x, target_y):
+    """Старая логика из GameplayState.update - всё пересчитывается каждый кадр"""
+    map_left, map_bottom, map_right, map_top = map_bounds
+
+    viewport_rect = camera.viewport
+    half_screen_w = viewport_rect.width / 2
+    half_screen_h = viewport_rect.height / 2
+    tile_buffer = TILE_SIZE
+
+    final_x = max(map_left + half_screen_w - tile_buffer,
+                  min(target_x, map_right - half_screen_w + tile_buffer))
+    final_y = max(map_bottom + half_screen_h - tile_buffer,
+                  min(target_y, map_top - half_screen_h + tile_buffer))
+
+    if (map_right - map_left) < (half_screen_w * 2 - tile_buffer * 2):
+        final_x = (map_left + map_right) / 2
+    if (map_top - map_bottom) < (half_screen_h * 2 - tile_buffer * 2):
+        final_y = (map_bottom + map_top) / 2
+
+    current_x, current_y = camera.position
+    lerp_factor = 0.1
+    camera.position = (current_x + (final_x - current_x) * lerp_factor,
+                       current_y + (final_y - current_y) * lerp_factor)
+
+
+def run(name, func):
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"{name:<40} {elapsed:7.3f} с  ({elapsed / UPDATES * 1e9:6.0f} нс/вызов)")
+
+
+def main():
+    arcade.Window(320, 240, visible=False)
+
+    # Игрок ходит по кругу на каждом кадре
+    path = [(3000 + (i % 600) * 2.0, 1500 + (i % 400) * 1.5) for i in range(1000)]
+
+    legacy_camera = arcade.camera.Camera2D()
+    bounds = (0, 0, MAP_WIDTH, MAP_HEIGHT)
+
+    def legacy_moving():
+        for i in range(UPDATES):
+            x, y = path[i % 1000]
+            legacy_follow(legacy_camera, bounds, x, y)
+
+    def legacy_static():
+        for _ in range(UPDATES):
+            legacy_follow(legacy_camera, bounds, 3000, 1500)
+
+    camera = Camera(1440, 900, edge_buffer=TILE_SIZE)
+    camera.set_map_bounds(0, 0, MAP_WIDTH, MAP_HEIGHT)
+
+    def new_moving():
+        for i in range(UPDATES):
+            x, y = path[i % 1000]
+            camera.follow_player(x, y, 1 / 60)
+
+    def new_static():
+        for _ in range(UPDATES):
+            camera.follow_player(3000, 1500, 1 / 60)
+
+    print(f"Камера: {UPDATES:,} обновлений")
+    run("старая логика, игрок движется", legacy_moving)
+    run("старая логика, игрок стоит", legacy_static)
+    run("Camera.follow_player, игрок движется", new_moving)
+    run("Camera.follow_player, игрок стоит", new_static)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Бенчмарк связывания спрайтов сундуков с событиями на карте с 2000 сундуков.
+
+Сравнивает старый подход (для каждого тайла - линейный поиск ближайшего
+события с sqrt и print на каждого кандидата, текстуры загружаются в цикле)
+с EventManager.link_chest_sprites (явная связь по tile_x/tile_y и сеточный
+индекс для остальных). Вывод print в старом подходе уходит в os.devnull.
+
+Запуск из корня проекта:
+    python -m benchmarks.chest_linking
+"""
+import contextlib
+import logging
+import os
+import random
+import time
+
+import arcade
+
+from src.entities.chest import ChestSprite
+from src.events.chest_event import ChestEvent
+from src.events.event_manager import EventManager
+
+CHESTS = 2000
+MAP_SIZE = 300  # тайлов
+TILE = 70
+
+
+def make_map(rng, explicit_share):
+    """Менеджер с событиями сундуков и слой тайлов (тайл - в клетке события)"""
+    manager = EventManager()
+    tiles = arcade.SpriteList()
+    texture = arcade.make_soft_square_texture(TILE, arcade.color.BROWN)
+    cells = rng.sample([(x, y) for x in range(MAP_SIZE) for y in range(MAP_SIZE)], CHESTS)
+    for i, (col, row) in enumerate(cells):
+        properties = {"lock": ""}
+        if rng.random() < explicit_share:
+            properties["tile_x"] = col
+            properties["tile_y"] = MAP_SIZE - 1 - row
+        # Зона события больше тайла и немного смещена, как в Tiled
+        rect = (col * TILE - 30 + rng.uniform(-10, 10), row * TILE - 30 + rng.uniform(-10, 10), 130, 130)
+        manager.add_event(ChestEvent(f"chest_{i}", rect, properties))
+
+        tile = arcade.Sprite(texture)
+        tile.center_x = col * TILE + TILE / 2
+        tile.center_y = row * TILE + TILE / 2
+        tiles.append(tile)
+    return manager, tiles
+
+
+def legacy_link(manager, tiles):
+    """Старый MapLoader._create_chest_sprites_from_layer"""
+    for tile in tiles:
+        nearest_event = None
+        min_distance = float('inf')
+        print(f"   🔍 Поиск события для позиции ({tile.center_x:.0f}, {tile.center_y:.0f})")
+        for event in manager.events:
+            if event.type == "chest":
+                ex, ey, ew, eh = event.rect
+                distance = ((tile.center_x - (ex + ew / 2)) ** 2 + (tile.center_y - (ey + eh / 2)) ** 2) ** 0.5
+                print(f"   📏 Событие {event.event_id}: расстояние {distance:.1f}px")
+                if distance < min_distance and distance <= TILE * 5:
+                    min_distance = distance
+                    nearest_event = event
+
+        if nearest_event:
+            texture_closed = manager.rm.load_texture("containers/chest.png")
+            texture_open = manager.rm.load_texture("containers/chest_opened.png")
+            sprite = ChestSprite(texture=texture_closed, texture_open=texture_open,
+                                 x=tile.center_x, y=tile.center_y, event=nearest_event)
+            nearest_event.set_sprite(sprite)
+            manager.sprites.append(sprite)
+            tile.visible = False
+
+
+def run(title, link, explicit_share):
+    manager, tiles = make_map(random.Random(42), explicit_share)
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        link(manager, tiles)
+        elapsed = time.perf_counter() - start
+    linked = sum(event.sprite is not None for event in manager.events)
+    print(f"  {title:<40} {elapsed * 1000:10.1f} мс  (связано {linked} из {CHESTS})")
+
+
+def main():
+    arcade.Window(320, 240, visible=False)
+    logging.disable(logging.WARNING)
+
+    print(f"{CHESTS} сундуков на карте {MAP_SIZE}x{MAP_SIZE}:")
+    run("старый линейный поиск", legacy_link, 0.0)
+    run("индекс, без tile_x/tile_y", lambda m, t: m.link_chest_sprites(t, TILE, TILE, MAP_SIZE, TILE * 5), 0.0)
+    run("индекс, у всех tile_x/tile_y", lambda m, t: m.link_chest_sprites(t, TILE, TILE, MAP_SIZE, TILE * 5), 1.0)
+
+
+if __name__ == "__main__":
+    main()
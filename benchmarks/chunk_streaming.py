@@ -0,0 +1,88 @@
+"""
+Бенчмарк потоковой загрузки: карта 4000x4000 тайлов (в 320 раз больше testmap.tmx).
+
+Камера едет по диагонали через всю карту, ChunkStreamer подгружает чанки
+в фоновом потоке. Меряем время update в основном потоке, число чанков
+и спрайтов в памяти и объем памяти Python (tracemalloc).
+
+Запуск из корня проекта:
+    python -m benchmarks.chunk_streaming
+"""
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from array import array
+
+import arcade
+
+from src.world.chunk_file import ChunkFile
+from src.world.chunk_streamer import ChunkStreamer
+from src.world.text_map_loader import TextMapLoader, TileGrid
+
+SIZE = 4000
+CHUNK_SIZE = 32
+FRAMES = 3000
+SPEED = 30  # пикселей за кадр - быстрее бега игрока
+
+
+def main():
+    arcade.Window(320, 240, visible=False)
+
+    loader = TextMapLoader()
+    loader.load_tile_data()
+    tile_ids = bytes(sorted(loader.tile_data))
+
+    rng = random.Random(42)
+    tiles = array("B", bytes(rng.choice(tile_ids) for _ in range(SIZE * SIZE)))
+    grid = TileGrid(SIZE, SIZE, tiles, bytearray(tiles.tobytes().translate(loader.blocked_lookup)))
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "huge.chunks")
+        start = time.perf_counter()
+        ChunkFile.write(path, grid, chunk_size=CHUNK_SIZE)
+        print(f"Файл чанков {SIZE}x{SIZE}: {os.path.getsize(path) / 1024 / 1024:.1f} МБ "
+              f"за {time.perf_counter() - start:.1f} с")
+        del grid, tiles
+
+        frame_times, peak_chunks = run_pass(path, loader, FRAMES)
+        frame_times.sort()
+        print(f"update: среднее {sum(frame_times) / FRAMES * 1000:.3f} мс, "
+              f"p99 {frame_times[int(FRAMES * 0.99)] * 1000:.3f} мс, макс {frame_times[-1] * 1000:.3f} мс")
+        print(f"Чанков в памяти: максимум {peak_chunks} из {SIZE // CHUNK_SIZE} x {SIZE // CHUNK_SIZE}, "
+              f"спрайтов ~{peak_chunks * CHUNK_SIZE * CHUNK_SIZE} из {SIZE * SIZE}")
+
+        # Отдельный проход под tracemalloc - он сильно замедляет и исказил бы время
+        tracemalloc.start()
+        run_pass(path, loader, FRAMES // 3)
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"Память Python: в конце {current / 1024 / 1024:.1f} МБ, пик {peak / 1024 / 1024:.1f} МБ")
+
+
+def run_pass(path, loader, frames):
+    """Проезд камеры по диагонали. Возвращает время update по кадрам и максимум чанков в памяти"""
+    streamer = ChunkStreamer(ChunkFile(path), loader, None, tile_size=70)
+
+    start = time.perf_counter()
+    streamer.preload(1000, SIZE * 70 - 1000)
+    preload_time = time.perf_counter() - start
+
+    frame_times = []
+    peak_chunks = 0
+    for frame in range(frames):
+        x = 1000 + frame * SPEED
+        y = SIZE * 70 - 1000 - frame * SPEED
+        start = time.perf_counter()
+        streamer.update(x, y)
+        frame_times.append(time.perf_counter() - start)
+        peak_chunks = max(peak_chunks, len(streamer.chunks))
+        time.sleep(1 / 240)  # Остальной кадр - даем фоновому потоку поработать
+
+    streamer.shutdown()
+    print(f"  проход {frames} кадров, preload {preload_time * 1000:.1f} мс")
+    return frame_times, peak_chunks
+
+if __name__ == "__main__":
+    main()
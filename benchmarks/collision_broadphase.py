@@ -0,0 +1,76 @@
+"""
+Бенчмарк broadphase коллизий сущность-сущность.
+
+Сравнивает попарную проверку CollisionSystem.check_entity_collision (O(N²))
+с SpatialHashBroadphase на 100 - 20 000 сущностях с одинаковой плотностью.
+
+Запуск из корня проекта:
+    python -m benchmarks.collision_broadphase
+"""
+import random
+import time
+
+import arcade
+
+from src.entities.base_entity import Entity
+from src.systems.collision_system import CollisionSystem, SpatialHashBroadphase
+
+COUNTS = (100, 500, 2_000, 20_000)
+DENSITY = 1 / 100 ** 2  # одна сущность на 100x100 пикселей
+TICKS = 10
+
+# Попарная проверка O(N²) - дальше этого числа не меряем
+PAIRWISE_LIMIT = 2_000
+
+
+def make_entities(count, texture, rng):
+    side = (count / DENSITY) ** 0.5
+    entities = []
+    for i in range(count):
+        entity = Entity([texture], 1)
+        entity.center_x = rng.uniform(0, side)
+        entity.center_y = rng.uniform(0, side)
+        entity.setup_hitbox({'left': 0.1, 'right': 0.1, 'top': 0.2, 'bottom': 0})
+        # Часть сущностей без коллизий с сущностями (декор, снаряды игрока)
+        entity.collides_with_entities = i % 10 != 0
+        entities.append(entity)
+    return entities
+
+
+def pairwise(entities):
+    pairs = []
+    for i, first in enumerate(entities):
+        for second in entities[i + 1:]:
+            if CollisionSystem.check_entity_collision(first, second):
+                pairs.append((first, second))
+    return pairs
+
+
+def main():
+    arcade.Window(320, 240, visible=False)
+    texture = arcade.make_soft_square_texture(48, arcade.color.RED)
+    rng = random.Random(42)
+
+    print(f"{'сущностей':>10} | {'O(N²), мс':>10} | {'хэш, мс':>8} | {'кандидатов':>10} | {'пар':>6}")
+    for count in COUNTS:
+        entities = make_entities(count, texture, rng)
+        broadphase = SpatialHashBroadphase(cell_size=96)
+
+        for _ in range(TICKS):
+            pairs = broadphase.find_pairs(entities)
+        stats = broadphase.get_stats()
+
+        if count <= PAIRWISE_LIMIT:
+            start = time.perf_counter()
+            expected = pairwise(entities)
+            pairwise_ms = f"{(time.perf_counter() - start) * 1000:10.2f}"
+            assert set(map(frozenset, expected)) == set(map(frozenset, pairs))
+        else:
+            pairwise_ms = f"{'-':>10}"
+
+        print(f"{count:>10} | {pairwise_ms} | {stats['mean_ms']:8.2f} | {stats['candidate_pairs']:>10} | "
+              f"{stats['collision_pairs']:>6}")
+
+
+if __name__ == "__main__":
+    main()
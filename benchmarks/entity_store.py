@@ -0,0 +1,100 @@
+"""
+Бенчмарк пакетной симуляции сущностей: от 100 до 50 000 Entity.
+
+Один тик: движение, регенерация здоровья и поиск пересекающихся пар.
+Сравнивает цикл Python по объектам Entity с EntityStore (NumPy),
+отдельно - стоимость sync_sprites (копирование позиций в спрайты).
+
+Запуск из корня проекта:
+    python -m benchmarks.entity_store
+"""
+import random
+import time
+
+import arcade
+import numpy as np
+
+from src.entities.base_entity import Entity
+from src.entities.entity_store import EntityStore
+from src.systems.collision_system import CollisionSystem
+
+COUNTS = (100, 1_000, 10_000, 50_000)
+TICKS = 20
+DT = 1 / 60
+WORLD = 10_000
+
+# Попарная проверка O(N²) - дальше этого числа не меряем
+PAIRWISE_LIMIT = 2_000
+
+
+def make_entities(count, texture, rng):
+    entities = []
+    for i in range(count):
+        entity = Entity([texture], 1)
+        entity.center_x = rng.uniform(0, WORLD)
+        entity.center_y = rng.uniform(0, WORLD)
+        entity.setup_hitbox({'left': 0.1, 'right': 0.1, 'top': 0.2, 'bottom': 0})
+        entity.velocity = (rng.uniform(-100, 100), rng.uniform(-100, 100))
+        entities.append(entity)
+    return entities
+
+
+def python_tick(entities, pairwise):
+    for entity in entities:
+        vx, vy = entity.velocity
+        entity.center_x += vx * DT
+        entity.center_y += vy * DT
+        entity.health = min(100, entity.health + 1 * DT)
+
+    if pairwise:
+        pairs = 0
+        for i, first in enumerate(entities):
+            for second in entities[i + 1:]:
+                if CollisionSystem.check_entity_collision(first, second):
+                    pairs += 1
+
+
+def main():
+    arcade.Window(320, 240, visible=False)
+    texture = arcade.make_soft_square_texture(32, arcade.color.RED)
+    rng = random.Random(42)
+
+    print(f"{'сущностей':>10} | {'Python, мс':>11} | {'+ пары O(N²)':>12} | {'EntityStore, мс':>15} | "
+          f"{'sync_sprites, мс':>16} | {'пар':>6}")
+    for count in COUNTS:
+        entities = make_entities(count, texture, rng)
+
+        start = time.perf_counter()
+        for _ in range(TICKS):
+            python_tick(entities, pairwise=False)
+        python_ms = (time.perf_counter() - start) / TICKS * 1000
+
+        if count <= PAIRWISE_LIMIT:
+            start = time.perf_counter()
+            python_tick(entities, pairwise=True)
+            pairwise_ms = f"{(time.perf_counter() - start) * 1000:12.2f}"
+        else:
+            pairwise_ms = f"{'-':>12}"
+
+        store = EntityStore()
+        for entity in entities:
+            store.add(entity)
+        store.velocity[:count] = np.array([entity.velocity for entity in entities])
+        store.health_regen[:count] = 1.0
+
+        start = time.perf_counter()
+        for _ in range(TICKS):
+            store.step(DT)
+            store.update_health(DT)
+            first, _ = store.overlapping_pairs()
+        store_ms = (time.perf_counter() - start) / TICKS * 1000
+
+        start = time.perf_counter()
+        store.sync_sprites()
+        sync_ms = (time.perf_counter() - start) * 1000
+
+        print(f"{count:>10} | {python_ms:11.2f} | {pairwise_ms} | {store_ms:15.2f} | {sync_ms:16.2f} | {len(first):>6}")
+
+
+if __name__ == "__main__":
+    main()
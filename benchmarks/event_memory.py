@@ -0,0 +1,72 @@
+"""
+Бенчмарк компактных записей: память на 10 000 событий и стоимость get_rect хитбокса.
+
+Память меряется tracemalloc только для самих объектов событий
+(строки id и словари свойств создаются заранее). У сундуков отдельно
+показан вклад предметов добычи.
+
+Запуск из корня проекта:
+    python -m benchmarks.event_memory
+"""
+import logging
+import timeit
+import tracemalloc
+
+import arcade
+
+from src.entities.base_entity import Entity
+from src.events.chest_event import ChestEvent
+from src.events.event import GameEvent
+from src.events.teleport_event import TeleportEvent
+from src.systems.collision_system import CollisionSystem
+
+COUNT = 10_000
+
+
+def measure(name, factory, arguments):
+    tracemalloc.start()
+    events = [factory(*args) for args in arguments]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {name:<28} {size / 1024:10.0f} КиБ  ({size / len(events):6.0f} байт/событие)")
+    return events
+
+
+class _EmptyMap:
+    """Карта без стен - меряем только накладные расходы проверки"""
+
+    @staticmethod
+    def is_solid_at_pixel(x, y):
+        return False
+
+
+def main():
+    arcade.Window(320, 240, visible=False)
+    logging.disable(logging.CRITICAL)
+
+    print(f"Память на {COUNT} событий:")
+    measure("GameEvent", GameEvent,
+            [(f"trigger_{i}", "trigger", (i, 0, 70, 70), {}) for i in range(COUNT)])
+    measure("TeleportEvent", TeleportEvent,
+            [(f"teleport_{i}", (i, 0, 70, 70), {"target_map": "maps/a.tmx", "target_x": 1, "target_y": 2})
+             for i in range(COUNT)])
+    measure("ChestEvent без добычи", ChestEvent,
+            [(f"chest_{i}", (i, 0, 70, 70), {"lock": "<><>"}) for i in range(COUNT)])
+    measure("ChestEvent, healing_potion:3", ChestEvent,
+            [(f"chest_{i}", (i, 0, 70, 70), {"loot": "healing_potion:3"}) for i in range(COUNT)])
+
+    texture = arcade.make_soft_square_texture(64, arcade.color.RED)
+    entity = Entity([texture], 1)
+    entity.setup_hitbox({'left': 0.1, 'right': 0.1, 'top': 0.2, 'bottom': 0})
+    game_map = _EmptyMap()
+
+    print("Хитбокс:")
+    for title, statement in (("get_rect", "entity.hitbox.get_rect()"),
+                             ("get_collision_rect", "entity.get_collision_rect()"),
+                             ("resolve_map_collision", "CollisionSystem.resolve_map_collision(entity, game_map, 1, 1)")):
+        best = min(timeit.repeat(statement, globals={**globals(), **locals()}, number=100_000, repeat=5))
+        print(f"  {title:<28} {best * 1e4:10.0f} нс")
+
+
+if __name__ == "__main__":
+    main()
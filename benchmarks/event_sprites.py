@@ -0,0 +1,151 @@
+"""
+Бенчмарк отрисовки визуалов событий: draw call'ы и загрузка буферов на GPU.
+
+Карта с 1000 сундуков и 50 спрайтами телепортов. Сравнивает прежнюю схему
+(слой тайлов "containers" со скрытыми тайлами + chest_sprites +
+event_sprites, текстура открытого сундука попадает в атлас при первом
+открытии) с общим EventManager.sprites (тайлы убраны из слоя, текстуры
+заранее в атласе). Меряется кадр без изменений и кадр, в котором
+открывается один сундук.
+
+Запуск из корня проекта:
+    python -m benchmarks.event_sprites
+"""
+import contextlib
+import logging
+import os
+import time
+
+import arcade
+from arcade.gl import Buffer, Geometry
+
+from src.entities.chest import ChestSprite
+from src.events.chest_event import ChestEvent
+from src.events.event_manager import EventManager
+
+CHESTS = 1000
+TELEPORTS = 50
+COLUMNS = 40
+TILE = 64
+FRAMES = 200
+
+
+class GpuCounter:
+    """Считает Geometry.render и байты Buffer.write (как FrameProfiler)"""
+
+    def __init__(self):
+        self.draw_calls = 0
+        self.bytes_written = 0
+        self._patched = []
+
+    def __enter__(self):
+        for geometry_class in Geometry.__subclasses__():
+            self._patch(geometry_class, "render", lambda *args, **kwargs: self._count_draw())
+        for buffer_class in Buffer.__subclasses__():
+            self._patch(buffer_class, "write", lambda buffer, data, *args, **kwargs: self._count_bytes(data))
+        return self
+
+    def __exit__(self, *exc):
+        for owner, name, original in self._patched:
+            setattr(owner, name, original)
+
+    def _patch(self, owner, name, hook):
+        original = getattr(owner, name)
+
+        def wrapper(*args, _original=original, **kwargs):
+            hook(*args, **kwargs)
+            return _original(*args, **kwargs)
+
+        self._patched.append((owner, name, original))
+        setattr(owner, name, wrapper)
+
+    def _count_draw(self):
+        self.draw_calls += 1
+
+    def _count_bytes(self, data):
+        self.bytes_written += memoryview(data).nbytes
+
+    def reset(self):
+        self.draw_calls = 0
+        self.bytes_written = 0
+
+
+def make_map():
+    manager = EventManager()
+    tiles = arcade.SpriteList()
+    tile_texture = arcade.make_soft_square_texture(TILE, arcade.color.BROWN, name="bench_chest_tile")
+    for index in range(CHESTS):
+        col, row = index % COLUMNS, index // COLUMNS
+        manager.add_event(ChestEvent(f"chest_{index}", (col * TILE, row * TILE, TILE, TILE), {"loot": ""}))
+        tiles.append(arcade.Sprite(tile_texture, center_x=col * TILE + TILE / 2, center_y=row * TILE + TILE / 2))
+    return manager, tiles
+
+
+def legacy_setup(manager, tiles):
+    """Прежняя схема: два списка, тайлы скрыты, но остаются в слое"""
+    chest_sprites = arcade.SpriteList()
+    event_sprites = arcade.SpriteList()
+    texture_closed = manager.rm.load_texture("containers/chest.png")
+    texture_open = manager.rm.load_texture("containers/chest_opened.png")
+    for tile, event in zip(tiles, manager.get_events_by_type("chest")):
+        sprite = ChestSprite(texture_closed, texture_open, tile.center_x, tile.center_y, event)
+        event.set_sprite(sprite)
+        chest_sprites.append(sprite)
+        tile.visible = False
+    for index in range(TELEPORTS):
+        event_sprites.append(arcade.SpriteSolidColor(TILE, TILE, index * TILE, -TILE, arcade.color.BLUE))
+    return lambda: (tiles.draw(), chest_sprites.draw(), event_sprites.draw())
+
+
+def merged_setup(manager, tiles):
+    manager.link_chest_sprites(tiles, TILE, TILE)
+    for index in range(TELEPORTS):
+        manager.sprites.append(arcade.SpriteSolidColor(TILE, TILE, index * TILE, -TILE, arcade.color.BLUE))
+    manager.sort_sprites()
+    return lambda: (tiles.draw(), manager.sprites.draw())
+
+
+def measure(title, setup, ctx):
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        manager, tiles = make_map()
+        draw = setup(manager, tiles)
+    chests = list(manager.get_events_by_type("chest"))
+    draw()  # Первая загрузка буферов
+    ctx.finish()
+
+    with GpuCounter() as counter:
+        counter.reset()
+        start = time.perf_counter()
+        for _ in range(FRAMES):
+            draw()
+        ctx.finish()
+        static_ms = (time.perf_counter() - start) / FRAMES * 1000
+        static_calls, static_bytes = counter.draw_calls / FRAMES, counter.bytes_written / FRAMES
+
+        counter.reset()
+        start = time.perf_counter()
+        for chest in chests[:FRAMES]:
+            chest.is_empty = True
+            chest.sprite.update_visual()
+            draw()
+        ctx.finish()
+        open_ms = (time.perf_counter() - start) / FRAMES * 1000
+        open_calls, open_bytes = counter.draw_calls / FRAMES, counter.bytes_written / FRAMES
+
+    print(f"  {title:<22} | {static_calls:10.0f} | {static_bytes:12.0f} | {static_ms:8.3f} | "
+          f"{open_calls:10.0f} | {open_bytes:12.0f} | {open_ms:8.3f}")
+
+
+def main():
+    window = arcade.Window(320, 240, visible=False)
+    logging.disable(logging.WARNING)
+
+    print(f"{CHESTS} сундуков + {TELEPORTS} телепортов, на кадр:")
+    print(f"  {'':<22} | {'draw calls':>10} | {'байт на GPU':>12} | {'мс':>8} | "
+          f"{'+ открытие':>10} | {'байт на GPU':>12} | {'мс':>8}")
+    measure("прежние 3 списка", legacy_setup, window.ctx)
+    measure("общий EventManager", merged_setup, window.ctx)
+
+
+if __name__ == "__main__":
+    main()
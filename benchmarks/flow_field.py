@@ -0,0 +1,83 @@
+"""
+Бенчмарк поля направлений: 5000 агентов преследуют игрока.
+
+Сравнивает A* на каждого агента с одним FlowField: стоимость пересчета
+поля при смене клетки игрока и чтение направлений поштучно и пачкой.
+
+Запуск из корня проекта:
+    python -m benchmarks.flow_field
+"""
+import random
+import time
+
+import arcade
+import numpy as np
+
+from benchmarks.pathfinding import synthetic_grid
+from src.systems.flow_field import FlowField
+from src.systems.pathfinding import Pathfinder
+from src.world.map_loader import MapLoader
+
+AGENTS = 5000
+TICKS = 120
+
+
+def run(title, grid, rng, max_distance=None):
+    print(f"{title}: {grid.width}x{grid.height}")
+    free = [(x, y) for y in range(grid.height) for x in range(grid.width) if grid.is_walkable(x, y)]
+    agents = [grid.cell_to_world(*rng.choice(free)) for _ in range(AGENTS)]
+    xs = np.array([x for x, _ in agents])
+    ys = np.array([y for _, y in agents])
+
+    # Игрок идет по свободным клеткам - каждый тик новая клетка (худший случай)
+    player_cells = [rng.choice(free) for _ in range(TICKS)]
+
+    field = FlowField(grid, max_distance=max_distance)
+    recompute = 0.0
+    single = 0.0
+    batch = 0.0
+    for cell in player_cells:
+        start = time.perf_counter()
+        field.update(*grid.cell_to_world(*cell))
+        recompute += time.perf_counter() - start
+
+        start = time.perf_counter()
+        direction_at = field.direction_at
+        for x, y in agents:
+            direction_at(x, y)
+        single += time.perf_counter() - start
+
+        start = time.perf_counter()
+        field.directions_for(xs, ys)
+        batch += time.perf_counter() - start
+
+    reached = field.cells.size + 1
+    print(f"  пересчет поля          {recompute / TICKS * 1000:8.2f} мс/тик (клеток в поле: {reached})")
+    print(f"  direction_at x{AGENTS}   {single / TICKS * 1000:8.2f} мс/тик")
+    print(f"  directions_for x{AGENTS} {batch / TICKS * 1000:8.2f} мс/тик")
+
+    # Тот же тик через A* на каждого агента (на 50 агентах, дальше экстраполяция)
+    pathfinder = Pathfinder(grid)
+    goal = player_cells[-1]
+    start = time.perf_counter()
+    for x, y in agents[:50]:
+        pathfinder.find_path(grid.world_to_cell(x, y), goal)
+    per_agent = (time.perf_counter() - start) / 50
+    print(f"  A* на агента           {per_agent * 1000:8.2f} мс -> {per_agent * AGENTS * 1000:.0f} мс/тик на {AGENTS}")
+
+
+def main():
+    arcade.Window(320, 240, visible=False)
+    rng = random.Random(42)
+
+    map_loader = MapLoader()
+    map_loader.load("maps/testmap.tmx", scale=1)
+    run("testmap.tmx", map_loader.get_navigation_grid(), rng)
+
+    grid = synthetic_grid(rng)
+    run("Синтетическая сетка, без ограничения радиуса", grid, rng)
+    run("Синтетическая сетка, радиус 64 клетки", grid, rng, max_distance=64)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Бенчмарк FramePacer: загрузка CPU в лобби без ввода.
+
+Запускает цикл событий pyglet, как arcade.run() с обычным окном: кадры
+идут по расписанию update_rate/draw_rate (headless-ветка arcade.run
+крутит кадры без пауз и частоту не учитывает, поэтому окно в headless-
+режиме открывается, а цикл запускается напрямую). Лобби на экране,
+замер дважды: со снижением частоты в простое и без него.
+Меряется загрузка CPU процессом (process_time / время по часам), как в
+строке "CPU процесса" оверлея F3, и сколько кадров реально отрисовано.
+Первая секунда (idle_delay) - еще полная частота: она входит в общий
+замер, а отдельная колонка считает только время после WARMUP.
+
+Запуск из корня проекта:
+    python -m benchmarks.idle_pacing
+"""
+import logging
+import os
+import tempfile
+import time
+
+os.environ.setdefault("ARCADE_HEADLESS", "1")
+
+import arcade
+import pyglet
+
+from frame.main_window import MainWindow
+
+SECONDS = 8.0
+# Больше idle_delay FramePacer'а: после этого момента лобби уже в простое
+WARMUP = 2.0
+
+
+def run_lobby(window, pacing: bool):
+    """
+    Крутит цикл SECONDS секунд.
+
+    Returns:
+        (CPU % за весь замер, кадров/с за весь замер,
+         CPU % и кадров/с после WARMUP - уже в простое)
+    """
+    window.frame_pacer.set_enabled(pacing)
+    window.frame_pacer.wake()
+    window.input_manager.last_input_time = time.perf_counter()
+
+    frames = 0
+    original_draw = window.on_draw
+
+    def counting_draw():
+        nonlocal frames
+        frames += 1
+        original_draw()
+
+    def sample():
+        return time.perf_counter(), time.process_time(), frames
+
+    checkpoint = []
+    window.on_draw = counting_draw
+    pyglet.clock.schedule_once(lambda dt: checkpoint.append(sample()), WARMUP)
+    pyglet.clock.schedule_once(lambda dt: pyglet.app.exit(), SECONDS)
+
+    start = sample()
+    pyglet.app.run(None)
+    end = sample()
+    window.on_draw = original_draw
+
+    def rates(first, last):
+        wall = last[0] - first[0]
+        return (last[1] - first[1]) / wall * 100, (last[2] - first[2]) / wall
+
+    return rates(start, end) + rates(checkpoint[0], end)
+
+
+def main():
+    logging.disable(logging.WARNING)
+    # Привязки клавиш - во временный файл, настоящий settings/ не трогаем
+    with tempfile.TemporaryDirectory() as directory:
+        window = MainWindow(key_bindings_file=f"{directory}/key_bindings.json")  # Начинает с лобби
+
+    print(f"Лобби без ввода, {SECONDS:.0f} с:")
+    print(f"  {'':<14} | {'CPU, % (все)':>12} | {'кадров/с':>8} | "
+          f"{f'CPU, % (после {WARMUP:.0f} с)':>20} | {'кадров/с':>8}")
+    for title, pacing in (("без снижения", False), ("FramePacer", True)):
+        cpu_percent, fps, idle_cpu_percent, idle_fps = run_lobby(window, pacing)
+        print(f"  {title:<14} | {cpu_percent:12.1f} | {fps:8.1f} | {idle_cpu_percent:20.1f} | {idle_fps:8.1f}")
+
+    arcade.close_window()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Бенчмарк ввода: опрос действий каждый кадр против событий InputManager.
+
+Прежняя схема: каждый кадр GameplayState._handle_input опрашивал escape и
+cheat_console, Player - четыре направления, сундук в зоне игрока - select
+(плюс меню, которые смотрели на все зажатые действия). Теперь активное
+состояние получает on_action только в момент нажатия, игрок читает одно
+активное направление, а кадр без ввода закрывается end_tick.
+Меряется кадр без ввода, кадр с зажатым направлением и стоимость одного
+нажатия+отпускания с рассылкой подписчикам.
+
+Запуск из корня проекта:
+    python -m benchmarks.input_dispatch
+"""
+import logging
+import tempfile
+import time
+
+import arcade
+
+from src.core.input_manager import InputManager
+
+FRAMES = 200_000
+EVENTS = 50_000
+CHESTS_IN_RANGE = 1
+
+
+def legacy_frame(input_manager):
+    """Как прежние GameplayState._handle_input + Player.update + _on_chest_contact"""
+    input_manager.get_action("escape")
+    input_manager.get_action("cheat_console")
+    for direction in ("up", "down", "left", "right"):
+        input_manager.get_action(direction)
+    for _ in range(CHESTS_IN_RANGE):
+        input_manager.get_action("select")
+
+
+def event_frame(input_manager):
+    """Кадр теперь: направление игрока и закрытие тика"""
+    input_manager.last_valid_direction
+    input_manager.end_tick()
+
+
+def per_frame_ns(function, input_manager):
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        function(input_manager)
+    return (time.perf_counter() - start) / FRAMES * 1e9
+
+
+def main():
+    logging.disable(logging.WARNING)
+    with tempfile.TemporaryDirectory() as directory:
+        input_manager = InputManager(config_file=f"{directory}/key_bindings.json")
+
+    print(f"{'':<22} | {'опрос, нс/кадр':>14} | {'события, нс/кадр':>16}")
+    idle = (per_frame_ns(legacy_frame, input_manager), per_frame_ns(event_frame, input_manager))
+    print(f"{'без ввода':<22} | {idle[0]:14.0f} | {idle[1]:16.0f}")
+
+    input_manager.on_key_press(arcade.key.A, 0)
+    held = (per_frame_ns(legacy_frame, input_manager), per_frame_ns(event_frame, input_manager))
+    print(f"{'зажато направление':<22} | {held[0]:14.0f} | {held[1]:16.0f}")
+    input_manager.on_key_release(arcade.key.A, 0)
+
+    received = []
+    input_manager.subscribe(received.append)
+    start = time.perf_counter()
+    for _ in range(EVENTS):
+        input_manager.on_key_press(arcade.key.ESCAPE, 0)
+        input_manager.on_key_release(arcade.key.ESCAPE, 0)
+        input_manager.end_tick()
+    event_us = (time.perf_counter() - start) / EVENTS * 1e6
+    print(f"\nНажатие + отпускание с рассылкой: {event_us:.2f} мкс (событий доставлено: {len(received)})")
+
+
+if __name__ == "__main__":
+    main()
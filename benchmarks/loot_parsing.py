@@ -0,0 +1,103 @@
+"""
+Бенчмарк строк добычи: 100 000 строк лута, как у сундуков на картах.
+
+Сравнивает разбор split/int каждой строки (как в прежнем
+ItemFactory.parse_loot_string, без создания предметов) с compile_loot:
+все строки разные (холодный кэш; простые списки идут быстрым путем,
+строки с выбором - через общий парсер) и 200 разных строк на 100 000
+сундуков (попадания в кэш). Отдельно - бросок скомпилированной таблицы и
+стоимость прежнего подхода, где предметы создавались сразу при загрузке.
+
+Запуск из корня проекта:
+    python -m benchmarks.loot_parsing
+"""
+import random
+import time
+
+import arcade
+
+from src.entities.items.item_factory import ItemFactory
+from src.entities.items.loot import clear_cache, compile_loot, load_loot
+
+COUNT = 100_000
+DISTINCT = 200
+EAGER_CHESTS = 500
+
+ITEMS = ("healing_potion", "mana_potion", "key_door1", "key_gate", "key_cellar")
+
+
+def make_strings(count, rng):
+    strings = []
+    for index in range(count):
+        parts = [f"{rng.choice(ITEMS)}:{rng.randint(1, 9)}" for _ in range(rng.randint(1, 3))]
+        if index % 2:
+            parts.append(f"[{rng.choice(ITEMS)} @{rng.randint(1, 5)} | {rng.choice(ITEMS)}:2 @1 | @{index % 7 + 1}]")
+        strings.append(", ".join(parts))
+    return strings
+
+
+def split_parse(loot_str):
+    """Разбор как в прежнем parse_loot_string (без выбора по весам и создания предметов)"""
+    result = []
+    for item_part in loot_str.split(','):
+        item_part = item_part.strip()
+        if ':' in item_part:
+            item_id, count_str = item_part.split(':')
+            try:
+                result.append((item_id.strip(), int(count_str)))
+            except ValueError:
+                pass
+        else:
+            result.append((item_part, 1))
+    return result
+
+
+def timed(function, strings):
+    start = time.perf_counter()
+    for text in strings:
+        function(text)
+    return (time.perf_counter() - start) * 1000
+
+
+def report(name, total_ms, count):
+    print(f"  {name:<38} {total_ms:9.2f} мс  {total_ms / count * 1e6:7.0f} нс/строку")
+
+
+def main():
+    rng = random.Random(42)
+    # Только строки без выбора - прежний формат их понимает
+    plain = [text for text in make_strings(COUNT * 2, rng) if "[" not in text][:COUNT]
+    distinct = make_strings(COUNT, rng)
+    repeated = [rng.choice(distinct[:DISTINCT]) for _ in range(COUNT)]
+
+    print(f"{COUNT} строк добычи:")
+    report("split/int каждой строки", timed(split_parse, plain), COUNT)
+
+    clear_cache()
+    report("compile_loot, разные, без выбора", timed(compile_loot, plain), COUNT)
+    clear_cache()
+    report("compile_loot, разные, половина с [ ]", timed(compile_loot, distinct), COUNT)
+    clear_cache()
+    report(f"compile_loot, {DISTINCT} разных строк", timed(compile_loot, repeated), COUNT)
+    clear_cache()
+    report(f"load_loot (+ проверка id), {DISTINCT} разных", timed(load_loot, repeated), COUNT)
+
+    tables = [compile_loot(text) for text in repeated]
+    roll_rng = random.Random(1)
+    start = time.perf_counter()
+    for table in tables:
+        table.roll(roll_rng)
+    report("roll скомпилированной таблицы", (time.perf_counter() - start) * 1000, COUNT)
+
+    # Прежний путь: предметы (Entity + текстура) создавались для каждого сундука при загрузке
+    arcade.Window(320, 240, visible=False)
+    start = time.perf_counter()
+    for text in plain[:EAGER_CHESTS]:
+        ItemFactory.parse_loot_string(text)
+    eager_ms = (time.perf_counter() - start) * 1000
+    print(f"\nСоздание предметов при загрузке ({EAGER_CHESTS} сундуков):")
+    report("parse_loot_string + ItemFactory.create", eager_ms, EAGER_CHESTS)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Бенчмарк поиска пути: testmap.tmx и синтетическая сетка 1000x1000.
+
+Сравнивает обычный A* с A* + jump point search, меряет попадания в кэш,
+пакетный поиск для многих агентов и разбивку поиска по кадрам.
+
+Запуск из корня проекта:
+    python -m benchmarks.pathfinding
+"""
+import random
+import time
+
+import arcade
+
+from src.systems.pathfinding import NavigationGrid, Pathfinder
+from src.world.map_loader import MapLoader
+
+SYNTHETIC_SIZE = 1000
+
+
+def random_pairs(grid, count, rng, min_distance=0):
+    free = [(x, y) for y in range(grid.height) for x in range(grid.width) if grid.is_walkable(x, y)]
+    pairs = []
+    while len(pairs) < count:
+        start, goal = rng.choice(free), rng.choice(free)
+        if abs(start[0] - goal[0]) + abs(start[1] - goal[1]) >= min_distance:
+            pairs.append((start, goal))
+    return pairs
+
+
+def timed(name, func, count):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"  {name:<36} {elapsed:8.3f} с  ({elapsed / count * 1000:8.3f} мс/путь)")
+    return result
+
+
+def compare(grid, pairs):
+    astar = Pathfinder(grid, jump_points=False)
+    jps = Pathfinder(grid)
+
+    astar_paths = timed("A*", lambda: [astar.find_path(*pair) for pair in pairs], len(pairs))
+    jps_paths = timed("A* + JPS", lambda: [jps.find_path(*pair) for pair in pairs], len(pairs))
+    timed("A* + JPS, повтор (кэш)", lambda: [jps.find_path(*pair) for pair in pairs], len(pairs))
+    found = sum(path is not None for path in jps_paths)
+    assert found == sum(path is not None for path in astar_paths)
+    print(f"  найдено путей: {found} из {len(pairs)}, кэш: {jps.cache_hits} попаданий / {jps.cache_misses} промахов")
+
+
+def synthetic_grid(rng):
+    """Подземелье: комнаты 50x50 с проходами в стенах и прямоугольными колоннами"""
+    size = SYNTHETIC_SIZE
+    blocked = set()
+    for wall in range(0, size, 50):
+        for i in range(size):
+            if i % 50 not in (24, 25):
+                blocked.add((wall, i))
+                blocked.add((i, wall))
+    for _ in range(size * size // 200):
+        x, y = rng.randrange(size - 4), rng.randrange(size - 4)
+        for dx in range(rng.randint(1, 4)):
+            for dy in range(rng.randint(1, 4)):
+                blocked.add((x + dx, y + dy))
+    return NavigationGrid(size, size, blocked=blocked)
+
+
+def main():
+    arcade.Window(320, 240, visible=False)
+    rng = random.Random(42)
+
+    map_loader = MapLoader()
+    map_loader.load("maps/testmap.tmx", scale=1)
+    start = time.perf_counter()
+    grid = map_loader.get_navigation_grid()
+    print(f"testmap.tmx: {grid.width}x{grid.height}, сетка построена за {(time.perf_counter() - start) * 1000:.1f} мс")
+    compare(grid, random_pairs(grid, 1000, rng))
+
+    grid = synthetic_grid(rng)
+    print(f"Синтетическая сетка {grid.width}x{grid.height}")
+    compare(grid, random_pairs(grid, 20, rng, min_distance=SYNTHETIC_SIZE // 2))
+
+    # Много агентов идут к немногим целям - пакетный API ищет уникальные пары один раз
+    pathfinder = Pathfinder(grid)
+    goals = random_pairs(grid, 10, rng)
+    starts = random_pairs(grid, 40, rng)
+    batch = [(starts[i % 40][0], goals[i % 10][1]) for i in range(5000)]
+    timed("find_paths: 5000 агентов, 40 пар", lambda: pathfinder.find_paths(batch), len(batch))
+
+    # Разбивка по кадрам: бюджет 2 мс на кадр
+    pathfinder = Pathfinder(grid)
+    requests = [pathfinder.request(*pair) for pair in random_pairs(grid, 20, rng, min_distance=SYNTHETIC_SIZE // 2)]
+    frames = []
+    while not all(request.done for request in requests):
+        start = time.perf_counter()
+        pathfinder.update(budget_ms=2.0)
+        frames.append((time.perf_counter() - start) * 1000)
+    print(f"  разбивка по кадрам (бюджет 2 мс): {len(frames)} кадров, "
+          f"макс {max(frames):.2f} мс, среднее {sum(frames) / len(frames):.2f} мс")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+Бенчмарк реестра типов событий: время запуска и цена диспетчеризации.
+
+1. Время импорта src.events.event_manager в чистом интерпретаторе
+   (классы событий грузятся лениво, при первом событии своего типа).
+2. 200 сгенерированных модулей событий во временном пакете:
+   импорт всех модулей заранее против регистрации путей в Registry
+   (модуль импортируется только при первом find).
+3. Выбор класса по типу для каждого объекта карты: цепочка if/elif
+   против одного поиска в словаре реестра.
+
+Запуск из корня проекта:
+    python -m benchmarks.startup_imports
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from src.core.registry import Registry
+
+TYPES = 200
+OBJECTS = 100_000
+RUNS = 5
+
+EVENT_MODULE = '''
+class Event{index}:
+    TABLE = {{i: i * {index} for i in range(64)}}
+
+    def __init__(self, event_id, rect, properties):
+        self.id = event_id
+        self.rect = rect
+        self.properties = properties
+'''
+
+
+def measure_subprocess(code, env=None):
+    """Лучшее время из RUNS запусков кода в новом интерпретаторе, мс"""
+    best = float("inf")
+    for _ in range(RUNS):
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True, text=True, check=True, env=env
+        )
+        best = min(best, float(result.stdout.strip()))
+    return best
+
+
+def timed(statement):
+    return (
+        "import time\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "print((time.perf_counter() - start) * 1000)"
+    )
+
+
+def bench_event_manager():
+    env = dict(os.environ, ARCADE_HEADLESS="1")
+    base = measure_subprocess(timed("import arcade"), env)
+    total = measure_subprocess(timed("import arcade\nimport src.events.event_manager"), env)
+    eager = measure_subprocess(timed(
+        "import arcade\nimport src.events.event_manager\n"
+        "import src.events.chest_event, src.events.teleport_event"
+    ), env)
+
+    print("Импорт src.events.event_manager (поверх arcade):")
+    print(f"  лениво (реестр):        {total - base:8.2f} мс")
+    print(f"  + все классы событий:   {eager - base:8.2f} мс")
+
+
+def make_package(root):
+    package = os.path.join(root, "fake_events")
+    os.makedirs(package)
+    open(os.path.join(package, "__init__.py"), "w").close()
+    for index in range(TYPES):
+        with open(os.path.join(package, f"event_{index}.py"), "w") as file:
+            file.write(EVENT_MODULE.format(index=index))
+
+
+def bench_generated_modules():
+    with tempfile.TemporaryDirectory() as root:
+        make_package(root)
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join([root, os.getcwd()]), PYTHONDONTWRITEBYTECODE="1")
+
+        eager = measure_subprocess(timed(
+            f"for i in range({TYPES}):\n"
+            f"    __import__(f'fake_events.event_{{i}}')"
+        ), env)
+        lazy = measure_subprocess(timed(
+            "from src.core.registry import Registry\n"
+            "registry = Registry('fake')\n"
+            f"for i in range({TYPES}):\n"
+            f"    registry.register(f'type_{{i}}', f'fake_events.event_{{i}}:Event{{i}}')"
+        ), env)
+        used = measure_subprocess(timed(
+            "from src.core.registry import Registry\n"
+            "registry = Registry('fake')\n"
+            f"for i in range({TYPES}):\n"
+            f"    registry.register(f'type_{{i}}', f'fake_events.event_{{i}}:Event{{i}}')\n"
+            "for i in range(5):\n"
+            "    registry.find(f'type_{i}')"
+        ), env)
+
+    print(f"\n{TYPES} модулей событий:")
+    print(f"  импорт всех заранее:          {eager:8.2f} мс")
+    print(f"  реестр, только регистрация:   {lazy:8.2f} мс")
+    print(f"  реестр + 5 используемых типов:{used:8.2f} мс")
+
+
+def if_chain_source(count):
+    """Функция выбора класса цепочкой if/elif, как при жестко прописанных типах"""
+    lines = ["def choose(event_type):"]
+    for index in range(count):
+        keyword = "if" if index == 0 else "elif"
+        lines.append(f"    {keyword} event_type == 'type_{index}':")
+        lines.append(f"        return classes[{index}]")
+    lines.append("    return None")
+    return "\n".join(lines)
+
+
+def bench_dispatch():
+    classes = [type(f"Event{index}", (), {}) for index in range(TYPES)]
+    namespace = {"classes": classes}
+    exec(if_chain_source(TYPES), namespace)
+    choose = namespace["choose"]
+
+    registry = Registry("dispatch")
+    for index, event_class in enumerate(classes):
+        registry.register(f"type_{index}", event_class)
+
+    # Типы на карте: в основном первые, но встречаются и последние
+    types = [f"type_{(index * 7919) % TYPES}" for index in range(OBJECTS)]
+
+    start = time.perf_counter()
+    for event_type in types:
+        choose(event_type)
+    chain_ms = (time.perf_counter() - start) * 1000
+
+    find = registry.find
+    start = time.perf_counter()
+    for event_type in types:
+        find(event_type)
+    registry_ms = (time.perf_counter() - start) * 1000
+
+    print(f"\nВыбор класса для {OBJECTS} объектов, {TYPES} типов:")
+    print(f"  if/elif:   {chain_ms:8.2f} мс ({chain_ms / OBJECTS * 1e6:6.0f} нс/объект)")
+    print(f"  реестр:    {registry_ms:8.2f} мс ({registry_ms / OBJECTS * 1e6:6.0f} нс/объект)")
+
+
+def main():
+    bench_event_manager()
+    bench_generated_modules()
+    bench_dispatch()
+
+
+if __name__ == "__main__":
+    main()
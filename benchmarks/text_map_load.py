@@ -0,0 +1,89 @@
+"""
+Бенчмарк импорта текстовых карт на сгенерированной карте 2000x2000.
+
+Сравнивает построчный разбор в списки списков (как читались старые карты)
+с TextMapLoader.parse (плоский array + битмап коллизий), плюс
+1 000 000 проверок коллизий по пикселю.
+
+Запуск из корня проекта:
+    python -m benchmarks.text_map_load
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from src.world.text_map_loader import TextMapLoader
+
+SIZE = 2000
+QUERIES = 1_000_000
+
+
+def generate_map(path, tile_ids):
+    rng = random.Random(42)
+    with open(path, "w", encoding="utf-8") as f:
+        for _ in range(SIZE):
+            f.write(" ".join(f"{rng.choice(tile_ids):03d}" for _ in range(SIZE)))
+            f.write("\n")
+
+
+def legacy_parse(path, tile_data):
+    """Старый подход: список строк со списками id и отдельная матрица is_blocked"""
+    tiles = []
+    blocked = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            row = [int(value) for value in line.split()]
+            tiles.append(row)
+            blocked.append([tile_data[tile_id][1] for tile_id in row])
+    return tiles, blocked
+
+
+def run(name, func, count=1):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"{name:<40} {elapsed:7.3f} с  ({elapsed / count * 1e9:6.0f} нс/шт.)")
+    return result
+
+
+def main():
+    loader = TextMapLoader()
+    tile_data = loader.load_tile_data()
+    tile_ids = sorted(tile_data)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "big.txt")
+        generate_map(path, tile_ids)
+        print(f"Карта {SIZE}x{SIZE}: {os.path.getsize(path) / 1024 / 1024:.1f} МБ")
+
+        cells = SIZE * SIZE
+        legacy_tiles, legacy_blocked = run("построчно в списки", lambda: legacy_parse(path, tile_data), cells)
+        grid = run("TextMapLoader.parse", lambda: loader.parse(path), cells)
+
+    assert grid.width == grid.height == SIZE
+    assert all(grid.is_blocked(c, r) == legacy_blocked[r][c] for r, c in ((0, 0), (123, 456), (1999, 1999)))
+
+    legacy_size = sys.getsizeof(legacy_tiles) + sum(sys.getsizeof(row) for row in legacy_tiles)
+    legacy_size += sys.getsizeof(legacy_blocked) + sum(sys.getsizeof(row) for row in legacy_blocked)
+    grid_size = sys.getsizeof(grid.tiles) + sys.getsizeof(grid.blocked)
+    print(f"Память: списки {legacy_size / 1024 / 1024:.1f} МБ, TileGrid {grid_size / 1024 / 1024:.1f} МБ")
+
+    rng = random.Random(7)
+    world = SIZE * grid.tile_size
+    points = [(rng.uniform(0, world), rng.uniform(0, world)) for _ in range(1000)]
+
+    def queries():
+        is_solid = grid.is_solid_at_pixel
+        for i in range(QUERIES):
+            x, y = points[i % 1000]
+            is_solid(x, y)
+
+    run("TileGrid.is_solid_at_pixel", queries, QUERIES)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Бенчмарк раскладки UI: 100 - 10 000 элементов.
+
+Сравнивает прежний пересчет (у каждого элемента getattr original_x/y/
+width/height и умножение на масштаб при каждом ресайзе и после каждого
+переключения состояния) с LayoutEngine: первый расчет под новый размер
+окна, повторное применение под тот же размер (переключение состояния,
+возврат из overlay) и смена между двумя уже встречавшимися размерами
+(окно <-> полный экран).
+
+Запуск из корня проекта:
+    python -m benchmarks.ui_layout
+"""
+import time
+
+from config import constants as C
+from src.ui.layout import ANCHORS, LayoutEngine, screen_layout
+from src.ui.ui_component import UIComponent
+
+COUNTS = (100, 1_000, 10_000)
+REPEATS = 50
+SIZES = ((1440, 900), (1920, 1080))
+
+# Прежний GameStateManager обновлял камеры через schedule_once(..., 0.1)
+LEGACY_DELAY = 0.1
+FPS = 60
+
+
+def legacy_update(elements, screen):
+    """Как прежний MainWindow._update_game_ui_element для каждого элемента"""
+    scale = screen.viewport_width / C.VIEWPORT_WIDTH
+    for element in elements:
+        orig_x = getattr(element, 'original_x', element.x)
+        orig_y = getattr(element, 'original_y', element.y)
+        orig_width = getattr(element, 'original_width', element.width)
+        orig_height = getattr(element, 'original_height', element.height)
+        element.x = screen.viewport_x + orig_x * scale
+        element.y = screen.viewport_y + orig_y * scale
+        element.width = orig_width * scale
+        element.height = orig_height * scale
+
+
+def make_elements(count):
+    elements = []
+    anchors = list(ANCHORS)
+    layout = LayoutEngine()
+    for index in range(count):
+        element = UIComponent(index % 1000, index % 700, 40, 20)
+        element.original_x, element.original_y = element.x, element.y
+        element.original_width, element.original_height = element.width, element.height
+        elements.append(element)
+        layout.add(element, anchors[index % len(anchors)], x=index % 100, y=-(index % 80))
+    return elements, layout
+
+
+def per_call_us(function):
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        function()
+    return (time.perf_counter() - start) / REPEATS * 1e6
+
+
+def main():
+    screens = [screen_layout(width, height) for width, height in SIZES]
+    print(f"{'элементов':>9} | {'прежний пересчет, мкс':>21} | {'первый расчет, мкс':>18} | "
+          f"{'тот же размер, мкс':>18} | {'окно <-> экран, мкс':>19}")
+    for count in COUNTS:
+        elements, layout = make_elements(count)
+
+        legacy_us = per_call_us(lambda: legacy_update(elements, screens[0]))
+
+        def cold():
+            layout.invalidate()
+            layout.apply(screens[0])
+        cold_us = per_call_us(cold)
+
+        layout.apply(screens[0])
+        same_us = per_call_us(lambda: layout.apply(screens[0]))
+
+        toggle = iter(screens * REPEATS)
+        layout.compute(screens[1])
+        toggle_us = per_call_us(lambda: layout.apply(next(toggle)))
+
+        print(f"{count:>9} | {legacy_us:21.1f} | {cold_us:18.1f} | {same_us:18.2f} | {toggle_us:19.1f}")
+
+    print(f"\nКадров со старой раскладкой после переключения состояния: "
+          f"было {LEGACY_DELAY * FPS:.0f} (schedule_once {LEGACY_DELAY} с при {FPS} FPS), теперь 0")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,5 @@
 import logging
 import sys
-import arcade
-
-from frame.main_window import MainWindow
 
 
 def setup_logging():
@@ -71,14 +68,26 @@ def setup_logging():
     return file_handler
 
 
-def main():
+def main(profiler=None):
     logger = logging.getLogger(__name__)
     logger.info("Начало игровой сессии...")
     logger.debug("Параметры запуска: %s", sys.argv)
+
+    # Тяжёлые модули (arcade, pyglet, окно) импортируем здесь,
+    # чтобы профилировщик запуска видел их в дереве импортов
+    if profiler:
+        profiler.install_import_hook()
+        profiler.mark("импорты")
+
+    import arcade
+    from frame.main_window import MainWindow
+
     logger.info(f"версия аркейда {arcade.__version__}")
 
     try:
-        MainWindow()
+        if profiler:
+            profiler.mark("создание окна")
+        MainWindow(profiler=profiler)
         arcade.run()
     except Exception as e:
         logger.critical("Критическая ошибка: %s", e, exc_info=True)
@@ -89,4 +98,10 @@ def main():
 
 if __name__ == "__main__":
     setup_logging()
-    main()
\ No newline at end of file
+
+    startup_profiler = None
+    if "--profile-startup" in sys.argv:
+        from src.core.startup_profiler import StartupProfiler
+        startup_profiler = StartupProfiler()
+
+    main(startup_profiler)
\ No newline at end of file
@@ -1,17 +1,27 @@
+import importlib
 import logging
 import arcade
 from config import  constants as C
+from src.core.frame_pacer import FramePacer
+from src.core.game_data import game_data
 from src.core.game_state_manager import GameStateManager
 from src.core.input_manager import InputManager
 from src.core.resource_manager import resource_manager
 from src.core.asset_loader import AssetLoader
 from src.states.base_state import BaseState
-from src.states.cheat_console_state import CheatConsoleState
 from src.states.lobby_state import LobbyState
-from src.states.game_state import GameplayState
-from src.states.lock_picking_state import LockPickingState
-from src.states.pause_menu_state import PauseMenuState
-from src.states.settings_state import SettingsState
+from src.ui.layout import screen_layout
+
+
+# Состояния, которые не нужны для лобби.
+# Модуль импортируется, а состояние создаётся при первом обращении
+LAZY_STATES = {
+    "game": ("src.states.game_state", "GameplayState"),
+    "pause_menu": ("src.states.pause_menu_state", "PauseMenuState"),
+    "settings": ("src.states.settings_state", "SettingsState"),
+    "cheat_console": ("src.states.cheat_console_state", "CheatConsoleState"),
+    "lock_picking": ("src.states.lock_picking_state", "LockPickingState"),
+}
 
 
 class MainWindow(arcade.Window):
@@ -20,7 +30,13 @@ class MainWindow(arcade.Window):
     (Вся логика делегируется GameStateManager)
     """
 
-    def __init__(self):
+    def __init__(self, profiler=None, key_bindings_file: str = "settings/key_bindings.json"):
+        """
+        Args:
+            profiler: Профилировщик запуска (--profile-startup)
+            key_bindings_file: Файл привязок клавиш (бенчмарки передают временный)
+        """
+        self.profiler = profiler  # Профилировщик запуска (--profile-startup)
 
         # КОНСТАНТЫ
         self.screen_title = C.SCREEN_TITLE
@@ -48,59 +64,64 @@ class MainWindow(arcade.Window):
         # СОЗДАЕМ МЕНЕДЖЕРЫ
         self.resource_manager = resource_manager
         self.asset_loader = AssetLoader()
-        self.input_manager = InputManager()
+        self.input_manager = InputManager(config_file=key_bindings_file)
 
         # СОЗДАЕМ ЦЕНТРАЛЬНЫЙ МЕНЕДЖЕР СОСТОЯНИЙ
         self.gsm = GameStateManager(self)
         self.gsm.input_manager = self.input_manager
+        self.input_manager.subscribe(self.gsm.on_input)
         self.gsm.asset_loader = self.asset_loader
 
+        # Снижение частоты кадров в простое
+        self.frame_pacer = FramePacer(self, self.input_manager)
+        self.frame_pacer.enabled = game_data.settings.get("idle_throttle", True)
+
         # РЕГИСТРИРУЕМ ВСЕ СОСТОЯНИЯ
+        if self.profiler:
+            self.profiler.mark("регистрация состояний")
         self._register_states()
 
         # НАЧИНАЕМ С ЛОББИ
         self.gsm.switch_to("lobby")
 
-        self._is_initial_fullscreen_check = True
+        if self.profiler:
+            self.profiler.mark("первая отрисовка")
 
         self.logger.info("MainWindow инициализирован")
 
     def _register_states(self):
         """Регистрирует все состояния игры"""
+        # Лобби нужно сразу
         lobby_state = LobbyState(self.gsm, self.asset_loader)
-        game_state = GameplayState(self.gsm, self.asset_loader)
-        pause_state = PauseMenuState(self.gsm, self.asset_loader)
-        settings_state = SettingsState(self.gsm, self.asset_loader)
-        cheat_state = CheatConsoleState(self.gsm, self.asset_loader)
-        lock_state = LockPickingState(self.gsm, self.asset_loader)
-
-        # Регистрация состояний
         self.gsm.register_state("lobby", lobby_state)
-        self.gsm.register_state("game", game_state)
-        self.gsm.register_state("pause_menu", pause_state)
-        self.gsm.register_state("settings", settings_state)
-        self.gsm.register_state("cheat_console", cheat_state)
-        self.gsm.register_state("lock_picking", lock_state)
 
+        # Остальные - лениво
+        for state_id, (module_path, class_name) in LAZY_STATES.items():
+            self.gsm.register_state_factory(state_id, self._make_state_factory(module_path, class_name))
 
-        self.logger.info(f"Зарегистрировано состояний: {len(self.gsm.states)}")
+        self.logger.info(f"Зарегистрировано состояний: {len(self.gsm.states) + len(self.gsm.state_factories)}")
+
+    def _make_state_factory(self, module_path: str, class_name: str):
+        """Возвращает фабрику, которая импортирует модуль состояния и создаёт его"""
+        def factory():
+            module = importlib.import_module(module_path)  # Ленивый импорт
+            state_class = getattr(module, class_name)
+            return state_class(self.gsm, self.asset_loader)
+
+        return factory
 
     def on_draw(self):
         """Отрисовка - делегируем GameStateManager"""
         self.clear()
-
-        # Первый кадр после инициализации - принудительно обновляем камеры
-        if self._is_initial_fullscreen_check:
-            self._is_initial_fullscreen_check = False
-            width, height = self.get_size()
-            self.logger.info(f"Первичная инициализация камер: {width}x{height}")
-            self._force_initial_camera_update(width, height)
-
         self.gsm.draw()
 
+        if self.profiler and not self.profiler.finished:
+            self.profiler.finish()
+
     def on_update(self, delta_time: float):
         """Обновление - делегируем GameStateManager"""
         self.gsm.update(delta_time)
+        self.frame_pacer.update(self.gsm.get_active_state())
 
     def on_key_press(self, key: int, modifiers: int):
         """Нажатие клавиши"""
@@ -109,91 +130,21 @@ class MainWindow(arcade.Window):
             self.toggle_fullscreen()
             return
 
-        # 2. Остальные клавиши - в InputManager и GSM
+        # 2. Остальные клавиши - в InputManager (он разошлет событие GSM)
+        self.frame_pacer.wake()
         self.input_manager.on_key_press(key, modifiers)
-        self.gsm.handle_key_press(key, modifiers)
 
     def on_key_release(self, key: int, modifiers: int):
         """Отпускание клавиши"""
         if key == arcade.key.F11:
             return
 
+        self.frame_pacer.wake()
         self.input_manager.on_key_release(key, modifiers)
-        self.gsm.handle_key_release(key, modifiers)
-
-    def _update_state_cameras(self, state: BaseState, x: int, y: int, width: int, height: int, scale: float):
-        """Обновляет камеры с фиксированным обзором"""
-        if not state:
-            return
-
-        # 1. Основная игровая камера
-        if hasattr(state, 'camera') and state.camera:
-            # Устанавливаем фиксированный viewport в центре экрана
-            state.camera.viewport = arcade.rect.XYWH(
-                x + width // 2,  # Центрируем по X
-                y + height // 2,  # Центрируем по Y
-                width,
-                height
-            )
-
-            # Для фиксированного обзора НЕ меняем projection
-            # Projection должен оставаться таким же как при 1280x768
-            # Только обновляем viewport
-
-        # 2. UI камера (default_camera) - должна использовать полный экран
-        if hasattr(state, 'default_camera') and state.default_camera:
-            # UI камера должна использовать полный экран для корректного отображения UI
-            state.default_camera.viewport = arcade.rect.XYWH(
-                self.screen_width // 2,
-                self.screen_height // 2,
-                self.screen_width,
-                self.screen_height
-            )
-
-        # 3. Обновляем UI элементы с учетом масштаба
-        if hasattr(state, 'ui_elements'):
-            for ui_element in state.ui_elements:
-                self._update_ui_element(ui_element, x, y, width, height, scale)
-
-    def _update_ui_element(self, ui_element, x: int, y: int, width: int, height: int, scale: float):
-        """Обновляет позицию и размер UI элемента с учетом масштаба"""
-        try:
-            # Если UI элемент имеет метод on_resize с нужными параметрами
-            if hasattr(ui_element, 'on_resize'):
-                ui_element.on_resize(x, y, width, height, scale)
-            else:
-                # Базовая логика масштабирования для UI элементов
-                if hasattr(ui_element, 'x') and hasattr(ui_element, 'y'):
-                    # Пересчитываем позицию из фиксированных координат
-                    original_x = ui_element.x
-                    original_y = ui_element.y
-
-                    # Преобразуем из фиксированных координат (1280x768) в текущие
-                    ui_element.x = x + (original_x * scale)
-                    ui_element.y = y + (original_y * scale)
-
-                    # Масштабируем размеры
-                    if hasattr(ui_element, 'width'):
-                        ui_element.width = ui_element.width * scale
-                    if hasattr(ui_element, 'height'):
-                        ui_element.height = ui_element.height * scale
-        except Exception as e:
-            self.logger.warning(f"Ошибка обновления UI элемента: {e}")
 
     def toggle_fullscreen(self):
-        """Переключает полноэкранный режим"""
-        new_fullscreen = not self.fullscreen
-        self.set_fullscreen(new_fullscreen)
-
-        # Небольшая задержка для обновления размеров
-        import pyglet
-        pyglet.clock.schedule_once(lambda dt: self._delayed_resize(), 0.2)
-
-    def _delayed_resize(self):
-        """Обновляет камеры после небольшой задержки"""
-        width, height = self.get_size()
-        self.logger.info(f"Обновление после переключения режима: {width}x{height}")
-        self.on_resize(width, height)
+        """Переключает полноэкранный режим (камеры и UI обновит on_resize)"""
+        self.set_fullscreen(not self.fullscreen)
 
     def on_resize(self, width: int, height: int):
         """Вызывается при изменении размера окна"""
@@ -204,199 +155,34 @@ class MainWindow(arcade.Window):
         self.screen_width = width
         self.screen_height = height
 
-        # Обновляем все камеры с фиксированным обзором
-        self._update_all_cameras(width, height)
+        # После ресайза картинка меняется - рисуем на полной частоте
+        self.frame_pacer.wake()
 
-    def on_close(self):
-        """Закрытие окна"""
-        super().on_close()
-
-    def _force_initial_camera_update(self, width: int, height: int):
-        """Принудительное обновление камер при первой отрисовке"""
-        # Обновляем все состояния
-        all_states = []
-
-        # Основное состояние
-        if self.gsm.current_state:
-            all_states.append(self.gsm.current_state)
-
-        # Активное состояние (может быть overlay)
-        active_state = self.gsm.get_active_state()
-        if active_state and active_state not in all_states:
-            all_states.append(active_state)
+        # Раскладка считается раз на размер окна, состояния получают готовую
+        self.apply_layout()
 
-        # Все overlay
-        for overlay in self.gsm.overlay_stack:
-            if overlay not in all_states:
-                all_states.append(overlay)
-
-        # Обновляем каждое состояние
-        for state in all_states:
-            self._init_state_cameras(state, width, height)
+    def apply_layout(self, state: BaseState = None):
+        """
+        Подгоняет камеры и UI состояний под текущий размер окна.
 
-    def _init_state_cameras(self, state, width: int, height: int):
-        """Инициализирует камеры состояния с правильными размерами"""
-        if not state:
+        Args:
+            state: Одно состояние (только что вошли в него); None - основное и все overlay'и
+        """
+        screen = screen_layout(self.screen_width, self.screen_height)
+        if state is not None:
+            state.apply_layout(screen)
             return
 
-        # Для игрового состояния используем фиксированный обзор
-        if hasattr(state, '__class__') and 'GameplayState' in str(state.__class__):
-            scale_x = width / C.VIEWPORT_WIDTH
-            scale_y = height / C.VIEWPORT_HEIGHT
-            scale = min(scale_x, scale_y)
-
-            viewport_width = int(C.VIEWPORT_WIDTH * scale)
-            viewport_height = int(C.VIEWPORT_HEIGHT * scale)
-            viewport_x = (width - viewport_width) // 2
-            viewport_y = (height - viewport_height) // 2
-
-            # Инициализируем игровую камеру
-            if hasattr(state, 'camera') and state.camera:
-                state.camera.viewport = arcade.rect.XYWH(
-                    viewport_x + viewport_width // 2,
-                    viewport_y + viewport_height // 2,
-                    viewport_width,
-                    viewport_height
-                )
-
-            # Инициализируем UI камеру (полный экран для UI)
-            if hasattr(state, 'default_camera') and state.default_camera:
-                state.default_camera.viewport = arcade.rect.XYWH(
-                    width // 2,
-                    height // 2,
-                    width,
-                    height
-                )
-
-        # Для других состояний (лобби, меню) используем полный экран
-        else:
-            if hasattr(state, 'camera') and state.camera:
-                state.camera.viewport = arcade.rect.XYWH(
-                    width // 2,
-                    height // 2,
-                    width,
-                    height
-                )
-
-            if hasattr(state, 'default_camera') and state.default_camera:
-                state.default_camera.viewport = arcade.rect.XYWH(
-                    width // 2,
-                    height // 2,
-                    width,
-                    height
-                )
-
-    def _update_all_cameras(self, width: int, height: int):
-        """Обновляет ВСЕ камеры в проекте с фиксированным обзором"""
-        # Рассчитываем масштаб для сохранения фиксированного обзора
-        scale_x = width / C.VIEWPORT_WIDTH
-        scale_y = height / C.VIEWPORT_HEIGHT
-        scale = min(scale_x, scale_y)
-
-        # Рассчитываем viewport с черными полосами
-        viewport_width = int(C.VIEWPORT_WIDTH * scale)
-        viewport_height = int(C.VIEWPORT_HEIGHT * scale)
-        viewport_x = (width - viewport_width) // 2
-        viewport_y = (height - viewport_height) // 2
-
-        # Определяем какое состояние активно
-        active_state = self.gsm.get_active_state()
-
-        # Обновляем все состояния
-        all_states = []
-
-        # Основное состояние
+        states = []
         if self.gsm.current_state:
-            all_states.append(self.gsm.current_state)
+            states.append(self.gsm.current_state)
+        for overlay in self.gsm.overlay_stack:
+            if overlay not in states:
+                states.append(overlay)
 
-        # Активное состояние
-        if active_state and active_state not in all_states:
-            all_states.append(active_state)
+        for state in states:
+            state.apply_layout(screen)
 
-        # Все overlay
-        for overlay in self.gsm.overlay_stack:
-            if overlay not in all_states:
-                all_states.append(overlay)
-
-        # Обновляем каждое состояние
-        for state in all_states:
-            if hasattr(state, '__class__') and 'GameplayState' in str(state.__class__):
-                # Для игрового состояния используем фиксированный обзор
-                self._update_game_state_cameras(state, viewport_x, viewport_y, viewport_width, viewport_height, width,
-                                                height)
-            else:
-                # Для других состояний (лобби, меню) - полный экран
-                self._update_other_state_cameras(state, width, height)
-
-    def _update_game_state_cameras(self, state: BaseState, viewport_x: int, viewport_y: int,
-                                   viewport_width: int, viewport_height: int,
-                                   screen_width: int, screen_height: int):
-        """Обновляет камеры игрового состояния"""
-        # Игровая камера - фиксированный обзор
-        if hasattr(state, 'camera') and state.camera:
-            state.camera.viewport = arcade.rect.XYWH(
-                viewport_x + viewport_width // 2,
-                viewport_y + viewport_height // 2,
-                viewport_width,
-                viewport_height
-            )
-
-        # UI камера - полный экран для корректного позиционирования UI
-        if hasattr(state, 'default_camera') and state.default_camera:
-            state.default_camera.viewport = arcade.rect.XYWH(
-                screen_width // 2,
-                screen_height // 2,
-                screen_width,
-                screen_height
-            )
-
-        # Обновляем UI элементы с правильным масштабированием
-        if hasattr(state, 'ui_elements'):
-            for ui_element in state.ui_elements:
-                self._update_game_ui_element(ui_element, viewport_x, viewport_y,
-                                             viewport_width, viewport_height,
-                                             screen_width, screen_height)
-
-    def _update_game_ui_element(self, ui_element, viewport_x: int, viewport_y: int,
-                                viewport_width: int, viewport_height: int,
-                                screen_width: int, screen_height: int):
-        """Обновляет UI элементы игрового состояния"""
-        try:
-            # Рассчитываем масштаб
-            scale = viewport_width / C.VIEWPORT_WIDTH
-
-            # Восстанавливаем оригинальные координаты (относительно 1280x768)
-            orig_x = getattr(ui_element, 'original_x', ui_element.x)
-            orig_y = getattr(ui_element, 'original_y', ui_element.y)
-            orig_width = getattr(ui_element, 'original_width', ui_element.width)
-            orig_height = getattr(ui_element, 'original_height', ui_element.height)
-
-            # Пересчитываем позицию относительно viewport
-            ui_element.x = viewport_x + (orig_x * scale)
-            ui_element.y = viewport_y + (orig_y * scale)
-
-            # Масштабируем размеры
-            ui_element.width = orig_width * scale
-            ui_element.height = orig_height * scale
-
-        except Exception as e:
-            self.logger.warning(f"Ошибка обновления UI элемента: {e}")
-
-    def _update_other_state_cameras(self, state: BaseState, width: int, height: int):
-        """Обновляет камеры неигровых состояний (лобби, меню)"""
-        # Для лобби и меню используем полный экран
-        if hasattr(state, 'camera') and state.camera:
-            state.camera.viewport = arcade.rect.XYWH(
-                width // 2,
-                height // 2,
-                width,
-                height
-            )
-
-        if hasattr(state, 'default_camera') and state.default_camera:
-            state.default_camera.viewport = arcade.rect.XYWH(
-                width // 2,
-                height // 2,
-                width,
-                height
-            )
\ No newline at end of file
+    def on_close(self):
+        """Закрытие окна"""
+        super().on_close()
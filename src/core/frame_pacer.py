@@ -0,0 +1,75 @@
+import logging
+import time
+
+
+class FramePacer:
+    """
+    Регулятор частоты кадров.
+    Если ничего не происходит (нет ввода, нет анимаций в активном состоянии) -
+    снижает update_rate/draw_rate окна. Любой ввод мгновенно возвращает полную частоту.
+    """
+
+    def __init__(self, window, input_manager, active_fps: int = 60, idle_fps: int = 10,
+                 idle_delay: float = 1.0):
+        """
+        Args:
+            window: Окно arcade
+            input_manager: InputManager (время последнего ввода и зажатые клавиши)
+            active_fps: Частота при активности
+            idle_fps: Частота в простое
+            idle_delay: Сколько секунд без ввода считается простоем
+        """
+        self.logger = logging.getLogger(f"{self.__class__.__module__}.{self.__class__.__name__}")
+        self.window = window
+        self.input_manager = input_manager
+
+        self.active_fps = active_fps
+        self.idle_fps = idle_fps
+        self.idle_delay = idle_delay
+
+        self.enabled = True
+        self.is_idle = False
+
+    def set_enabled(self, enabled: bool):
+        """Включает/выключает снижение частоты (из настроек)"""
+        self.enabled = enabled
+        if not enabled:
+            self.wake()
+        self.logger.info(f"Снижение частоты в простое: {'ВКЛ' if enabled else 'ВЫКЛ'}")
+
+    def update(self, active_state):
+        """Проверяет простой (вызывается каждый on_update)"""
+        if not self.enabled:
+            return
+
+        idle = self._is_idle(active_state)
+        if idle and not self.is_idle:
+            self._set_rate(self.idle_fps)
+            self.is_idle = True
+        elif not idle and self.is_idle:
+            self.wake()
+
+    def wake(self):
+        """Мгновенно возвращает полную частоту (вызывается на любой ввод)"""
+        if not self.is_idle:
+            return
+        self._set_rate(self.active_fps)
+        self.is_idle = False
+
+    def _is_idle(self, active_state) -> bool:
+        """Простой = давно не было ввода, ничего не зажато, состояние не анимируется"""
+        if active_state is None:
+            return False
+
+        if self.input_manager.keys_pressed:
+            return False
+
+        if time.perf_counter() - self.input_manager.last_input_time < self.idle_delay:
+            return False
+
+        return not active_state.is_animating()
+
+    def _set_rate(self, fps: int):
+        self.window.set_update_rate(1 / fps)
+        self.window.set_draw_rate(1 / fps)
+        self.logger.debug(f"Частота кадров: {fps}")
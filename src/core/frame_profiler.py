@@ -0,0 +1,275 @@
+import csv
+import gc
+import logging
+import os
+import time
+from collections import deque
+from contextlib import nullcontext
+
+import arcade
+
+
+class _Section:
+    """Замер одного участка кадра (используется через with)"""
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler.add_time(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class FrameProfiler:
+    """
+    Профилировщик кадра.
+    Собирает время update/draw и отдельных подсистем, считает draw call'ы,
+    спрайты и паузы сборщика мусора. Хранит историю в кольцевом буфере.
+    """
+
+    # Колонки истории (порядок важен для CSV)
+    COLUMNS = ("frame", "frame_ms", "update_ms", "draw_ms",
+               "player_ms", "events_ms", "map_draw_ms", "ui_ms",
+               "gc_ms", "draw_calls", "sprites",
+               "broadphase_ms", "entity_candidates", "entity_collisions")
+
+    # Подсистемы, которые показываем в оверлее
+    SECTIONS = (("player", "Player.update"),
+                ("events", "EventManager.check_collisions"),
+                ("map_draw", "MapLoader.draw"),
+                ("ui", "UI и текст"))
+
+    def __init__(self, history_size: int = 600, rolling_window: int = 60):
+        self.logger = logging.getLogger(f"{self.__class__.__module__}.{self.__class__.__name__}")
+        self.enabled = False
+
+        # Кольцевой буфер с историей кадров
+        self.history = deque(maxlen=history_size)
+        self.rolling_window = rolling_window  # Сколько кадров усредняем в оверлее
+
+        # Данные текущего кадра
+        self._times = {}
+        self._counts = {}
+        self._frame_index = 0
+        self._last_frame_end = None
+
+        # Паузы GC
+        self._gc_start = 0.0
+        self._gc_time = 0.0
+
+        # Счётчик draw call'ов
+        self._draw_calls = 0
+        self._patched_geometry = {}
+
+        # Оверлей (текст обновляем не каждый кадр)
+        self._null_section = nullcontext()
+        self._text_lines = []
+        self._text_refresh = 0.25
+        self._last_text_update = 0.0
+
+        # Загрузка CPU процесса (для сравнения с FramePacer и без него)
+        self._cpu_sample = (time.perf_counter(), time.process_time())
+        self.cpu_percent = 0.0
+
+    # ВКЛЮЧЕНИЕ
+    def toggle(self):
+        """Включает/выключает профилировщик"""
+        if self.enabled:
+            self.disable()
+        else:
+            self.enable()
+
+    def enable(self):
+        if self.enabled:
+            return
+        self.enabled = True
+        self._last_frame_end = None
+        gc.callbacks.append(self._on_gc)
+        self._patch_draw_calls()
+        self.logger.info("Профилировщик кадра включен")
+
+    def disable(self):
+        if not self.enabled:
+            return
+        self.enabled = False
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+        self._unpatch_draw_calls()
+        self.logger.info("Профилировщик кадра выключен")
+
+    # ЗАМЕРЫ
+    def section(self, name: str):
+        """Контекстный менеджер для замера участка. Когда выключено - ничего не делает"""
+        if not self.enabled:
+            return self._null_section
+        return _Section(self, name)
+
+    def add_time(self, name: str, seconds: float):
+        """Добавляет время к участку текущего кадра"""
+        self._times[name] = self._times.get(name, 0.0) + seconds
+
+    def set_count(self, name: str, value: int):
+        """Устанавливает счётчик текущего кадра (например, количество спрайтов)"""
+        self._counts[name] = value
+
+    def end_frame(self):
+        """Закрывает кадр и кладёт его в историю (вызывается после отрисовки)"""
+        if not self.enabled:
+            return
+
+        now = time.perf_counter()
+        frame_time = now - self._last_frame_end if self._last_frame_end is not None else 0.0
+        self._last_frame_end = now
+
+        times = self._times
+        self.history.append((
+            self._frame_index,
+            frame_time * 1000,
+            times.get("update", 0.0) * 1000,
+            times.get("draw", 0.0) * 1000,
+            times.get("player", 0.0) * 1000,
+            times.get("events", 0.0) * 1000,
+            times.get("map_draw", 0.0) * 1000,
+            times.get("ui", 0.0) * 1000,
+            self._gc_time * 1000,
+            self._draw_calls,
+            self._counts.get("sprites", 0),
+            times.get("broadphase", 0.0) * 1000,
+            self._counts.get("entity_candidates", 0),
+            self._counts.get("entity_collisions", 0),
+        ))
+
+        self._frame_index += 1
+        self._times = {}
+        self._counts = {}
+        self._gc_time = 0.0
+        self._draw_calls = 0
+
+    def _on_gc(self, phase, info):
+        """Колбэк сборщика мусора - меряет длительность паузы"""
+        if phase == "start":
+            self._gc_start = time.perf_counter()
+        elif phase == "stop":
+            self._gc_time += time.perf_counter() - self._gc_start
+
+    def _patch_draw_calls(self):
+        """Оборачивает Geometry.render, чтобы считать draw call'ы"""
+        from arcade.gl import Geometry
+
+        for geometry_class in Geometry.__subclasses__():
+            original = geometry_class.render
+            if geometry_class in self._patched_geometry:
+                continue
+
+            def counted_render(geometry, *args, _original=original, **kwargs):
+                self._draw_calls += 1
+                return _original(geometry, *args, **kwargs)
+
+            self._patched_geometry[geometry_class] = original
+            geometry_class.render = counted_render
+
+    def _unpatch_draw_calls(self):
+        for geometry_class, original in self._patched_geometry.items():
+            geometry_class.render = original
+        self._patched_geometry.clear()
+
+    # ИСТОРИЯ
+    def get_rolling_stats(self) -> dict:
+        """Средние значения за последние rolling_window кадров"""
+        frames = list(self.history)[-self.rolling_window:]
+        if not frames:
+            return {}
+
+        stats = {}
+        for index, column in enumerate(self.COLUMNS[1:], start=1):
+            stats[column] = sum(frame[index] for frame in frames) / len(frames)
+        stats["frame_max_ms"] = max(frame[1] for frame in frames)
+        stats["gc_max_ms"] = max(frame[8] for frame in frames)
+        return stats
+
+    def dump_csv(self, path: str = "logs/frame_profile.csv") -> str:
+        """Сохраняет историю кадров в CSV для анализа"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(self.COLUMNS)
+            writer.writerows(self.history)
+
+        self.logger.info(f"История кадров ({len(self.history)}) сохранена в {path}")
+        return path
+
+    # ОВЕРЛЕЙ
+    def sample_cpu(self) -> float:
+        """Загрузка CPU процессом с прошлого замера, в процентах одного ядра"""
+        wall, cpu = time.perf_counter(), time.process_time()
+        last_wall, last_cpu = self._cpu_sample
+        if wall - last_wall > 0:
+            self.cpu_percent = (cpu - last_cpu) / (wall - last_wall) * 100
+        self._cpu_sample = (wall, cpu)
+        return self.cpu_percent
+
+    def _build_lines(self) -> list:
+        stats = self.get_rolling_stats()
+        if not stats:
+            return ["Профилировщик: сбор данных..."]
+
+        frame_ms = stats["frame_ms"]
+        fps = 1000 / frame_ms if frame_ms > 0 else 0
+        lines = [
+            f"Кадр: {frame_ms:.2f} мс (макс {stats['frame_max_ms']:.2f}) | {fps:.0f} FPS",
+            f"update: {stats['update_ms']:.2f} мс | draw: {stats['draw_ms']:.2f} мс",
+        ]
+        for key, title in self.SECTIONS:
+            lines.append(f"  {title}: {stats[key + '_ms']:.3f} мс")
+        if stats["entity_candidates"]:
+            lines.append(f"  broadphase: {stats['broadphase_ms']:.3f} мс | пар: {stats['entity_candidates']:.0f} "
+                         f"-> {stats['entity_collisions']:.0f}")
+        lines.append(f"draw calls: {stats['draw_calls']:.0f} | спрайтов: {stats['sprites']:.0f}")
+        lines.append(f"GC: {stats['gc_ms']:.3f} мс/кадр (макс {stats['gc_max_ms']:.2f})")
+        lines.append(f"CPU процесса: {self.sample_cpu():.1f}%")
+        return lines
+
+    def draw(self, window):
+        """Рисует оверлей поверх всех состояний"""
+        if not self.enabled:
+            return
+
+        now = time.perf_counter()
+        if now - self._last_text_update > self._text_refresh or not self._text_lines:
+            self._last_text_update = now
+            lines = self._build_lines()
+            # Переиспользуем объекты Text - создавать их каждый кадр дорого
+            while len(self._text_lines) < len(lines):
+                self._text_lines.append(arcade.Text("", 0, 0, arcade.color.LIME, 12))
+            for text, line in zip(self._text_lines, lines):
+                text.text = line
+            del self._text_lines[len(lines):]
+
+        window.default_camera.use()
+
+        line_height = 18
+        panel_height = line_height * len(self._text_lines) + 10
+        top = window.height - 10
+        arcade.draw_rect_filled(
+            arcade.rect.LRBT(5, 420, top - panel_height, top),
+            (0, 0, 0, 180)
+        )
+        for i, text in enumerate(self._text_lines):
+            text.x = 12
+            text.y = top - line_height * (i + 1)
+            text.draw()
+
+
+# Глобальный экземпляр профилировщика
+frame_profiler = FrameProfiler()
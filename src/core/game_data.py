@@ -3,6 +3,79 @@ import pickle
 from typing import Dict, Any, List
 
 
+class MapEventState:
+    """
+    Сохраненное состояние событий одной карты.
+
+    Главный флаг события (сундук открыт) - бит в битсете, номер бита выдается
+    по id события при первом изменении. Редкие дополнительные данные - маленькие
+    словари в blobs. Хранятся только измененные события, поэтому восстановление
+    после перезагрузки карты стоит O(измененных), а не O(всех событий).
+    """
+
+    __slots__ = ("bits", "flags", "blobs")
+
+    def __init__(self):
+        self.bits = {}  # id события -> номер бита
+        self.flags = bytearray()
+        self.blobs = {}  # id события -> dict
+
+    def __len__(self):
+        return len(self.bits)
+
+    def _bit(self, event_id: str) -> int:
+        bit = self.bits.get(event_id)
+        if bit is None:
+            bit = self.bits[event_id] = len(self.bits)
+            if bit >= len(self.flags) * 8:
+                self.flags.append(0)
+        return bit
+
+    def get_flag(self, event_id: str) -> bool:
+        bit = self.bits.get(event_id)
+        return bit is not None and bool(self.flags[bit >> 3] & (1 << (bit & 7)))
+
+    def set_flag(self, event_id: str, value: bool = True):
+        bit = self._bit(event_id)
+        if value:
+            self.flags[bit >> 3] |= 1 << (bit & 7)
+        else:
+            self.flags[bit >> 3] &= ~(1 << (bit & 7)) & 0xFF
+
+    def record(self, event):
+        """Сохраняет состояние одного события (вызывается при его изменении)"""
+        flag, blob = event.save_state()
+        self.set_flag(event.event_id, flag)
+        if blob:
+            self.blobs[event.event_id] = blob
+        else:
+            self.blobs.pop(event.event_id, None)
+
+    def restore(self, event) -> bool:
+        """Восстанавливает событие, если оно менялось. False - нечего восстанавливать"""
+        if event.event_id not in self.bits:
+            return False
+        event.restore_state(self.get_flag(event.event_id), self.blobs.get(event.event_id))
+        return True
+
+    def apply(self, event_manager) -> int:
+        """Восстанавливает все измененные события карты. Возвращает их количество"""
+        restored = 0
+        for event_id in self.bits:
+            event = event_manager.get_event(event_id)
+            if event is not None:
+                event.restore_state(self.get_flag(event_id), self.blobs.get(event_id))
+                restored += 1
+        return restored
+
+    def to_dict(self) -> dict:
+        """Для JSON-экспорта"""
+        return {
+            "flags": {event_id: self.get_flag(event_id) for event_id in self.bits},
+            "blobs": self.blobs,
+        }
+
+
 class GameData:
     """
     ЕДИНЫЙ центр всех данных игры.
@@ -34,6 +107,9 @@ class GameData:
             "failed": []  # Проваленные
         }
 
+        # Состояние событий по картам (открытые сундуки и т.п.): карта -> MapEventState
+        self.world = {}
+
         # Статистика игры
         self.stats = {
             "play_time": 0,
@@ -46,6 +122,7 @@ class GameData:
         self.settings = {
             "volume": 0.7,
             "fullscreen": False,
+            "idle_throttle": True,  # Снижать частоту кадров в простое
         }
 
     def save_to_file(self, filename="savegame.dat"):
@@ -71,7 +148,8 @@ class GameData:
             "inventory": self.inventory,
             "quests": self.quests,
             "stats": self.stats,
-            "settings": self.settings
+            "settings": self.settings,
+            "world": {map_name: state.to_dict() for map_name, state in self.world.items()}
         }
 
         with open(filename, 'w', encoding='utf-8') as f:
@@ -88,6 +166,13 @@ class GameData:
         if map_name:
             self.player["position"]["map"] = map_name
 
+    def get_event_state(self, map_name: str) -> MapEventState:
+        """Состояние событий карты (создается при первом обращении)"""
+        state = self.world.get(map_name)
+        if state is None:
+            state = self.world[map_name] = MapEventState()
+        return state
+
     def add_item(self, item_id, count=1):
         """Добавляет предмет в инвентарь"""
         # ... логика добавления предмета ...
@@ -1,6 +1,9 @@
 import logging
-from typing import Dict, Optional, List
+import time
+from typing import Dict, Optional, List, Callable
 
+from src.core.frame_profiler import frame_profiler
+from src.core.state_hooks import StateHookRegistry, ChromeTraceExporter
 from src.states.base_state import BaseState
 
 
@@ -17,6 +20,9 @@ class GameStateManager:
         # Все зарегистрированные состояния
         self.states: Dict[str, 'BaseState'] = {}
 
+        # Фабрики ленивых состояний (создаются при первом обращении)
+        self.state_factories: Dict[str, Callable[[], 'BaseState']] = {}
+
         # Текущее основное состояние (игра, лобби)
         self.current_state: Optional['BaseState'] = None
 
@@ -27,6 +33,17 @@ class GameStateManager:
         self.input_manager = None
         self.asset_loader = None
 
+        # Профилировщик кадра (оверлей по F3)
+        self.frame_profiler = frame_profiler
+
+        # Хуки вокруг update/draw/handle_key_press (профилировщики, трассировка, тесты)
+        self.hooks = StateHookRegistry()
+        self.trace_exporter = None
+
+        # Кэш отрисовки основного состояния под overlay'ями
+        self.cache_overlay_background = True
+        self.background_cache = None
+
         self.logger.info("GameStateManager создан")
 
     def register_state(self, state_id: str, state_instance: 'BaseState'):
@@ -35,6 +52,25 @@ class GameStateManager:
         state_instance.gsm = self  # Даем состоянию ссылку на менеджер
         self.logger.debug(f"Зарегистрировано состояние: {state_id}")
 
+    def register_state_factory(self, state_id: str, factory: Callable[[], 'BaseState']):
+        """Регистрирует ленивое состояние - оно будет создано при первом обращении"""
+        self.state_factories[state_id] = factory
+        self.logger.debug(f"Зарегистрирована фабрика состояния: {state_id}")
+
+    def has_state(self, state_id: str) -> bool:
+        """Проверяет, зарегистрировано ли состояние (созданное или ленивое)"""
+        return state_id in self.states or state_id in self.state_factories
+
+    def get_state(self, state_id: str) -> Optional['BaseState']:
+        """Возвращает состояние, при необходимости создавая его через фабрику"""
+        state = self.states.get(state_id)
+        if state is None and state_id in self.state_factories:
+            self.logger.info(f"Создание ленивого состояния: {state_id}")
+            factory = self.state_factories.pop(state_id)
+            state = factory()
+            self.register_state(state_id, state)
+        return state
+
     def switch_to(self, state_id: str, **kwargs):
         """Полностью переключает на новое состояние"""
         self.logger.info(f"Переключение на состояние: {state_id}")
@@ -48,24 +84,25 @@ class GameStateManager:
             overlay = self.overlay_stack.pop()
             overlay.on_exit()
 
+        # Старый кэш фона больше не нужен
+        if self.background_cache:
+            self.background_cache.release()
+
         # Входим в новое состояние
-        self.current_state = self.states[state_id]
+        self.current_state = self.get_state(state_id)
         self.current_state.on_enter(**kwargs)
 
-        # Принудительно обновляем камеры после переключения состояния
-        if self.window:
-            import pyglet
-            pyglet.clock.schedule_once(lambda dt: self._update_cameras_after_switch(), 0.1)
+        # Камеры и UI - под текущее окно сразу, в этом же кадре
+        self._apply_layout(self.current_state)
 
-    def _update_cameras_after_switch(self):
-        """Обновляет камеры после переключения состояния"""
-        if hasattr(self.window, '_update_all_cameras'):
-            width, height = self.window.get_size()
-            self.window._update_all_cameras(width, height)
+    def _apply_layout(self, state: 'BaseState'):
+        """Подгоняет состояние под окно (раскладка из кэша, если размер не менялся)"""
+        if self.window and hasattr(self.window, 'apply_layout'):
+            self.window.apply_layout(state)
 
     def push_overlay(self, overlay_id: str, **kwargs):
         """Открывает состояние ПОВЕРХ текущего"""
-        if overlay_id not in self.states:
+        if not self.has_state(overlay_id):
             self.logger.error(f"Overlay состояние не найдено: {overlay_id}")
             return
 
@@ -77,7 +114,11 @@ class GameStateManager:
             active_state.on_pause()
 
         # Создаем новый overlay
-        new_overlay = self.states[overlay_id]
+        new_overlay = self.get_state(overlay_id)
+
+        # Первый overlay - основное состояние замирает, снимаем его заново
+        if not self.overlay_stack:
+            self.invalidate_background()
 
         # Добавляем его в конец стека
         self.overlay_stack.append(new_overlay)
@@ -85,16 +126,7 @@ class GameStateManager:
         # Входим в новый overlay
         new_overlay.on_enter(**kwargs)
 
-        # Обновляем камеры после добавления overlay
-        if self.window:
-            import pyglet
-            pyglet.clock.schedule_once(lambda dt: self._update_cameras_after_overlay(), 0.1)
-
-    def _update_cameras_after_overlay(self):
-        """Обновляет камеры после открытия overlay"""
-        if hasattr(self.window, '_update_all_cameras'):
-            width, height = self.window.get_size()
-            self.window._update_all_cameras(width, height)
+        self._apply_layout(new_overlay)
 
     def pop_overlay(self):
         """
@@ -104,10 +136,6 @@ class GameStateManager:
         if not self.overlay_stack:
             self.logger.warning("Попытка закрыть overlay, но стек пуст")
             return
-        # костыль - если не вписать сюда то состояние не исчезнет а откроется снова
-        self.input_manager.reset_action('cheat_console')
-        self.input_manager.reset_action('escape')
-        self.input_manager.reset_action('select')
 
         # Получаем текущий активный overlay (верх стека)
         current_overlay = self.overlay_stack[-1]
@@ -145,28 +173,127 @@ class GameStateManager:
 
     def update(self, delta_time: float):
         """Обновляет активное состояние"""
+        profiling = self.frame_profiler.enabled
+        if profiling:
+            start = time.perf_counter()
+
         active_state = self.get_active_state()
         if active_state:
-            active_state.update(delta_time)
+            if self.hooks.enabled:
+                self.hooks.call(active_state, "update", active_state.update, delta_time)
+            else:
+                active_state.update(delta_time)
+
+        # Фронты нажатий этого тика больше никому не нужны
+        if self.input_manager:
+            self.input_manager.end_tick()
+
+        if profiling:
+            self.frame_profiler.add_time("update", time.perf_counter() - start)
 
     def draw(self):
         """Отрисовывает состояния в правильном порядке"""
-        # Рисуем основное состояние
+        profiling = self.frame_profiler.enabled
+        if profiling:
+            start = time.perf_counter()
+
+        # Рисуем основное состояние (под overlay'ем - из кэша)
         if self.current_state:
-            self.current_state.draw()
+            if self.overlay_stack and self.cache_overlay_background:
+                self._draw_cached_background()
+            else:
+                self._draw_state(self.current_state)
 
         # Рисуем ВСЕ overlay'ы по порядку (от нижнего к верхнему)
         for overlay in self.overlay_stack:
-            overlay.draw()
+            self._draw_state(overlay)
+
+        # Профилировщик рисуется поверх всего стека
+        if profiling:
+            self.frame_profiler.add_time("draw", time.perf_counter() - start)
+            self.frame_profiler.draw(self.window)
+            self.frame_profiler.end_frame()
+
+    def _draw_state(self, state: 'BaseState'):
+        """Рисует одно состояние (через хуки, если они есть)"""
+        if self.hooks.enabled:
+            self.hooks.call(state, "draw", state.draw)
+        else:
+            state.draw()
+
+    def _draw_cached_background(self):
+        """Рисует основное состояние одной текстурой из кэша"""
+        if self.background_cache is None:
+            from src.core.overlay_cache import OverlayBackgroundCache  # Ленивый импорт
+            self.background_cache = OverlayBackgroundCache(self.window)
+
+        try:
+            self.background_cache.draw(self.current_state, self._draw_state)
+        except Exception as e:
+            # Без поддержки framebuffer'ов просто рисуем как раньше
+            self.logger.warning(f"Кэш фона overlay недоступен, отключаем: {e}")
+            self.cache_overlay_background = False
+            self.background_cache = None
+            self._draw_state(self.current_state)
+
+    def invalidate_background(self):
+        """Просит перерисовать кэш фона (состояние под overlay'ем изменилось)"""
+        if self.background_cache:
+            self.background_cache.invalidate()
+
+    def start_trace(self):
+        """Начинает запись трассы в формате Chrome trace-event"""
+        if self.trace_exporter:
+            return
+        self.trace_exporter = ChromeTraceExporter()
+        self.hooks.add(self.trace_exporter)
+
+    def stop_trace(self, path: str = "logs/trace.json") -> Optional[str]:
+        """Останавливает запись трассы и сохраняет её"""
+        if not self.trace_exporter:
+            return None
+        self.hooks.remove(self.trace_exporter)
+        saved_path = self.trace_exporter.save(path)
+        self.trace_exporter = None
+        return saved_path
+
+    def on_input(self, event):
+        """
+        Событие ввода от InputManager (подписка в MainWindow).
+        Каждое событие получает ровно одно состояние - активное в момент
+        нажатия: если оно закрылось или открыло overlay, то же нажатие
+        не достанется состоянию под ним.
+        """
+        if event.pressed:
+            self.handle_key_press(event.key, event.modifiers, event.actions)
+        else:
+            self.handle_key_release(event.key, event.modifiers)
+
+    def handle_key_press(self, key: int, modifiers: int, actions: tuple = ()):
+        """Передает нажатие клавиши и ее действия активному состоянию"""
+        # F3 - оверлей профилировщика (работает в любом состоянии)
+        if "profiler" in actions:
+            self.frame_profiler.toggle()
+            return
 
-    def handle_key_press(self, key: int, modifiers: int):
-        """Передает нажатие клавиши активному состоянию"""
         active_state = self.get_active_state()
         if active_state:
-            active_state.handle_key_press(key, modifiers)
+            if self.hooks.enabled:
+                self.hooks.call(active_state, "handle_key_press", self._deliver_press,
+                                active_state, key, modifiers, actions)
+            else:
+                self._deliver_press(active_state, key, modifiers, actions)
+
+    def _deliver_press(self, state: 'BaseState', key: int, modifiers: int, actions: tuple):
+        state.handle_key_press(key, modifiers)
+        for action in actions:
+            # Состояние закрылось или открыло overlay - остальное уже не ему
+            if self.get_active_state() is not state:
+                break
+            state.on_action(action)
 
     def handle_key_release(self, key: int, modifiers: int):
         """Передает отпускание клавиши активному состоянию"""
         active_state = self.get_active_state()
         if active_state:
-            active_state.handle_key_release(key, modifiers)
\ No newline at end of file
+            active_state.handle_key_release(key, modifiers)
@@ -1,8 +1,18 @@
 import logging
+from typing import NamedTuple
 
 import arcade
 import json
 import os
+import time
+
+
+class InputEvent(NamedTuple):
+    """Нажатие или отпускание клавиши, как его получают подписчики InputManager"""
+    key: int
+    modifiers: int
+    pressed: bool  # True - нажатие, False - отпускание
+    actions: tuple  # Действия, привязанные к этой клавише
 
 
 class InputManager:
@@ -20,6 +30,9 @@ class InputManager:
         self.keys_pressed = set()
         self.config_file = config_file
 
+        # Время последнего ввода (для FramePacer)
+        self.last_input_time = time.perf_counter()
+
         # Конфигурация клавиш по умолчанию (в виде строк)
         self.default_key_bindings = {
             'up': ["W", "UP"],
@@ -29,7 +42,8 @@ class InputManager:
             'select': ["ENTER"],
             'escape': ["ESCAPE"],
             'fullscreen': ["F11"],
-            'cheat_console': ["F2"]
+            'cheat_console': ["F2"],
+            'profiler': ["F3"]
         }
 
         # Инициализация преобразования клавиш ДО загрузки настроек
@@ -41,6 +55,10 @@ class InputManager:
         # Конвертируем строки в коды клавиш для внутреннего использования
         self.key_codes = self._convert_strings_to_codes(self.key_bindings)
 
+        # Клавиша -> действия (для событий ввода, пересобирается при смене привязок)
+        self.key_actions = {}
+        self._rebuild_key_actions()
+
         # Состояние действий
         self.actions = {}
         self._init_actions()
@@ -48,6 +66,15 @@ class InputManager:
         # Для отслеживания "полезного" нажатия
         self.last_valid_direction = None
 
+        # Снимок ввода за тик: действия, нажатые и отпущенные с прошлого end_tick.
+        # Короткое нажатие внутри одного тика не теряется (в pressed и в released)
+        self.pressed = set()
+        self.released = set()
+        self.tick = 0
+
+        # Подписчики на события ввода: handler(InputEvent)
+        self._subscribers = []
+
     # работа с JSON
     def load_key_bindings(self):
         """
@@ -153,7 +180,9 @@ class InputManager:
         """
         self.key_bindings = self.default_key_bindings.copy()
         self.key_codes = self._convert_strings_to_codes(self.key_bindings)
+        self._rebuild_key_actions()
         self._init_actions()
+        self._update_last_direction()
         self.save_key_bindings()
         self.logger.info("✓ Настройки сброшены к значениям по умолчанию")
 
@@ -196,6 +225,7 @@ class InputManager:
         if new_key_string not in self.key_bindings[action_name]:
             self.key_bindings[action_name].append(new_key_string)
             self.key_codes[action_name].append(new_key)
+        self._rebuild_key_actions()
 
         # Сохраняем изменения
         self.save_key_bindings()
@@ -234,6 +264,7 @@ class InputManager:
             # Удаляем из кодовых привязок
             if key_to_remove in self.key_codes[action_name]:
                 self.key_codes[action_name].remove(key_to_remove)
+            self._rebuild_key_actions()
 
             self.save_key_bindings()
             self.logger.info(f"✓ Привязка '{key_string}' удалена для действия '{action_name}'")
@@ -279,8 +310,11 @@ class InputManager:
 
     def on_key_release(self, key: int, modifiers: int) -> None:
         """Обработка отпускания клавиши (только одно направление за раз)"""
+        before = self._active_actions()
+
         # Удаляем клавишу из нажатых
         self.keys_pressed.discard(key)
+        self.last_input_time = time.perf_counter()
 
         # Определяем, какое направление было отпущено
         released_direction = None
@@ -316,9 +350,14 @@ class InputManager:
         self._update_last_direction()
         self.update_actions()
 
+        self._record_edges(before)
+        self._dispatch(InputEvent(key, modifiers, False, self.key_actions.get(key, ())))
+
     def on_key_press(self, key: int, modifiers: int) -> None:
         """Обработка нажатия клавиши (только одно направление за раз)"""
+        before = self._active_actions()
         self.keys_pressed.add(key)
+        self.last_input_time = time.perf_counter()
 
         # Определяем, какая клавиша направления была нажата
         new_direction = None
@@ -350,6 +389,51 @@ class InputManager:
         self._update_last_direction()
         self.update_actions()
 
+        self._record_edges(before)
+        self._dispatch(InputEvent(key, modifiers, True, self.key_actions.get(key, ())))
+
+    # СОБЫТИЯ И СНИМОК ТИКА
+    def subscribe(self, handler) -> None:
+        """Подписывает handler(InputEvent) на нажатия и отпускания клавиш"""
+        if handler not in self._subscribers:
+            self._subscribers.append(handler)
+
+    def unsubscribe(self, handler) -> None:
+        if handler in self._subscribers:
+            self._subscribers.remove(handler)
+
+    def _dispatch(self, event: InputEvent) -> None:
+        for handler in tuple(self._subscribers):
+            handler(event)
+
+    def _active_actions(self) -> set:
+        return {action for action, active in self.actions.items() if active}
+
+    def _record_edges(self, before: set) -> None:
+        """Дописывает в снимок тика действия, которые включились и выключились"""
+        after = self._active_actions()
+        self.pressed |= after - before
+        self.released |= before - after
+
+    def was_pressed(self, action_name) -> bool:
+        """Действие нажато в этом тике (фронт, а не удержание)"""
+        return action_name in self.pressed
+
+    def was_released(self, action_name) -> bool:
+        """Действие отпущено в этом тике"""
+        return action_name in self.released
+
+    def end_tick(self) -> None:
+        """Закрывает тик: фронты нажатий/отпусканий сбрасываются (вызывает GSM после update)"""
+        if self.pressed or self.released:
+            self.pressed.clear()
+            self.released.clear()
+        self.tick += 1
+
+    def actions_for_key(self, key: int) -> tuple:
+        """Действия, привязанные к клавише"""
+        return self.key_actions.get(key, ())
+
     def _update_last_direction(self) -> None:
         """Обновляет last_valid_direction на основе активного направления"""
         self.last_valid_direction = None
@@ -366,15 +450,6 @@ class InputManager:
             if action not in ['up', 'down', 'left', 'right']:
                 self.actions[action] = any(key in codes for key in self.keys_pressed)
 
-    def reset_action(self, action_name):
-        """Сбрасывает конкретное действие"""
-        if action_name in self.actions:
-            self.actions[action_name] = False
-            # Также удаляем все клавиши этого действия из keys_pressed
-            if action_name in self.key_codes:
-                for key_code in self.key_codes[action_name]:
-                    self.keys_pressed.discard(key_code)
-
     def get_action(self, action_name):
         """Проверяет, активно ли действие"""
         return self.actions.get(action_name, False)
@@ -392,6 +467,14 @@ class InputManager:
         for action in self.key_bindings:
             self.actions[action] = False
 
+    def _rebuild_key_actions(self):
+        """Пересобирает обратные привязки: код клавиши -> действия"""
+        key_actions = {}
+        for action, codes in self.key_codes.items():
+            for code in codes:
+                key_actions.setdefault(code, []).append(action)
+        self.key_actions = {code: tuple(actions) for code, actions in key_actions.items()}
+
     def _init_key_mapping(self):
         """Инициализирует словари для преобразования кодов клавиш"""
         # Словарь для преобразования строк в коды клавиш
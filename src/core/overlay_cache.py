@@ -0,0 +1,94 @@
+import logging
+
+from arcade.gl import geometry
+
+
+class OverlayBackgroundCache:
+    """
+    Кэш отрисовки состояния под overlay'ем.
+    Пока открыт overlay (пауза, настройки, консоль, взлом), основное состояние
+    стоит на месте - рисуем его один раз во framebuffer и дальше выводим одной текстурой.
+    Пересоздаётся только при изменении размера окна или явной инвалидации.
+    """
+
+    def __init__(self, window):
+        self.logger = logging.getLogger(f"{self.__class__.__module__}.{self.__class__.__name__}")
+        self.window = window
+
+        self.framebuffer = None
+        self.texture = None
+        self.size = None
+        self.valid = False
+
+        # Полноэкранный квад и шейдер для вывода текстуры
+        self._quad = None
+        self._program = None
+
+    def invalidate(self):
+        """Помечает кэш устаревшим - при следующей отрисовке он будет перестроен"""
+        self.valid = False
+
+    def release(self):
+        """Освобождает framebuffer (например, при выходе из игры в лобби)"""
+        self.framebuffer = None
+        self.texture = None
+        self.size = None
+        self.valid = False
+
+    def _ensure_framebuffer(self, size):
+        """Создает framebuffer под текущий размер окна"""
+        ctx = self.window.ctx
+        self.texture = ctx.texture(size, components=4)
+        self.framebuffer = ctx.framebuffer(color_attachments=[self.texture])
+        self.size = size
+        self.valid = False
+        self.logger.debug(f"Framebuffer фона overlay создан: {size[0]}x{size[1]}")
+
+        if self._program is None:
+            self._quad = geometry.quad_2d_fs()
+            self._program = ctx.program(
+                vertex_shader="""
+                #version 330
+                in vec2 in_vert;
+                in vec2 in_uv;
+                out vec2 uv;
+
+                void main() {
+                    uv = in_uv;
+                    gl_Position = vec4(in_vert, 0.0, 1.0);
+                }
+                """,
+                fragment_shader="""
+                #version 330
+                uniform sampler2D background;
+                in vec2 uv;
+                out vec4 fragColor;
+
+                void main() {
+                    fragColor = texture(background, uv);
+                }
+                """,
+            )
+
+    def draw(self, state, draw_state):
+        """
+        Рисует состояние через кэш.
+
+        Args:
+            state: Состояние под overlay'ем
+            draw_state: Функция отрисовки состояния (GameStateManager._draw_state)
+        """
+        size = self.window.get_framebuffer_size()
+        if self.framebuffer is None or self.size != size:
+            self._ensure_framebuffer(size)
+
+        if not self.valid:
+            with self.framebuffer.activate():
+                self.framebuffer.clear(color=self.window.background_color)
+                draw_state(state)
+            self.valid = True
+
+        # Выводим кэш на весь экран в координатах UI
+        self.window.default_camera.use()
+        self.texture.use(0)
+        self._quad.render(self._program)
@@ -0,0 +1,100 @@
+import importlib
+import logging
+
+
+class Registry:
+    """
+    Реестр конструкторов по ключу (тип события, id предмета).
+
+    Конструктор регистрируется объектом или строкой "модуль:атрибут" -
+    тогда модуль импортируется только при первом create/resolve этого ключа,
+    и новые типы не увеличивают время запуска. Поиск - один dict lookup
+    (после первого разрешения строка заменяется объектом).
+
+    Ключи можно регистрировать по префиксу ("key_" -> все ключи) и через
+    entry points пакетов (группа entry_point_group), которые читаются
+    лениво при первом неизвестном ключе.
+    """
+
+    def __init__(self, name: str, entry_point_group: str = None):
+        self.logger = logging.getLogger(f"{self.__class__.__module__}.{self.__class__.__name__}.{name}")
+        self.name = name
+        self.entry_point_group = entry_point_group
+
+        self._constructors = {}  # ключ -> объект или "модуль:атрибут"
+        self._prefixes = []  # [(префикс, объект или путь)]
+        self._entry_points_loaded = entry_point_group is None
+
+    def register(self, key: str, constructor=None):
+        """
+        Регистрирует конструктор. Без constructor работает как декоратор:
+
+            @event_types.register("door")
+            class DoorEvent(GameEvent): ...
+        """
+        if constructor is None:
+            def decorator(target):
+                self._constructors[key] = target
+                return target
+            return decorator
+
+        if key in self._constructors:
+            self.logger.debug(f"Тип '{key}' перерегистрирован")
+        self._constructors[key] = constructor
+        return constructor
+
+    def register_prefix(self, prefix: str, constructor):
+        """Конструктор для всех ключей с префиксом (точная регистрация важнее)"""
+        self._prefixes.append((prefix, constructor))
+
+    def __contains__(self, key: str) -> bool:
+        return self.find(key) is not None
+
+    def keys(self):
+        return list(self._constructors)
+
+    def find(self, key: str):
+        """Конструктор для ключа или None"""
+        constructor = self._constructors.get(key)
+        if constructor is not None:
+            if isinstance(constructor, str):
+                constructor = self._constructors[key] = self._import(constructor)
+            return constructor
+
+        for index, (prefix, target) in enumerate(self._prefixes):
+            if key.startswith(prefix):
+                if isinstance(target, str):
+                    target = self._import(target)
+                    self._prefixes[index] = (prefix, target)
+                return target
+
+        if not self._entry_points_loaded:
+            self._load_entry_points()
+            return self.find(key)
+        return None
+
+    def resolve(self, key: str):
+        """Конструктор для ключа. KeyError, если тип неизвестен"""
+        constructor = self.find(key)
+        if constructor is None:
+            raise KeyError(f"Неизвестный тип {self.name}: '{key}'")
+        return constructor
+
+    def create(self, key: str, *args, **kwargs):
+        return self.resolve(key)(*args, **kwargs)
+
+    def _import(self, path: str):
+        module_name, _, attribute = path.partition(":")
+        target = importlib.import_module(module_name)
+        for part in attribute.split("."):
+            target = getattr(target, part)
+        self.logger.debug(f"Загружен {path}")
+        return target
+
+    def _load_entry_points(self):
+        """Типы из установленных пакетов (entry points), без импорта самих модулей"""
+        from importlib import metadata  # Ленивый импорт (сам модуль заметно замедляет запуск)
+
+        self._entry_points_loaded = True
+        for entry_point in metadata.entry_points(group=self.entry_point_group):
+            self._constructors.setdefault(entry_point.name, entry_point.value)
@@ -38,11 +38,11 @@ class ResourceManager:
         self._textures[relative_path] = texture
         return texture
 
-    def load_spritesheet(self, relative_path: str, size=(16, 16), columns=8, count=8):
-        """Загрузить spritesheet"""
+    def load_spritesheet(self, relative_path: str, size=(16, 16), columns=8, count=8, margin=(0, 0, 0, 0)):
+        """Загрузить spritesheet (margin - отступы вокруг кадра: left, right, bottom, top)"""
         path = self.get_resource_path(relative_path)
         grid = arcade.load_spritesheet(path)
-        return grid.get_texture_grid(size=size, columns=columns, count=count)
+        return grid.get_texture_grid(size=size, columns=columns, count=count, margin=margin)
 
     def load_sound(self, relative_path: str) -> arcade.Sound:
         """Загрузить звук с кэшированием"""
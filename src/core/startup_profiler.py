@@ -0,0 +1,106 @@
+import builtins
+import logging
+import sys
+import time
+
+
+class StartupProfiler:
+    """
+    Профилировщик холодного старта.
+    Меряет время фаз запуска и строит дерево импортов (как python -X importtime).
+    """
+
+    def __init__(self, min_import_ms: float = 1.0):
+        self.logger = logging.getLogger(f"{self.__class__.__module__}.{self.__class__.__name__}")
+
+        # Фазы запуска: [(имя, длительность в секундах)]
+        self.phases = []
+        self._phase_name = None
+        self._phase_start = 0.0
+        self._start_time = time.perf_counter()
+
+        # Дерево импортов: [(глубина, модуль, собственное время, общее время)]
+        self.min_import_ms = min_import_ms  # Более быстрые импорты не выводим
+        self.import_records = []
+        self._import_stack = []
+        self._original_import = None
+
+        self.finished = False
+
+    # ФАЗЫ
+    def mark(self, phase_name: str):
+        """Завершает текущую фазу и начинает новую"""
+        now = time.perf_counter()
+        if self._phase_name is not None:
+            self.phases.append((self._phase_name, now - self._phase_start))
+        self._phase_name = phase_name
+        self._phase_start = now
+
+    def finish(self):
+        """Завершает последнюю фазу и выводит отчёт"""
+        if self.finished:
+            return
+        self.mark(None)
+        self._phase_name = None
+        self.finished = True
+        self.uninstall_import_hook()
+        self.print_report()
+
+    # ИМПОРТЫ
+    def install_import_hook(self):
+        """Подменяет builtins.__import__, чтобы замерять каждый новый импорт"""
+        if self._original_import is not None:
+            return
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+
+    def uninstall_import_hook(self):
+        """Возвращает стандартный __import__"""
+        if self._original_import is None:
+            return
+        builtins.__import__ = self._original_import
+        self._original_import = None
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        # Уже загруженные модули не меряем - это просто поиск в словаре
+        if level > 0 or name in sys.modules:
+            return self._original_import(name, globals, locals, fromlist, level)
+
+        record = [len(self._import_stack), name, 0.0, 0.0]
+        self.import_records.append(record)
+        self._import_stack.append(0.0)  # время вложенных импортов
+
+        start = time.perf_counter()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            total = time.perf_counter() - start
+            nested = self._import_stack.pop()
+            record[2] = total - nested
+            record[3] = total
+            if self._import_stack:
+                self._import_stack[-1] += total
+
+    # ОТЧЁТ
+    def format_report(self) -> str:
+        """Возвращает отчёт в виде текста"""
+        lines = ["", "=== ПРОФИЛЬ ЗАПУСКА ===", "Дерево импортов (собственное | общее, мс):"]
+
+        for depth, name, self_time, total in self.import_records:
+            if total * 1000 < self.min_import_ms:
+                continue
+            lines.append(f"  {self_time * 1000:8.1f} | {total * 1000:8.1f} | {'  ' * depth}{name}")
+
+        lines.append("Фазы запуска (мс):")
+        for name, duration in self.phases:
+            lines.append(f"  {name:<28} {duration * 1000:8.1f}")
+
+        total_time = sum(duration for _, duration in self.phases)
+        lines.append(f"  {'ИТОГО':<28} {total_time * 1000:8.1f}")
+        return "\n".join(lines)
+
+    def print_report(self):
+        """Выводит отчёт в консоль и лог"""
+        report = self.format_report()
+        print(report)
+        self.logger.info(report)
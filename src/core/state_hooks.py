@@ -0,0 +1,98 @@
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+
+
+class StateHook:
+    """
+    Базовый хук состояний.
+    Получает замеры (спаны) вызовов update/draw/handle_key_press.
+    """
+
+    def on_span(self, state_id: str, phase: str, start: float, duration: float):
+        """
+        Вызывается после каждого обёрнутого вызова.
+
+        Args:
+            state_id: ID состояния ("game", "pause_menu", ...)
+            phase: "update", "draw" или "handle_key_press"
+            start: время начала (time.perf_counter), секунды
+            duration: длительность, секунды
+        """
+        pass
+
+
+class StateHookRegistry:
+    """
+    Реестр хуков вокруг методов состояний.
+    Пока хуков нет - enabled = False и GameStateManager вызывает состояния напрямую.
+    """
+
+    def __init__(self):
+        self.logger = logging.getLogger(f"{self.__class__.__module__}.{self.__class__.__name__}")
+        self.hooks = []
+        self.enabled = False
+
+    def add(self, hook: StateHook):
+        """Добавляет хук"""
+        if hook not in self.hooks:
+            self.hooks.append(hook)
+        self.enabled = True
+        self.logger.info(f"Добавлен хук: {hook.__class__.__name__}")
+
+    def remove(self, hook: StateHook):
+        """Удаляет хук"""
+        if hook in self.hooks:
+            self.hooks.remove(hook)
+        self.enabled = bool(self.hooks)
+        self.logger.info(f"Удален хук: {hook.__class__.__name__}")
+
+    def call(self, state, phase: str, method, *args):
+        """Вызывает метод состояния и отдаёт замер всем хукам"""
+        start = time.perf_counter()
+        try:
+            return method(*args)
+        finally:
+            duration = time.perf_counter() - start
+            for hook in tuple(self.hooks):
+                hook.on_span(state.state_id, phase, start, duration)
+
+
+class ChromeTraceExporter(StateHook):
+    """
+    Собирает спаны в формате Chrome trace-event JSON.
+    Файл открывается в chrome://tracing или ui.perfetto.dev
+    """
+
+    def __init__(self, max_events: int = 500_000):
+        self.logger = logging.getLogger(f"{self.__class__.__module__}.{self.__class__.__name__}")
+        # Ограничиваем память на длинных сессиях - старые события вытесняются
+        self.events = deque(maxlen=max_events)
+        self.origin = time.perf_counter()
+        self.pid = os.getpid()
+
+    def on_span(self, state_id: str, phase: str, start: float, duration: float):
+        self.events.append({
+            "name": f"{state_id}.{phase}",
+            "cat": phase,
+            "ph": "X",
+            "ts": (start - self.origin) * 1_000_000,  # микросекунды
+            "dur": duration * 1_000_000,
+            "pid": self.pid,
+            "tid": threading.get_ident(),
+        })
+
+    def save(self, path: str = "logs/trace.json") -> str:
+        """Сохраняет трассу в JSON"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": list(self.events), "displayTimeUnit": "ms"}, f)
+
+        self.logger.info(f"Трасса ({len(self.events)} событий) сохранена в {path}")
+        return path
@@ -11,6 +11,10 @@ class Entity(arcade.Sprite):
 
         self.rm = ResourceManager()
 
+        # Хранилище массивов (EntityStore), если сущность симулируется пачкой
+        self._store = None
+        self._slot = None
+
         self.time_elapsed = 0  # задержка времени для анимации
 
         # Базовые параметры
@@ -29,6 +33,33 @@ class Entity(arcade.Sprite):
         self.collides_with_map = True  # Коллизии с картой
         self.collides_with_entities = True  # Коллизии с другими сущностями
 
+    @property
+    def health(self):
+        """Здоровье (из EntityStore, если сущность в хранилище)"""
+        if self._store is not None:
+            return float(self._store.health[self._slot])
+        return self._health
+
+    @health.setter
+    def health(self, value):
+        if self._store is not None:
+            self._store.health[self._slot] = value
+        else:
+            self._health = value
+
+    @property
+    def is_alive(self):
+        if self._store is not None:
+            return bool(self._store.alive[self._slot])
+        return self._is_alive
+
+    @is_alive.setter
+    def is_alive(self, value):
+        if self._store is not None:
+            self._store.alive[self._slot] = value
+        else:
+            self._is_alive = value
+
     def setup_hitbox(self, offsets=None):
         """
         Настраивает хитбокс с указанными отступами.
@@ -0,0 +1,250 @@
+import logging
+
+import numpy as np
+
+
+class EntityStore:
+    """
+    Хранилище сущностей структурой массивов (NumPy).
+
+    Позиции, скорости, размеры, отступы хитбоксов, здоровье и флаги коллизий
+    лежат в общих массивах, поэтому движение, коллизии с картой, broadphase
+    и здоровье обновляются одной векторной операцией на всех сразу.
+    Спрайты Entity остаются тонкими представлениями для отрисовки:
+    sync_sprites копирует в них позиции, health читается из массива.
+
+    Необязательно: сущности без хранилища работают как раньше.
+    """
+
+    # Все массивы по сущностям (для роста и удаления)
+    ARRAYS = ("position", "velocity", "half_size", "hitbox_offsets", "health", "max_health", "health_regen",
+              "alive", "collision_enabled", "collides_with_map", "collides_with_entities", "_hitbox_half")
+
+    def __init__(self, capacity: int = 256):
+        self.logger = logging.getLogger(f"{self.__class__.__module__}.{self.__class__.__name__}")
+        self.count = 0
+        self.entities = []
+
+        self.position = np.zeros((capacity, 2))
+        self.velocity = np.zeros((capacity, 2))  # пикселей в секунду
+        self.half_size = np.zeros((capacity, 2))  # половина ширины/высоты спрайта
+        self.hitbox_offsets = np.zeros((capacity, 4))  # left, right, top, bottom (доли размера)
+        self.health = np.zeros(capacity)
+        self.max_health = np.zeros(capacity)
+        self.health_regen = np.zeros(capacity)  # единиц в секунду (отрицательное - урон со временем)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.collision_enabled = np.zeros(capacity, dtype=bool)
+        self.collides_with_map = np.zeros(capacity, dtype=bool)
+        self.collides_with_entities = np.zeros(capacity, dtype=bool)
+
+        # Кэш полуразмеров хитбоксов (пересчитывается при смене размеров или отступов)
+        self._hitbox_half = np.zeros((capacity, 2))
+        self._hitbox_dirty = True
+
+    def __len__(self):
+        return self.count
+
+    # СОСТАВ
+    def add(self, entity) -> int:
+        """Переносит состояние сущности в массивы. Возвращает индекс"""
+        if entity._store is not None:
+            raise ValueError(f"{entity} уже в хранилище")
+
+        if self.count == len(self.health):
+            self._grow(len(self.health) * 2)
+
+        i = self.count
+        self.count += 1
+        self.entities.append(entity)
+
+        self.position[i] = entity.center_x, entity.center_y
+        self.velocity[i] = 0.0
+        self.half_size[i] = entity.width / 2, entity.height / 2
+        offsets = entity.hitbox.offsets if entity.hitbox else {}
+        self.hitbox_offsets[i] = (offsets.get('left', 0), offsets.get('right', 0),
+                                  offsets.get('top', 0), offsets.get('bottom', 0))
+        self.health[i] = entity._health
+        self.max_health[i] = max(entity._health, 1)
+        self.health_regen[i] = 0.0
+        self.alive[i] = entity._is_alive
+        self.collision_enabled[i] = entity.collision_enabled
+        self.collides_with_map[i] = entity.collides_with_map
+        self.collides_with_entities[i] = entity.collides_with_entities
+        self._hitbox_dirty = True
+
+        entity._store = self
+        entity._slot = i
+        return i
+
+    def remove(self, entity):
+        """Убирает сущность (последняя переезжает на ее место). Состояние возвращается в объект"""
+        i = entity._slot
+        entity._health = float(self.health[i])
+        entity._is_alive = bool(self.alive[i])
+        entity.position = tuple(self.position[i])
+        entity._store = None
+        entity._slot = None
+
+        last = self.count - 1
+        if i != last:
+            for name in self.ARRAYS:
+                array = getattr(self, name)
+                array[i] = array[last]
+            moved = self.entities[last]
+            self.entities[i] = moved
+            moved._slot = i
+        self.entities.pop()
+        self.count = last
+
+    def _grow(self, capacity: int):
+        for name in self.ARRAYS:
+            array = getattr(self, name)
+            grown = np.zeros((capacity,) + array.shape[1:], dtype=array.dtype)
+            grown[:len(array)] = array
+            setattr(self, name, grown)
+
+    def invalidate_hitboxes(self):
+        """Вызывать после изменения half_size или hitbox_offsets напрямую"""
+        self._hitbox_dirty = True
+
+    # ТИК
+    def step(self, delta_time: float, grid=None):
+        """
+        Движение всех живых сущностей на velocity * delta_time.
+
+        Args:
+            delta_time: время кадра
+            grid: NavigationGrid - если передана, коллизии с картой
+                  считаются по углам хитбоксов со скольжением вдоль стен
+        """
+        n = self.count
+        if not n:
+            return
+        moving = self.alive[:n]
+        delta = self.velocity[:n] * delta_time
+        delta[~moving] = 0.0
+
+        if grid is None:
+            self.position[:n] += delta
+            return
+
+        # Как CollisionSystem.resolve_map_collision: сначала X, потом Y
+        blocked = self.collides_with_map[:n] & self.collision_enabled[:n]
+        for axis in (0, 1):
+            target = self.position[:n].copy()
+            target[:, axis] += delta[:, axis]
+            hit = self._hits_map(target, grid) & blocked
+            self.position[:n, axis] = np.where(hit, self.position[:n, axis], target[:, axis])
+
+    def _hits_map(self, positions, grid):
+        """Есть ли стена под любым из 4 углов хитбокса в позиции positions"""
+        half = self.hitbox_half()
+        walkable = np.frombuffer(grid.walkable, dtype=np.uint8)
+        hit = np.zeros(len(positions), dtype=bool)
+        for sx in (-1, 1):
+            for sy in (-1, 1):
+                cols = np.floor_divide(positions[:, 0] + sx * half[:, 0], grid.tile_size).astype(np.int64)
+                rows = np.floor_divide(positions[:, 1] + sy * half[:, 1], grid.tile_size).astype(np.int64)
+                inside = (cols >= 0) & (cols < grid.width) & (rows >= 0) & (rows < grid.height)
+                index = (np.clip(rows, -1, grid.height) + 1) * grid.stride + np.clip(cols, -1, grid.width) + 1
+                hit |= ~inside | (walkable[index] == 0)
+        return hit
+
+    def update_health(self, delta_time: float):
+        """Регенерация/урон со временем для всех и пересчет alive"""
+        n = self.count
+        health = self.health[:n]
+        health += self.health_regen[:n] * delta_time
+        np.clip(health, 0.0, self.max_health[:n], out=health)
+        self.alive[:n] &= health > 0
+
+    def apply_damage(self, indices, amount):
+        """Урон по индексам (массив или маска), например, по результату broadphase"""
+        n = self.count
+        indices = np.asarray(indices)
+        if indices.dtype == bool:
+            indices = np.flatnonzero(indices)
+        # subtract.at - одна сущность может встретиться в нескольких парах
+        np.subtract.at(self.health, indices, amount)
+        np.maximum(self.health[:n], 0.0, out=self.health[:n])
+        self.alive[:n] &= self.health[:n] > 0
+
+    # КОЛЛИЗИИ
+    def hitbox_half(self):
+        """Полуразмеры хитбоксов (N, 2) - как в HitboxComponent, центр совпадает со спрайтом"""
+        n = self.count
+        if self._hitbox_dirty:
+            offsets = self.hitbox_offsets[:n]
+            self._hitbox_half[:n, 0] = self.half_size[:n, 0] * (1 - (offsets[:, 0] + offsets[:, 1]))
+            self._hitbox_half[:n, 1] = self.half_size[:n, 1] * (1 - (offsets[:, 2] + offsets[:, 3]))
+            self._hitbox_dirty = False
+        return self._hitbox_half[:n]
+
+    def collision_rects(self):
+        """Хитбоксы всех сущностей (N, 4): left, bottom, right, top"""
+        n = self.count
+        half = self.hitbox_half()
+        position = self.position[:n]
+        return np.hstack((position - half, position + half))
+
+    def overlapping_pairs(self):
+        """
+        Broadphase по равномерной сетке: пары (i, j), чьи хитбоксы пересекаются.
+        Учитывает collision_enabled / collides_with_entities / alive.
+
+        Клетка - самый большой хитбокс, поэтому пересекаться могут только
+        сущности из одной клетки или соседних. Один гигантский хитбокс
+        укрупняет сетку для всех - такие лучше держать вне хранилища.
+
+        Returns:
+            два массива индексов одинаковой длины
+        """
+        n = self.count
+        active = np.flatnonzero(self.collision_enabled[:n] & self.collides_with_entities[:n] & self.alive[:n])
+        if active.size < 2:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+
+        position = self.position[active]
+        cell = max(2 * float(self.hitbox_half()[active].max()), 1.0)
+        cols = np.floor_divide(position[:, 0], cell).astype(np.int64)
+        rows = np.floor_divide(position[:, 1], cell).astype(np.int64)
+        cols -= cols.min()
+        rows -= rows.min()
+        # +1 по краям, чтобы сосед слева не заворачивал на прошлую строку
+        width = int(cols.max()) + 3
+        keys = (rows + 1) * width + cols + 1
+
+        order = np.argsort(keys, kind="stable")
+        keys = keys[order]
+        active = active[order]
+        rects = self.collision_rects()[active]
+
+        # Своя клетка (только следующие по порядку) и 4 соседа "вперед" - каждая пара один раз
+        index = np.arange(active.size)
+        parts = [self._expand(index + 1, np.searchsorted(keys, keys, side="right"))]
+        for offset in (1, width - 1, width, width + 1):
+            parts.append(self._expand(np.searchsorted(keys, keys + offset, side="left"),
+                                      np.searchsorted(keys, keys + offset, side="right")))
+        first = np.concatenate([part[0] for part in parts])
+        second = np.concatenate([part[1] for part in parts])
+
+        # Узкая фаза - та же проверка, что в CollisionSystem.check_entity_collision
+        a = rects[first]
+        b = rects[second]
+        hit = ~((a[:, 2] < b[:, 0]) | (a[:, 0] > b[:, 2]) | (a[:, 3] < b[:, 1]) | (a[:, 1] > b[:, 3]))
+        return active[first[hit]], active[second[hit]]
+
+    @staticmethod
+    def _expand(starts, ends):
+        """Все пары (i, k) для k из [starts[i], ends[i])"""
+        counts = ends - starts
+        first = np.repeat(np.arange(starts.size), counts)
+        second = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+        return first, second
+
+    # ОТРИСОВКА
+    def sync_sprites(self):
+        """Копирует позиции в спрайты (один проход перед draw)"""
+        for entity, (x, y) in zip(self.entities, self.position[:self.count].tolist()):
+            entity.position = (x, y)
@@ -1,4 +1,6 @@
 # src/entities/hitbox_component.py
+from types import MappingProxyType
+
 import arcade
 
 
@@ -6,8 +8,14 @@ class HitboxComponent:
     """
     Компонент хитбокса для Entity.
     Позволяет задавать кастомные отступы от спрайта.
+
+    Полуразмеры хитбокса считаются заранее и пересчитываются только при смене
+    размера спрайта (scale, текстура) или отступов, поэтому get_rect - это
+    четыре сложения без обращений к словарю.
     """
 
+    __slots__ = ("entity", "_offsets", "_width", "_height", "half_width", "half_height")
+
     def __init__(self, entity, offsets=None):
         """
         Инициализация хитбокса.
@@ -22,7 +30,7 @@ class HitboxComponent:
         self.entity = entity
 
         # Отступы по умолчанию (без изменений)
-        self.offsets = {
+        self._offsets = {
             'left': 0,
             'right': 0,
             'top': 0,
@@ -30,34 +38,55 @@ class HitboxComponent:
         }
 
         if offsets:
-            self.offsets.update(offsets)
+            self._offsets.update(offsets)
+
+        # Размер спрайта, для которого посчитаны полуразмеры
+        self._width = None
+        self._height = None
+        self.half_width = 0.0
+        self.half_height = 0.0
+        self._refresh()
+
+    @property
+    def offsets(self):
+        """Отступы (только чтение - менять через set_offsets)"""
+        return MappingProxyType(self._offsets)
+
+    def set_offsets(self, offsets: dict):
+        """Меняет отступы и пересчитывает полуразмеры"""
+        self._offsets.update(offsets)
+        self._width = None
+        self._refresh()
+
+    def _refresh(self):
+        """Пересчитывает полуразмеры, если изменился размер спрайта"""
+        width = self.entity.width
+        height = self.entity.height
+        if width == self._width and height == self._height:
+            return
+
+        offsets = self._offsets
+        self._width = width
+        self._height = height
+        self.half_width = width * (1 - (offsets['left'] + offsets['right'])) / 2
+        self.half_height = height * (1 - (offsets['top'] + offsets['bottom'])) / 2
 
     def get_rect(self):
         """
         Возвращает прямоугольник хитбокса в мировых координатах.
+        Центр хитбокса совпадает с центром спрайта.
 
         Returns:
             (left, bottom, right, top) - границы прямоугольника
         """
-        # Получаем размеры спрайта с учетом scale
-        width = self.entity.width
-        height = self.entity.height
-
-        # Вычисляем размеры хитбокса с отступами
-        hitbox_width = width * (1 - (self.offsets['left'] + self.offsets['right']))
-        hitbox_height = height * (1 - (self.offsets['top'] + self.offsets['bottom']))
-
-        # Центр хитбокса совпадает с центром спрайта
-        center_x = self.entity.center_x
-        center_y = self.entity.center_y
-
-        # Вычисляем границы
-        left = center_x - (hitbox_width / 2)
-        right = center_x + (hitbox_width / 2)
-        bottom = center_y - (hitbox_height / 2)
-        top = center_y + (hitbox_height / 2)
+        entity = self.entity
+        if entity.width != self._width or entity.height != self._height:
+            self._refresh()
 
-        return left, bottom, right, top
+        center_x, center_y = entity.position
+        half_width = self.half_width
+        half_height = self.half_height
+        return center_x - half_width, center_y - half_height, center_x + half_width, center_y + half_height
 
     def get_corners(self):
         """
@@ -89,4 +118,4 @@ class HitboxComponent:
             ),
             arcade.color.RED,
             2
-        )
\ No newline at end of file
+        )
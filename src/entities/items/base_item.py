@@ -25,6 +25,17 @@ class Item(Entity):
         self.is_consumable = False
         self.is_quest_item = False
 
+    @classmethod
+    def from_registry(cls, item_id: str, count: int = 1, **kwargs):
+        """Конструктор для ItemFactory: предмет без своего класса"""
+        item = cls(
+            item_id=item_id,
+            name=kwargs.get("name", item_id),
+            texture_path=kwargs.get("texture")
+        )
+        item.count = count
+        return item
+
     def use(self, user):
         """Использовать предмет (переопределить в наследниках)"""
         print(f"Используется {self.name}")
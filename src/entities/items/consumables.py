@@ -17,6 +17,10 @@ class HealingPotion(Item):
         self.heal_amount = 50
         self.description = f"Восстанавливает {self.heal_amount} здоровья"
 
+    @classmethod
+    def from_registry(cls, item_id: str, count: int = 1, **kwargs):
+        return cls(count)
+
     def use(self, user) -> bool:
         if user.health < user.max_health:
             heal_amount = min(self.heal_amount, user.max_health - user.health)
@@ -42,6 +46,10 @@ class ManaPotion(Item):
         self.restore_amount = 30
         self.description = f"Восстанавливает {self.restore_amount} маны"
 
+    @classmethod
+    def from_registry(cls, item_id: str, count: int = 1, **kwargs):
+        return cls(count)
+
     def use(self, user) -> bool:
         # Если у игрока есть мана
         if hasattr(user, 'mana'):
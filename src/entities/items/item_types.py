@@ -0,0 +1,11 @@
+from ...core.registry import Registry
+
+# id предмета -> класс предмета (создается через Item.from_registry).
+# Классы грузятся при первом предмете своего типа; сторонние пакеты могут
+# добавить предметы через entry points группы "itcubia.item_types".
+# Неизвестные id - базовый Item.
+item_types = Registry("item_types", entry_point_group="itcubia.item_types")
+
+item_types.register("healing_potion", "src.entities.items.consumables:HealingPotion")
+item_types.register("mana_potion", "src.entities.items.consumables:ManaPotion")
+item_types.register_prefix("key_", "src.entities.items.keys:Key")
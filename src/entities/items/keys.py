@@ -18,6 +18,12 @@ class Key(Item):
         self.key_id = key_id  # Какой замок открывает
         self.description = f"Ключ для замка '{key_id}'"
 
+    @classmethod
+    def from_registry(cls, item_id: str, count: int = 1, **kwargs):
+        """key_<тип> -> Key(<тип>)"""
+        key_type = item_id[4:] if item_id.startswith("key_") else "basic"
+        return cls(key_id=key_type, name=kwargs.get("name", f"Ключ {key_type}"))
+
     def use(self, user) -> bool:
         print(f"🔑 Ключ '{self.key_id}' нельзя просто так использовать")
         return False  # Ключи не расходуются при использовании
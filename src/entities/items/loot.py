@@ -0,0 +1,266 @@
+import bisect
+import random
+import re
+from typing import NamedTuple, Tuple
+
+
+class LootError(ValueError):
+    """Ошибка в строке добычи (синтаксис или неизвестный предмет)"""
+
+
+class LootEntry(NamedTuple):
+    """Предмет с фиксированным количеством"""
+    item_id: str
+    count: int
+
+
+class LootChoice(NamedTuple):
+    """Взвешенный выбор одной из вложенных таблиц"""
+    options: Tuple["LootTable", ...]
+    cumulative: Tuple[float, ...]  # Накопленные веса для bisect
+    total: float
+
+    def roll_into(self, result: list, rng):
+        index = bisect.bisect_right(self.cumulative, rng.random() * self.total)
+        self.options[min(index, len(self.options) - 1)].roll_into(result, rng)
+
+
+class LootTable(NamedTuple):
+    """
+    Скомпилированная таблица добычи (неизменяемая, общая для всех сундуков
+    с той же строкой).
+
+    fixed - предметы, которые выпадают всегда (для таблиц без выбора roll
+    просто копирует этот кортеж), choices - взвешенные выборы.
+    """
+    source: str
+    fixed: Tuple[LootEntry, ...]
+    choices: Tuple[LootChoice, ...]
+    item_ids: frozenset  # Все предметы, которые могут выпасть
+
+    def roll(self, rng=random) -> list:
+        """Бросок таблицы: список (item_id, count)"""
+        if not self.choices:
+            return list(self.fixed)
+        result = []
+        self.roll_into(result, rng)
+        return result
+
+    def roll_into(self, result: list, rng):
+        result.extend(self.fixed)
+        for choice in self.choices:
+            choice.roll_into(result, rng)
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.item_ids
+
+    def __str__(self):
+        return self.source or "<пусто>"
+
+
+EMPTY_LOOT = LootTable("", (), (), frozenset())
+
+# Строка (как в Tiled) -> LootTable. Разных строк на картах немного,
+# лимит только защищает от роста при генерации строк на лету
+_compiled = {}
+_validated = {}
+CACHE_LIMIT = 4096
+
+_TOKEN = re.compile(r"\s*(?:([A-Za-z_]\w*)|(\d+(?:\.\d+)?)|([:,\[\]|@]))")
+# Элемент простого списка без выбора ("healing_potion:3") - такие строки на картах почти все
+_PLAIN_ENTRY = re.compile(r"\s*([A-Za-z_]\w*)\s*(?::\s*([1-9]\d*)\s*)?")
+
+_item_types = None  # Реестр предметов по умолчанию (импортируется при первой проверке)
+
+
+def compile_loot(text: str) -> LootTable:
+    """
+    Компилирует строку добычи в LootTable (с кэшированием по строке).
+
+    Синтаксис:
+        healing_potion:3, key_door1              - предметы (количество по умолчанию 1)
+        [mana_potion:2 @3 | healing_potion:5 @1] - один вариант по весам (вес по умолчанию 1)
+        [healing_potion @1 | @3]                 - пустой вариант: ничего не выпало
+        key_door1, [[mana_potion | key_door2] @1 | healing_potion @2] - таблицы вкладываются
+
+    Raises:
+        LootError: синтаксическая ошибка (с позицией в строке)
+    """
+    table = _compiled.get(text)
+    if table is None:
+        if len(_compiled) >= CACHE_LIMIT:
+            _compiled.clear()
+        table = _compiled[text] = _compile_plain(text) or _Parser(text).parse()
+    return table
+
+
+def _compile_plain(text: str):
+    """Быстрый разбор строки без [ ] и @. None - строку разберет общий парсер"""
+    if "[" in text or "@" in text or not text.strip():
+        return None
+    fixed = []
+    for part in text.split(","):
+        match = _PLAIN_ENTRY.fullmatch(part)
+        if match is None:
+            return None  # Ошибку с позицией сообщит общий парсер
+        item_id, count = match.groups()
+        fixed.append(LootEntry(item_id, int(count) if count else 1))
+    return LootTable(text.strip(), tuple(fixed), (), frozenset(entry.item_id for entry in fixed))
+
+
+def load_loot(text: str, registry=None) -> LootTable:
+    """
+    Компилирует строку и проверяет, что все предметы есть в реестре.
+    Вызывается при загрузке карты, чтобы опечатка в Tiled всплыла сразу,
+    а не при открытии сундука.
+
+    Raises:
+        LootError: синтаксическая ошибка или неизвестный id предмета
+    """
+    global _item_types
+    if registry is None:
+        if _item_types is None:
+            from .item_types import item_types as _item_types  # Ленивый импорт
+        registry = _item_types
+
+    table = compile_loot(text)
+    checked = _validated.get(text)
+    if checked is not registry:
+        unknown = sorted(item_id for item_id in table.item_ids if item_id not in registry)
+        if unknown:
+            raise LootError(f"неизвестные предметы {', '.join(unknown)} в '{text}'")
+        if len(_validated) >= CACHE_LIMIT:
+            _validated.clear()
+        _validated[text] = registry
+    return table
+
+
+def clear_cache():
+    _compiled.clear()
+    _validated.clear()
+
+
+class _Parser:
+    """Рекурсивный спуск по токенам строки добычи"""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.tokens = []  # (вид, значение, позиция)
+        position = 0
+        length = len(text)
+        while True:
+            match = _TOKEN.match(text, position)
+            if match is None or match.end() == position:
+                if text[position:].strip():
+                    raise LootError(f"непонятный символ в позиции {position}: '{text}'")
+                break
+            name, number, operator = match.groups()
+            start = match.start(match.lastindex)
+            if name is not None:
+                self.tokens.append(("name", name, start))
+            elif number is not None:
+                self.tokens.append(("number", number, start))
+            else:
+                self.tokens.append((operator, operator, start))
+            position = match.end()
+            if position >= length:
+                break
+        self.index = 0
+
+    def parse(self) -> LootTable:
+        table = self._table(top=True)
+        if self.index < len(self.tokens):
+            self._fail("лишний символ")
+        return table
+
+    # Грамматика
+    def _table(self, top=False) -> LootTable:
+        start = self._position()
+        fixed = []
+        choices = []
+        while self._peek() in ("name", "["):
+            if self._peek() == "name":
+                fixed.append(self._entry())
+            else:
+                choices.append(self._choice())
+            if self._peek() != ",":
+                break
+            self._next()
+        else:
+            if fixed or choices:
+                self._fail("ожидался предмет или [")
+
+        item_ids = {entry.item_id for entry in fixed}
+        for choice in choices:
+            for option in choice.options:
+                item_ids |= option.item_ids
+        source = self.text.strip() if top else self.text[start:self._position()].strip()
+        return LootTable(source, tuple(fixed), tuple(choices), frozenset(item_ids))
+
+    def _entry(self) -> LootEntry:
+        _, item_id, _ = self._next()
+        count = 1
+        if self._peek() == ":":
+            self._next()
+            _, value, _ = self._expect("number", "количество")
+            if "." in value or int(value) < 1:
+                self._fail(f"количество должно быть целым и больше 0, а не {value}", back=1)
+            count = int(value)
+        return LootEntry(item_id, count)
+
+    def _choice(self) -> LootChoice:
+        self._next()  # [
+        options = []
+        weights = []
+        while True:
+            options.append(self._table())
+            weight = 1.0
+            if self._peek() == "@":
+                self._next()
+                _, value, _ = self._expect("number", "вес")
+                weight = float(value)
+                if weight <= 0:
+                    self._fail(f"вес должен быть больше 0, а не {value}", back=1)
+            weights.append(weight)
+
+            kind = self._peek()
+            if kind == "|":
+                self._next()
+            elif kind == "]":
+                self._next()
+                break
+            else:
+                self._fail("ожидалось | или ]")
+
+        cumulative = []
+        total = 0.0
+        for weight in weights:
+            total += weight
+            cumulative.append(total)
+        return LootChoice(tuple(options), tuple(cumulative), total)
+
+    # Токены
+    def _peek(self):
+        if self.index < len(self.tokens):
+            return self.tokens[self.index][0]
+        return None
+
+    def _next(self):
+        token = self.tokens[self.index]
+        self.index += 1
+        return token
+
+    def _expect(self, kind, what):
+        if self._peek() != kind:
+            self._fail(f"ожидалось {what}")
+        return self._next()
+
+    def _position(self) -> int:
+        if self.index < len(self.tokens):
+            return self.tokens[self.index][2]
+        return len(self.text)
+
+    def _fail(self, message, back=0):
+        self.index -= back
+        raise LootError(f"{message} в позиции {self._position()}: '{self.text}'")
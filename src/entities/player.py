@@ -4,9 +4,16 @@ import arcade
 
 from .base_entity import Entity
 from ..core.game_data import game_data
+from ..systems.animation_system import Animation, animation_system
 
 
 class Player(Entity):
+    # Смена кадра шага, секунды
+    WALK_FRAME_TIME = 0.3
+
+    # Направление -> шаг по осям
+    DIRECTION_STEPS = {"up": (0, 1), "down": (0, -1), "left": (-1, 0), "right": (1, 0)}
+
     def __init__(self, texture_dict, input_manager, scale=1):
         self.logger = logging.getLogger(f"{self.__class__.__module__}.{self.__class__.__name__}")
         self.data = game_data
@@ -31,6 +38,12 @@ class Player(Entity):
             "right": 6  # текстуры 6 и 7
         }
 
+        # Цикл шагов по направлению: два кадра на общих часах animation_system
+        self.walk_animations = {
+            direction: Animation(all_textures[index:index + 2], self.WALK_FRAME_TIME)
+            for direction, index in self.texture_indexes.items()
+        }
+
         # Для отслеживания смены направления
         self.last_direction = None
 
@@ -53,36 +66,20 @@ class Player(Entity):
 
     def update(self, delta_time: float = 1 / 60, *args, **kwargs) -> None:
         super().update(delta_time)
-        self.time_elapsed += delta_time
-
-        dx, dy = 0, 0
-        current_direction = None
-
-        if self.input_manager.get_action('up'):
-            current_direction = "up"
-            dy += self.speed * delta_time * 60  # Умножаем на delta_time для плавности
-        if self.input_manager.get_action('down'):
-            current_direction = "down"
-            dy -= self.speed * delta_time * 60
-        if self.input_manager.get_action('left'):
-            current_direction = "left"
-            dx -= self.speed * delta_time * 60
-        if self.input_manager.get_action('right'):
-            current_direction = "right"
-            dx += self.speed * delta_time * 60
-
-        # СРАЗУ меняем текстуру при смене направления
-        if current_direction and current_direction != self.last_direction:
-            self._set_direction_texture(current_direction)
-            self.time_elapsed = 0
-
-        # Анимация
-        if current_direction and self.time_elapsed > 0.3:
+
+        # InputManager держит активным одно направление за раз - читаем его,
+        # а не опрашиваем каждое действие
+        current_direction = self.input_manager.last_valid_direction
+        step_x, step_y = self.DIRECTION_STEPS.get(current_direction, (0, 0))
+        dx = step_x * self.speed * delta_time * 60  # Умножаем на delta_time для плавности
+        dy = step_y * self.speed * delta_time * 60
+
+        # Анимация шага (при смене направления первый кадр ставится сразу)
+        if current_direction:
             self._animate_direction(current_direction)
-            self.time_elapsed = 0
 
         # Если стоим - статичная текстура
-        elif not current_direction:
+        else:
             self._set_idle_texture()
 
         # Обновляем направление
@@ -122,56 +119,40 @@ class Player(Entity):
             self.center_y += dy
             return dx, dy
 
+        # Один SpriteList (Tiled) или список слоев (стены загруженных чанков)
+        if isinstance(collision_layer, arcade.SpriteList):
+            check_collision = arcade.check_for_collision_with_list
+        else:
+            check_collision = arcade.check_for_collision_with_lists
+
         # Сохраняем старую позицию
         old_x, old_y = self.center_x, self.center_y
 
         # Двигаемся по X
         self.center_x += dx
-        x_hits = arcade.check_for_collision_with_list(self, collision_layer)
+        x_hits = check_collision(self, collision_layer)
         if x_hits:
             self.center_x = old_x
 
         # Двигаемся по Y
         self.center_y += dy
-        y_hits = arcade.check_for_collision_with_list(self, collision_layer)
+        y_hits = check_collision(self, collision_layer)
         if y_hits:
             self.center_y = old_y
 
         return self.center_x - old_x, self.center_y - old_y
 
-    def _set_direction_texture(self, direction):
-        """Сразу устанавливает первую текстуру направления"""
-        if direction == "up":
-            self.cur_texture_index = 0
-        elif direction == "down":
-            self.cur_texture_index = 2
-        elif direction == "left":
-            self.cur_texture_index = 4
-        elif direction == "right":
-            self.cur_texture_index = 6
-        self.set_texture(self.cur_texture_index)
-
     def _animate_direction(self, direction):
-        """Анимирует движение в указанном направлении"""
-        direction_map = {
-            "up": (0, 1),  # текстуры 0 и 1
-            "down": (2, 3),  # текстуры 2 и 3
-            "left": (4, 5),  # текстуры 4 и 5
-            "right": (6, 7)  # текстуры 6 и 7
-        }
-
-        tex1, tex2 = direction_map[direction]
-
-        # Переключаем между двумя текстурами
-        if self.cur_texture_index == tex1:
-            self.cur_texture_index = tex2
-            self.set_texture(tex2)
-        else:
-            self.cur_texture_index = tex1
-            self.set_texture(tex1)
+        """
+        Анимирует движение в указанном направлении.
+        Кадры меняет animation_system; цикл того же направления не перезапускается.
+        """
+        animation_system.play(self, self.walk_animations[direction])
+        self.cur_texture_index = self.texture_indexes[direction]
 
     def _set_idle_texture(self):
         """Устанавливает статичную текстуру для стояния"""
+        animation_system.stop(self)
         # Определяем последнее направление для idle-позы
         if self.last_direction == "up":
             self.cur_texture_index = 0
@@ -1,13 +1,23 @@
+import logging
 from typing import Dict, Any
 
 import arcade
 
 from .event import GameEvent
 from src.entities.items.item_factory import ItemFactory
+from src.entities.items.loot import EMPTY_LOOT, LootError, load_loot
 
 class ChestEvent(GameEvent):
     """Событие сундука"""
 
+    __slots__ = ("sprite", "sprite_center_x", "sprite_center_y", "sprite_height",
+                 "tile_x", "tile_y", "lock_sequence", "is_locked", "is_empty", "player_sequence", "loot")
+
+    logger = logging.getLogger(f"{__name__}.ChestEvent")
+
+    # Добыча, если в Tiled свойство loot не задано совсем
+    DEFAULT_LOOT = "healing_potion:3"
+
     def __init__(self, event_id: str, rect: tuple, properties: Dict[str, Any]):
         super().__init__(event_id, "chest", rect, properties)
         # Ссылка на спайт
@@ -15,20 +25,27 @@ class ChestEvent(GameEvent):
         self.sprite_center_x = 0
         self.sprite_center_y = 0
         self.sprite_height = 0
+        # Клетка тайла сундука в Tiled (свойства tile_x/tile_y) - явная связь со спрайтом
+        self.tile_x = properties.get("tile_x")
+        self.tile_y = properties.get("tile_y")
         # Парсим свойства
         self.lock_sequence = properties.get("lock", "")
         self.is_locked = len(self.lock_sequence) > 0
         self.is_empty = False
         self.player_sequence = ""
 
-        # Добыча
-        loot_str = properties.get("loot", "")
-        self.loot_items = ItemFactory.parse_loot_string(loot_str)
+        # Добыча: таблица компилируется один раз на строку и общая для всех сундуков,
+        # предметы создаются только при открытии
+        try:
+            self.loot = load_loot(properties.get("loot", self.DEFAULT_LOOT))
+        except LootError as error:
+            self.logger.error(f"Сундук {event_id}: {error}")
+            self.loot = EMPTY_LOOT
 
         # Для отладки
         self.logger.debug(f"Создан сундук {event_id}: "
               f"замок='{self.lock_sequence}', "
-              f"предметов={len(self.loot_items)}")
+              f"добыча='{self.loot}'")
 
     def activate(self, player, game_state):
         """Игрок взаимодействует с сундуком"""
@@ -82,20 +99,30 @@ class ChestEvent(GameEvent):
         self.sprite_height = self.sprite.height
         if sprite:
             sprite.event = self  # Двусторонняя связь
+            sprite.update_visual()  # Сундук мог быть открыт до привязки (сохранение)
 
     def _open_chest(self, player):
         """Открыть сундук и выдать добычу"""
         self.logger.info(f"Сундук открыт! Получено:")
 
-        for item in self.loot_items:
-            self._add_to_inventory(player, item)
+        for item_id, count in self.loot.roll():
+            self._add_to_inventory(player, ItemFactory.create(item_id, count))
 
         self.is_empty = True
+        self._state_changed()
 
         # Обновляем визуал если есть спрайт
         if self.sprite:
             self.sprite.update_visual()
 
+    def save_state(self):
+        return self.is_empty, None
+
+    def restore_state(self, flag, blob):
+        self.is_empty = flag
+        if self.sprite:
+            self.sprite.update_visual()
+
     def _add_to_inventory(self, player, item):
         """Добавляет предмет в инвентарь игрока"""
         # Ищем, есть ли уже такой предмет
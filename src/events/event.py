@@ -1,24 +1,39 @@
 import logging
+from types import MappingProxyType
 from typing import Dict, Any, Optional
 
+# Общий пустой словарь свойств для событий без свойств (только чтение)
+NO_PROPERTIES = MappingProxyType({})
+
 
 class GameEvent:
-    """Базовый класс для игровых событий"""
+    """
+    Базовый класс для игровых событий.
+
+    Событий на карте могут быть тысячи, поэтому у них __slots__, общий логгер
+    на класс и константы на классе, а не в каждом экземпляре.
+    Наследники объявляют свои __slots__.
+    """
+
+    __slots__ = ("event_id", "type", "rect", "properties", "activated", "cooldown", "wake_at",
+                 "show_text_description", "state_listener")
 
+    logger = logging.getLogger(f"{__name__}.GameEvent")
 
+    tileSize = 64
+    max_cooldown = 0.5  # секунды
 
     def __init__(self, event_id: str, event_type: str, rect: tuple, properties: Dict[str, Any] = None):
-        self.logger = logging.getLogger(f"{self.__class__.__module__}.{self.__class__.__name__}")
         self.show_text_description = False
-        self.tileSize = 64
 
         self.event_id = event_id
         self.type = event_type  # "chest", "teleport", "dialogue"
         self.rect = rect  # (x, y, width, height)
-        self.properties = properties or {}
+        self.properties = properties or NO_PROPERTIES
         self.activated = False
-        self.cooldown = 0
-        self.max_cooldown = 30  # 0.5 секунды при 60 FPS
+        self.cooldown = 0  # Длительность текущего кулдауна в секундах (отсчитывает EventScheduler)
+        self.wake_at = None  # Время пробуждения в EventScheduler (None - не в очереди)
+        self.state_listener = None  # Вызывается при изменении сохраняемого состояния (EventManager)
 
     def check_collision(self, player_rect) -> bool:
         """Проверяет пересечение с игроком"""
@@ -31,8 +46,8 @@ class GameEvent:
                      py < ey + eh and
                      py + ph > ey)
 
-        if collision and hasattr(self, 'logger'):
-            self.logger.debug(f"Коллизия с {self.event_id}")
+        if collision:
+            self.logger.debug("Коллизия с %s", self.event_id)
 
         return collision
 
@@ -40,12 +55,30 @@ class GameEvent:
         """Активировать событие - будет переопределено"""
         pass
 
-    def update(self, delta_time: float):
-        """Обновление кулдауна"""
-        if self.cooldown > 0:
-            self.cooldown -= 1
-        if self.cooldown <= 0:
-            self.activated = False
+    def wake(self):
+        """Вызывается EventScheduler, когда истек кулдаун или таймер"""
+        self.cooldown = 0
+        self.activated = False
+
+    # СОХРАНЕНИЕ
+    def save_state(self):
+        """
+        Сохраняемое состояние события.
+
+        Returns:
+            (флаг, словарь или None) - флаг для главного состояния (сундук открыт),
+            словарь - для редких дополнительных данных
+        """
+        return False, None
+
+    def restore_state(self, flag: bool, blob: Optional[dict]):
+        """Применяет сохраненное состояние (после загрузки карты)"""
+        pass
+
+    def _state_changed(self):
+        """Сообщает EventManager, что состояние нужно сохранить"""
+        if self.state_listener:
+            self.state_listener(self)
 
     def draw_description(self):
        """Описание события"""
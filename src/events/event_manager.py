@@ -1,8 +1,10 @@
+import logging
 import arcade
-from typing import List
+from typing import Dict, List, Optional
 from .event import GameEvent
-from .chest_event import ChestEvent
-from .teleport_event import TeleportEvent
+from .event_types import event_types
+from .event_scheduler import EventScheduler
+from .triggers import TriggerSystem
 from config import  constants as C
 from ..core.resource_manager import resource_manager
 
@@ -12,18 +14,48 @@ class EventManager:
         """
         Инициализация менеджера событий.
         """
+        self.logger = logging.getLogger(f"{self.__class__.__module__}.{self.__class__.__name__}")
         self.rm = resource_manager
         self.tile_size = C.TILE_SIZE
         print("ивентменеджер с размером тайла: ", self.tile_size)
 
-        # Логика событий (зоны взаимодействия из Object Layer)
+        # Логика событий (зоны взаимодействия из Object Layer).
+        # Менять только через add_event/remove_event - иначе разойдутся индексы
         self.events: List[GameEvent] = []
 
-        # Визуальные спрайты (будут созданы из Tile Layer "chests_visual")
-        self.chest_sprites = arcade.SpriteList()
+        # Индексы: id -> событие, тип -> {событие: None} (упорядоченное множество)
+        self._by_id: Dict[str, GameEvent] = {}
+        self._by_type: Dict[str, Dict[GameEvent, None]] = {}
 
-        # Спрайты других событий (телепорты, NPC и т.д.)
-        self.event_sprites = arcade.SpriteList()
+        # Реакция на игрока в зоне события по типу (остальные - активация при входе).
+        # Ключ - тип из реестра event_types, чтобы не импортировать классы событий заранее
+        self._contact_handlers = {
+            "chest": self._on_chest_contact,
+        }
+        # Типы, которые активируются не касанием, а кнопкой взаимодействия (interact)
+        self.interactive_types = {"chest"}
+
+        # Зоны событий: вход/пребывание/выход без перебора всех событий каждый кадр
+        self.triggers = TriggerSystem(cell_size=self.tile_size * 2,
+                                      on_stay=self._on_trigger_stay,
+                                      on_exit=self._on_trigger_exit)
+        # События "при касании", уже сработавшие за текущее пребывание игрока в зоне
+        self._fired = set()
+
+        # Визуалы всех событий (сундуки, телепорты, NPC) - один SpriteList на общем
+        # атласе: один draw call, а смена текстуры (закрыт -> открыт) меняет только
+        # номер текстуры в буфере - на GPU уходит лишь этот буфер и только при изменении
+        self.sprites = arcade.SpriteList()
+
+        # Кулдауны и таймеры событий (будим только те, у кого истекло время)
+        self.scheduler = EventScheduler()
+
+        # Сохраненное состояние событий карты (MapEventState из GameData)
+        self.state_store = None
+
+        # Сеточный индекс центров сундуков (build_chest_index, сбрасывается при загрузке событий)
+        self._chest_index = None
+        self._chest_index_cell = self.tile_size * 2
 
         self.debug_mode = False
 
@@ -33,9 +65,9 @@ class EventManager:
         """
 
         for i, obj in enumerate(object_list):
-            event = self._create_event_from_object(obj, scale, i)
+            event = self.create_event(obj, scale, i)
             if event:
-                self.events.append(event)
+                self.add_event(event)
 
                 # Отладочная информация
                 x, y, w, h = event.rect
@@ -45,12 +77,97 @@ class EventManager:
 
                 if event.type == "chest":
                     print(f"     Замок: '{getattr(event, 'lock_sequence', 'нет')}'")
-                    print(f"     Лут: {getattr(event, 'loot_items', [])}")
+                    print(f"     Лут: {getattr(event, 'loot', '')}")
 
         print(f"✅ Загружено {len(self.events)} зон взаимодействия")
 
-    def _create_event_from_object(self, obj, scale: float, index: int):
-        """ПРОСТОЙ вариант - без инверсии Y"""
+    # РЕЕСТР СОБЫТИЙ
+    def add_event(self, event: GameEvent):
+        """Добавляет событие и обновляет индексы"""
+        previous = self._by_id.get(event.event_id)
+        if previous is not None:
+            self.logger.warning(f"Повторный id события '{event.event_id}' - прежнее событие заменено")
+            self.remove_event(previous)
+
+        self.events.append(event)
+        self._by_id[event.event_id] = event
+        self._by_type.setdefault(event.type, {})[event] = None
+        self.triggers.add_zone(event)
+
+        event.state_listener = self._on_event_state_changed
+        if self.state_store is not None:
+            # События чанков приходят после загрузки карты - восстанавливаем по одному
+            self.state_store.restore(event)
+        if event.type == "chest":
+            self._chest_index = None
+
+    def remove_event(self, event: GameEvent) -> bool:
+        """Убирает событие из списка и индексов. False - события нет"""
+        if self._by_id.get(event.event_id) is not event:
+            return False
+
+        self.events.remove(event)
+        del self._by_id[event.event_id]
+        del self._by_type[event.type][event]
+        self.triggers.remove_zone(event)
+        event.state_listener = None
+        sprite = getattr(event, "sprite", None)
+        if sprite is not None and sprite.sprite_lists:
+            self.sprites.remove(sprite)
+        # Из планировщика не убираем: кулдаун должен истечь, даже если событие вернется позже
+        if event.type == "chest":
+            self._chest_index = None
+        return True
+
+    def attach_state(self, state_store) -> int:
+        """
+        Подключает сохраненное состояние карты: восстанавливает уже загруженные
+        события пачкой, дальше изменения сохраняются в него по мере возникновения.
+
+        Args:
+            state_store: MapEventState (GameData.get_event_state)
+
+        Returns:
+            сколько событий восстановлено
+        """
+        self.state_store = state_store
+        restored = state_store.apply(self)
+        if restored:
+            self.logger.info(f"Восстановлено состояние {restored} событий")
+        return restored
+
+    def _on_event_state_changed(self, event):
+        if self.state_store is not None:
+            self.state_store.record(event)
+
+    def get_event(self, event_id: str) -> Optional[GameEvent]:
+        """Событие по id за O(1)"""
+        return self._by_id.get(event_id)
+
+    def get_events_by_type(self, event_type: str):
+        """События одного типа (в порядке добавления)"""
+        return list(self._by_type.get(event_type, ()))
+
+    def register_contact_handler(self, event_type: str, handler):
+        """
+        Своя реакция на игрока в зоне события для типа событий.
+
+        Args:
+            event_type: Тип события (как в event_types и Tiled)
+            handler: handler(event, player, game_state)
+        """
+        self._contact_handlers[event_type] = handler
+
+    def create_event(self, obj, scale: float, index: int):
+        """
+        Создает событие из объекта карты (без инверсии Y). В менеджер не добавляет.
+
+        Args:
+            obj: Объект Tiled или описание с теми же полями (type, x, y, width, height, properties)
+            scale: Масштаб карты
+            index: Номер объекта среди всех объектов карты - из него id по умолчанию
+                   ("{type}_{index}"), поэтому у одной карты он должен быть сквозным
+        """
         try:
             # БЕЗ ИНВЕРСИИ - используем координаты как есть
             if hasattr(obj, 'shape') and isinstance(obj.shape, list) and len(obj.shape) >= 4:
@@ -87,13 +204,11 @@ class EventManager:
             event_type = getattr(obj, 'type', 'trigger').lower()
             event_id = properties.get('id', f"{event_type}_{index}")
 
-            # Создаем событие
-            if event_type == "chest":
-                return self._create_chest_event(event_id, (x, y, width, height), properties)
-            elif event_type == "teleport":
-                return TeleportEvent(event_id, (x, y, width, height), properties)
-            else:
-                return GameEvent(event_id, event_type, (x, y, width, height), properties)
+            # Создаем событие (класс из реестра, модуль грузится при первом событии типа)
+            event_class = event_types.find(event_type)
+            if event_class:
+                return event_class(event_id, (x, y, width, height), properties)
+            return GameEvent(event_id, event_type, (x, y, width, height), properties)
 
         except Exception as e:
             print(f"❌ Ошибка создания события {index}: {e}")
@@ -101,132 +216,220 @@ class EventManager:
             traceback.print_exc()
             return None
 
-    def _create_chest_event(self, event_id: str, rect: tuple, properties: dict):
-        """Создает событие сундука"""
-        # Добавляем лут по умолчанию если не указан
-        if "loot" not in properties:
-            properties["loot"] = "healing_potion:3"
-
-        return ChestEvent(event_id, rect, properties)
-
     def create_visual_sprites_from_tile_layer(self, tile_layer, scale: float = 1.0):
         """
         Создает визуальные спрайты из Tile Layer "chests_visual".
-        Вызывается из MapLoader после загрузки тайлов сундуков.
+        Без размеров карты - только связь по ближайшему событию.
         """
         if not tile_layer:
             return
+        self.link_chest_sprites(tile_layer, self.tile_size * scale, self.tile_size * scale)
 
-        from src.entities.chest import ChestSprite
-
-        for i, tile_sprite in enumerate(tile_layer):
-            # Позиция тайла в мире
-            sprite_x = tile_sprite.center_x
-            sprite_y = tile_sprite.center_y
-
-            # Ищем ближайшее событие сундука для этого тайла
-            chest_event = self._find_nearest_chest_event(sprite_x, sprite_y)
-
-            if chest_event:
-                # Создаем спрайт сундука
-                texture_closed = self.rm.load_texture("containers/chest.png")
-                texture_open = self.rm.load_texture("containers/chest_opened.png")
+    def link_chest_sprites(self, tile_layer, tile_width: float, tile_height: float,
+                           map_rows: int = None, max_distance: float = None) -> int:
+        """
+        Создает спрайты сундуков на месте тайлов и связывает их с событиями.
 
-                sprite = ChestSprite(
-                    texture=texture_closed,
-                    texture_open=texture_open,
-                    x=sprite_x,
-                    y=sprite_y,
-                )
+        1. Явная связь: у события есть свойства tile_x/tile_y (клетка в Tiled,
+           строки сверху) - берется тайл из этой клетки.
+        2. Остальные тайлы - ближайшее несвязанное событие сундука по сеточному индексу.
 
-                # Связываем спрайт с событием
-                chest_event.set_sprite(sprite)
-                self.chest_sprites.append(sprite)
+        Args:
+            tile_layer: Тайлы сундуков (слой "containers")
+            tile_width, tile_height: Размер тайла в мире (с учетом масштаба)
+            map_rows: Высота карты в тайлах (нужна для явной связи; None - только по расстоянию)
+            max_distance: Радиус поиска ближайшего события в пикселях
 
-                if self.debug_mode:
-                    print(f"  {i}. Спрайт для события '{chest_event.event_id}' "
-                          f"в ({sprite_x:.0f}, {sprite_y:.0f})")
+        Returns:
+            сколько спрайтов создано
+        """
+        from src.entities.chest import ChestSprite  # Ленивый импорт
+
+        # Текстуры одни на все сундуки. Кладем в атлас сразу, чтобы открытие
+        # сундука не добавляло текстуру в атлас посреди игры
+        texture_closed = self.rm.load_texture("containers/chest.png")
+        texture_open = self.rm.load_texture("containers/chest_opened.png")
+        self.sprites.preload_textures([texture_closed, texture_open])
+
+        links = []
+        linked_tiles = set()
+
+        if map_rows is not None:
+            tiles_by_cell = {}
+            for tile_sprite in tile_layer:
+                col = int(tile_sprite.center_x // tile_width)
+                row = map_rows - 1 - int(tile_sprite.center_y // tile_height)
+                tiles_by_cell[(col, row)] = tile_sprite
+
+            for event in self.get_events_by_type("chest"):
+                if event.tile_x is None or event.tile_y is None:
+                    continue
+                tile_sprite = tiles_by_cell.get((event.tile_x, event.tile_y))
+                if tile_sprite is None:
+                    self.logger.warning(f"{event.event_id}: в клетке ({event.tile_x}, {event.tile_y}) нет тайла сундука")
+                    continue
+                links.append((tile_sprite, event))
+                linked_tiles.add(id(tile_sprite))
+
+        self.build_chest_index(exclude=[event for _, event in links])
+        for tile_sprite in tile_layer:
+            if id(tile_sprite) in linked_tiles:
+                continue
+            event = self._find_nearest_chest_event(tile_sprite.center_x, tile_sprite.center_y, max_distance)
+            if event:
+                links.append((tile_sprite, event))
             else:
-                print(f"⚠️ Для тайла сундука {i} не найдено соответствующего события")
+                self.logger.warning(f"Для тайла сундука в ({tile_sprite.center_x:.0f}, {tile_sprite.center_y:.0f}) "
+                                    f"не найдено события")
+
+        for tile_sprite, event in links:
+            sprite = ChestSprite(
+                texture=texture_closed,
+                texture_open=texture_open,
+                x=tile_sprite.center_x,
+                y=tile_sprite.center_y,
+                event=event
+            )
+            event.set_sprite(sprite)
+            self.sprites.append(sprite)
+
+            if self.debug_mode:
+                print(f"  Спрайт для события '{event.event_id}' в ({sprite.center_x:.0f}, {sprite.center_y:.0f})")
+
+        # Оригинальные тайлы убираем из слоя: пустой слой не дает draw call
+        total = len(tile_layer)
+        for tile_sprite, _ in links:
+            if tile_sprite.sprite_lists:
+                tile_layer.remove(tile_sprite)
+
+        self.sort_sprites()
+        print(f"✅ Создано {len(links)} из {total} спрайтов сундуков")
+        return len(links)
+
+    def add_sprite(self, sprite):
+        """Добавляет визуал события (телепорт, NPC...) в общий список"""
+        self.sprites.append(sprite)
+        self.sort_sprites()
+
+    def sort_sprites(self):
+        """
+        Постоянный порядок отрисовки: сверху вниз по экрану (нижние спрайты
+        перекрывают верхние), при равной высоте - слева направо.
+        Считается при загрузке, а не каждый кадр.
+        """
+        self.sprites.sort(key=lambda sprite: (-sprite.center_y, sprite.center_x))
+
+    def build_chest_index(self, cell_size: float = None, exclude=()):
+        """
+        Сеточный индекс центров событий сундуков для поиска ближайшего.
 
-        print(f"✅ Создано {len(self.chest_sprites)} спрайтов сундуков")
+        Args:
+            cell_size: Размер клетки индекса (по умолчанию 2 тайла)
+            exclude: События, которые не попадают в индекс (уже связанные)
+        """
+        cell_size = cell_size or self.tile_size * 2
+        excluded = {id(event) for event in exclude}
+        index = {}
+        for event in self._by_type.get("chest", ()):
+            if id(event) in excluded:
+                continue
+            ex, ey, ew, eh = event.rect
+            center_x = ex + ew / 2
+            center_y = ey + eh / 2
+            cell = (int(center_x // cell_size), int(center_y // cell_size))
+            index.setdefault(cell, []).append((center_x, center_y, event))
+
+        self._chest_index = index
+        self._chest_index_cell = cell_size
 
     def _find_nearest_chest_event(self, x: float, y: float, max_distance: float = None):
         """
-        Находит ближайшее событие сундука к координатам.
+        Находит ближайшее событие сундука к координатам (по индексу build_chest_index).
+        Смотрит только клетки индекса в радиусе max_distance.
         """
         if max_distance is None:
             # Используем 3 тайла как максимальное расстояние
             max_distance = self.tile_size * 3
+        if self._chest_index is None:
+            self.build_chest_index()
 
-        print(f"   🔍 Поиск события для позиции ({x:.0f}, {y:.0f}) в радиусе {max_distance}px")
+        index = self._chest_index
+        cell_size = self._chest_index_cell
+        reach = int(max_distance // cell_size) + 1
+        cell_x = int(x // cell_size)
+        cell_y = int(y // cell_size)
 
         nearest_event = None
-        min_distance = float('inf')
-
-        for event in self.events:
-            if event.type == "chest":
-                # Получаем центр зоны события
-                ex, ey, ew, eh = event.rect
-                event_center_x = ex + ew / 2
-                event_center_y = ey + eh / 2
-
-                # Вычисляем расстояние
-                distance = ((x - event_center_x) ** 2 + (y - event_center_y) ** 2) ** 0.5
+        best = max_distance * max_distance
+        for cx in range(cell_x - reach, cell_x + reach + 1):
+            for cy in range(cell_y - reach, cell_y + reach + 1):
+                for center_x, center_y, event in index.get((cx, cy), ()):
+                    distance = (x - center_x) ** 2 + (y - center_y) ** 2
+                    if distance <= best:
+                        best = distance
+                        nearest_event = event
 
-                print(
-                    f"   📏 Событие {event.event_id} в ({event_center_x:.0f}, {event_center_y:.0f}): расстояние {distance:.1f}px")
-
-                if distance < min_distance and distance <= max_distance:
-                    min_distance = distance
-                    nearest_event = event
-
-        if nearest_event:
-            print(f"   ✅ Связано с событием {nearest_event.event_id} (расстояние: {min_distance:.1f}px)")
-        else:
-            print(f"   ❌ Событие не найдено в радиусе {max_distance}px")
+        if self.debug_mode:
+            found = nearest_event.event_id if nearest_event else "нет"
+            print(f"   🔍 Сундук для ({x:.0f}, {y:.0f}) в радиусе {max_distance}px: {found}")
 
         return nearest_event
 
     def update(self, delta_time: float):
-        """Обновляет логику событий"""
-        for event in self.events:
-            event.update(delta_time)
+        """
+        Обновляет логику событий: будит события с истекшим кулдауном.
+        Визуалы сундуков обновляются сами при смене состояния (ChestEvent._open_chest).
+        """
+        self.scheduler.update(delta_time)
 
-        # Обновляем визуалы сундуков
-        for sprite in self.chest_sprites:
-            if hasattr(sprite, 'update_visual'):
-                sprite.update_visual()
+    def activate_event(self, event, player, game_state):
+        """Активирует событие и ставит его кулдаун в планировщик"""
+        event.activate(player, game_state)
+        if event.activated and event.cooldown > 0 and not self.scheduler.is_scheduled(event):
+            self.scheduler.schedule(event, event.cooldown)
 
     def check_collisions(self, player, game_state):
-        """Проверяет коллизии игрока с событиями"""
+        """Проверяет коллизии игрока с событиями (через TriggerSystem)"""
         if not player:
             return
+        self.triggers.update(player, game_state)
 
-        player_rect = (
-            player.center_x - player.width / 2,
-            player.center_y - player.height / 2,
-            player.width,
-            player.height
-        )
+    def _on_trigger_stay(self, event, player, game_state):
+        """Игрок в зоне события: реакция, когда он достаточно близко к центру"""
+        if not self._is_player_close_enough(player, event):
+            return
+        handler = self._contact_handlers.get(event.type, self._on_touch)
+        handler(event, player, game_state)
 
+    def _on_trigger_exit(self, event, player, game_state):
+        self._fired.discard(event)
 
+    def _on_touch(self, event, player, game_state):
+        """Телепорты и прочие: срабатывают один раз за вход в зону"""
+        if event in self._fired:
+            return
+        self._fired.add(event)
+        self.activate_event(event, player, game_state)
 
-        for event in self.events:
-            if event.check_collision(player_rect):
+    def _on_chest_contact(self, event, player, game_state):
+        """Сундук: показываем подпись, открывается по кнопке взаимодействия (interact)"""
+        event.show_text_description = True
 
+    def interact(self, player, game_state) -> bool:
+        """
+        Кнопка взаимодействия: активирует первое интерактивное событие, в зоне
+        которого игрок стоит достаточно близко (зоны - с последнего check_collisions).
 
-                # ДЛЯ ВСЕХ СОБЫТИЙ проверяем дистанцию через общий метод
-                if self._is_player_close_enough(player, event):
-                    # Для сундуков проверяем кнопку взаимодействия
-                    if event.type == "chest":
-                        event.show_text_description = True
-                        if hasattr(player, 'input_manager') and player.input_manager:
-                            if player.input_manager.get_action('select'):
-                                event.activate(player, game_state)
-                    else:
-                        # Для других событий (телепортов) активируем сразу
-                        event.activate(player, game_state)
+        Returns:
+            True, если событие активировано
+        """
+        if not player:
+            return False
+        for event in self.triggers.zones_of(player):
+            if event.type in self.interactive_types and self._is_player_close_enough(player, event):
+                self.activate_event(event, player, game_state)
+                return True
+        return False
 
     def _is_player_close_enough(self, player, event) -> bool:
         """Проверяет, достаточно ли близко игрок к событию."""
@@ -250,17 +453,16 @@ class EventManager:
 
     def draw(self):
         """Отрисовывает визуальные элементы событий"""
-        self.chest_sprites.draw()
-        self.event_sprites.draw()
+        self.sprites.draw()
 
         for i in self.events:
             i.draw_description()
 
     def get_chest_by_id(self, event_id: str):
         """Возвращает событие сундука по ID"""
-        for event in self.events:
-            if event.type == "chest" and event.event_id == event_id:
-                return event
+        event = self._by_id.get(event_id)
+        if event is not None and event.type == "chest":
+            return event
         return None
 
     def set_debug_mode(self, enabled: bool):
@@ -271,5 +473,10 @@ class EventManager:
     def clear(self):
         """Очищает все события и спрайты"""
         self.events.clear()
-        self.chest_sprites.clear()
-        self.event_sprites.clear()
+        self._by_id.clear()
+        self._by_type.clear()
+        self.triggers.clear()
+        self._fired.clear()
+        self.scheduler.clear()
+        self._chest_index = None
+        self.sprites.clear()
@@ -0,0 +1,68 @@
+import heapq
+import itertools
+import logging
+
+
+class EventScheduler:
+    """
+    Планировщик пробуждений событий: мин-куча по времени.
+
+    Вместо тика всех событий каждый кадр событие ставится в очередь,
+    когда у него начинается кулдаун или таймер, и получает wake(),
+    когда время вышло. Кадр стоит O(k log n), k - проснувшиеся события.
+
+    Перепланирование не удаляет старую запись из кучи: у события хранится
+    актуальное wake_at, а устаревшие записи пропускаются при извлечении.
+    """
+
+    def __init__(self):
+        self.logger = logging.getLogger(f"{self.__class__.__module__}.{self.__class__.__name__}")
+        self.time = 0.0  # Время в секундах с создания (сумма delta_time)
+        self._heap = []
+        self._order = itertools.count()  # Порядок при равном времени
+
+    def __len__(self):
+        return len(self._heap)
+
+    def schedule(self, event, delay: float):
+        """
+        Разбудить событие через delay секунд (перепланирует, если уже в очереди).
+
+        Args:
+            event: GameEvent (нужны wake_at и wake())
+            delay: Задержка в секундах
+        """
+        wake_at = self.time + delay
+        event.wake_at = wake_at
+        heapq.heappush(self._heap, (wake_at, next(self._order), event))
+
+    def cancel(self, event):
+        """Отменяет пробуждение (запись в куче станет устаревшей)"""
+        event.wake_at = None
+
+    def is_scheduled(self, event) -> bool:
+        return event.wake_at is not None
+
+    def update(self, delta_time: float) -> int:
+        """
+        Продвигает время и будит события, чье время пришло.
+
+        Returns:
+            сколько событий разбужено
+        """
+        self.time += delta_time
+        heap = self._heap
+        woken = 0
+        while heap and heap[0][0] <= self.time:
+            wake_at, _, event = heapq.heappop(heap)
+            if event.wake_at != wake_at:
+                continue  # Отменено или перепланировано
+            event.wake_at = None
+            event.wake()
+            woken += 1
+        return woken
+
+    def clear(self):
+        for _, _, event in self._heap:
+            event.wake_at = None
+        self._heap.clear()
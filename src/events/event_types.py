@@ -0,0 +1,10 @@
+from ..core.registry import Registry
+
+# Типы событий из Tiled (type объекта) -> класс события.
+# Классы грузятся при первом событии своего типа; сторонние пакеты могут
+# добавить типы через entry points группы "itcubia.event_types".
+# Конструктор: (event_id, rect, properties). Неизвестные типы - базовый GameEvent.
+event_types = Registry("event_types", entry_point_group="itcubia.event_types")
+
+event_types.register("chest", "src.events.chest_event:ChestEvent")
+event_types.register("teleport", "src.events.teleport_event:TeleportEvent")
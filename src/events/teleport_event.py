@@ -1,8 +1,15 @@
+import logging
 from typing import Dict, Any
 
 from  .event import GameEvent
 
 class TeleportEvent(GameEvent):
+    """Событие телепорта на другую карту"""
+
+    __slots__ = ("target_map", "target_x", "target_y")
+
+    logger = logging.getLogger(f"{__name__}.TeleportEvent")
+
     def __init__(self, event_id: str, rect: tuple, properties: Dict[str, Any]):
         super().__init__(event_id, "teleport", rect, properties)
 
@@ -0,0 +1,148 @@
+import logging
+
+
+class _Occupancy:
+    """Что известно о сущности: клетки, кандидаты и зоны, в которых она стоит"""
+
+    __slots__ = ("cells", "version", "candidates", "inside")
+
+    def __init__(self):
+        self.cells = None  # (col0, row0, col1, row1) - клетки, которые накрывает сущность
+        self.version = -1  # Версия индекса зон, по которой выбраны кандидаты
+        self.candidates = ()  # Зоны из этих клеток
+        self.inside = {}  # Зоны, в которых сущность сейчас (упорядоченное множество)
+
+
+class TriggerSystem:
+    """
+    Триггерные зоны с событиями входа, пребывания и выхода.
+
+    Зоны (GameEvent и все, у кого есть rect = (x, y, width, height)) лежат
+    в сеточном индексе. Для каждой сущности запоминаются клетки, которые она
+    накрывает, и зоны-кандидаты из них - индекс запрашивается заново только
+    при переходе через границу клетки или изменении набора зон. Каждый кадр
+    сущность проверяется лишь против своих кандидатов.
+
+    Колбэки получают (zone, entity, context):
+        on_enter - первый кадр в зоне
+        on_stay - каждый кадр в зоне (включая первый, после on_enter)
+        on_exit - сущность вышла из зоны или зона удалена
+    """
+
+    def __init__(self, cell_size: float = 128, on_enter=None, on_stay=None, on_exit=None):
+        self.logger = logging.getLogger(f"{self.__class__.__module__}.{self.__class__.__name__}")
+        self.cell_size = cell_size
+        self.on_enter = on_enter
+        self.on_stay = on_stay
+        self.on_exit = on_exit
+
+        self._cells = {}  # (col, row) -> [зоны]
+        self._version = 0
+        self._tracked = {}  # сущность -> _Occupancy
+
+        # Статистика (для отладки)
+        self.queries = 0
+
+    # ЗОНЫ
+    def _zone_cells(self, zone):
+        x, y, width, height = zone.rect
+        size = self.cell_size
+        for col in range(int(x // size), int((x + width) // size) + 1):
+            for row in range(int(y // size), int((y + height) // size) + 1):
+                yield col, row
+
+    def add_zone(self, zone):
+        for cell in self._zone_cells(zone):
+            self._cells.setdefault(cell, []).append(zone)
+        self._version += 1
+
+    def remove_zone(self, zone, context=None):
+        """Убирает зону. Сущности внутри нее получают on_exit"""
+        for cell in self._zone_cells(zone):
+            bucket = self._cells.get(cell)
+            if bucket and zone in bucket:
+                bucket.remove(zone)
+                if not bucket:
+                    del self._cells[cell]
+        self._version += 1
+
+        for entity, occupancy in self._tracked.items():
+            if zone in occupancy.inside:
+                del occupancy.inside[zone]
+                if self.on_exit:
+                    self.on_exit(zone, entity, context)
+
+    def clear(self):
+        self._cells.clear()
+        self._tracked.clear()
+        self._version += 1
+
+    # СУЩНОСТИ
+    def update(self, entity, context=None):
+        """
+        Обновляет занятость зон для сущности и вызывает колбэки.
+
+        Args:
+            entity: Спрайт (center_x, center_y, width, height)
+            context: Передается в колбэки как есть (например, GameState)
+        """
+        occupancy = self._tracked.get(entity)
+        if occupancy is None:
+            occupancy = self._tracked[entity] = _Occupancy()
+
+        half_width = entity.width / 2
+        half_height = entity.height / 2
+        left = entity.center_x - half_width
+        bottom = entity.center_y - half_height
+        right = entity.center_x + half_width
+        top = entity.center_y + half_height
+
+        size = self.cell_size
+        cells = (int(left // size), int(bottom // size), int(right // size), int(top // size))
+        if cells != occupancy.cells or occupancy.version != self._version:
+            occupancy.cells = cells
+            occupancy.version = self._version
+            occupancy.candidates = self._query(cells)
+
+        # Та же проверка, что в GameEvent.check_collision (касание границ не считается)
+        inside = {}
+        for zone in occupancy.candidates:
+            x, y, width, height = zone.rect
+            if left < x + width and right > x and bottom < y + height and top > y:
+                inside[zone] = None
+
+        previous = occupancy.inside
+        occupancy.inside = inside
+
+        if self.on_exit:
+            for zone in previous:
+                if zone not in inside:
+                    self.on_exit(zone, entity, context)
+        for zone in inside:
+            if zone not in previous and self.on_enter:
+                self.on_enter(zone, entity, context)
+            if self.on_stay:
+                self.on_stay(zone, entity, context)
+
+    def _query(self, cells):
+        """Зоны из прямоугольника клеток без повторов"""
+        self.queries += 1
+        col0, row0, col1, row1 = cells
+        found = {}
+        for col in range(col0, col1 + 1):
+            for row in range(row0, row1 + 1):
+                for zone in self._cells.get((col, row), ()):
+                    found[zone] = None
+        return tuple(found)
+
+    def zones_of(self, entity):
+        """Зоны, в которых сущность была на последнем update"""
+        occupancy = self._tracked.get(entity)
+        return tuple(occupancy.inside) if occupancy else ()
+
+    def forget(self, entity, context=None):
+        """Перестает следить за сущностью (on_exit для всех ее зон)"""
+        occupancy = self._tracked.pop(entity, None)
+        if occupancy and self.on_exit:
+            for zone in occupancy.inside:
+                self.on_exit(zone, entity, context)
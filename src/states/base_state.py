@@ -9,6 +9,10 @@ class BaseState:
     Базовый класс для всех состояний.
     """
 
+    # Камера мира показывает фиксированный обзор с черными полосами (игра),
+    # иначе - весь экран (лобби, меню)
+    fixed_view = False
+
     def __init__(self, state_id: str, gsm, asset_loader=None):
         self.logger = logging.getLogger(self.__class__.__name__)
 
@@ -24,6 +28,9 @@ class BaseState:
         self.tile_size = C.TILE_SIZE
         self.scale_factor = C.SCALE_FACTOR
 
+        # Раскладка UI по точкам привязки (LayoutEngine), если она есть
+        self.layout = None
+
     def on_enter(self, **kwargs):
         """Вход в состояние"""
         pass
@@ -48,10 +55,42 @@ class BaseState:
         """Возобновление"""
         pass
 
+    def apply_layout(self, screen):
+        """
+        Подгоняет камеры и UI под окно. Вызывается при смене размера окна
+        и сразу после входа в состояние (без отложенных обновлений).
+
+        Args:
+            screen: ScreenLayout (src.ui.layout.screen_layout)
+        """
+        camera = getattr(self, 'camera', None)
+        if camera:
+            camera.viewport = screen.viewport_rect if self.fixed_view else screen.screen_rect
+
+        # UI камера - всегда полный экран
+        default_camera = getattr(self, 'default_camera', None)
+        if default_camera:
+            default_camera.viewport = screen.screen_rect
+
+        if self.layout:
+            self.layout.apply(screen)
+
+    def is_animating(self) -> bool:
+        """Меняется ли картинка без ввода (если нет - FramePacer снижает частоту)"""
+        return False
+
     def handle_key_press(self, key: int, modifiers: int):
         """Обработка клавиш"""
         pass
 
+    def on_action(self, action: str):
+        """
+        Нажато действие ("up", "select", "escape", ...). Приходит только
+        активному состоянию и только в момент нажатия - опрашивать
+        InputManager каждый кадр не нужно.
+        """
+        pass
+
     def handle_key_release(self, key: int, modifiers: int):
         """Обработка отпускания"""
         pass
\ No newline at end of file
@@ -31,31 +31,35 @@ class CheatConsoleState(BaseState):
         self.history_cursor = 0
 
     def handle_key_press(self, key, modifiers):
+        # Действия именно этой клавиши (а не все зажатые): нужен и код клавиши для набора
+        actions = self.gsm.input_manager.actions_for_key(key)
         if "|" in self.input_buffer:
             first_part, second_part = self.input_buffer.split("|")
-            if self.gsm.input_manager.get_action("select"):
+            if "select" in actions:
                 self._execute_command(first_part + second_part)
+                # Команда могла изменить игру под консолью (телепорт, отладка)
+                self.gsm.invalidate_background()
                 self._add_to_list(first_part + second_part)
                 self.input_buffer = "|"
                 self.can_close = True
 
-            elif self.gsm.input_manager.get_action("left") and self.input_buffer.startswith("|"):
+            elif "left" in actions and self.input_buffer.startswith("|"):
                 self.input_buffer = self.input_buffer[1:]
             else:
                 self.input_buffer = self.gsm.input_manager.typing(key, first_part, second_part)
         else:
-            if self.gsm.input_manager.get_action("select"):
+            if "select" in actions:
                 self.input_buffer = self.history[self.history_cursor] + "|"
-            elif self.gsm.input_manager.get_action("right"):
+            elif "right" in actions:
                 self.input_buffer = "|" + self.input_buffer
-            elif self.gsm.input_manager.get_action("up"):
+            elif "up" in actions:
                 if self.history_cursor > 0:
                     self.history_cursor -= 1
-            elif self.gsm.input_manager.get_action("down"):
+            elif "down" in actions:
                 if self.history_cursor < len(self.history) - 1:
                     self.history_cursor += 1
 
-        if self.gsm.input_manager.get_action("cheat_console") or self.gsm.input_manager.get_action("escape"):
+        if "cheat_console" in actions or "escape" in actions:
             self.gsm.pop_overlay()
 
     def _add_to_list(self, text):
@@ -183,6 +187,10 @@ class CheatConsoleState(BaseState):
     def on_exit(self):
         pass
 
+    def is_animating(self) -> bool:
+        """Консоль анимируется, пока печатает ответ"""
+        return bool(self.text_to_draw or self.current_line or self.can_close)
+
     def update(self, delta_time: float):
         self.count_to_text += delta_time
         if len(self.text_to_draw) == 0 and self.can_close:
@@ -258,6 +266,20 @@ class CheatConsoleState(BaseState):
                     "..."
                 ]
 
+        elif command.startswith("OPEN_"):
+            # Открыть сундук по id события: OPEN_CHEST_1 (консоль печатает заглавными, id - строчные)
+            event_id = command[len("OPEN_"):].lower()
+            state = self.gsm.current_state
+            event_manager = getattr(getattr(state, "map_loader", None), "event_manager", None)
+            chest = event_manager.get_chest_by_id(event_id) if event_manager else None
+            if chest is None:
+                self.text_to_draw = ["Нет такого сундука.", event_id, "..."]
+            elif chest.is_empty:
+                self.text_to_draw = ["Он уже пуст.", "Жадность - грех"]
+            else:
+                chest._open_chest(state.player)
+                self.text_to_draw = ["Замки для смертных.", f"{event_id} открыт"]
+
         elif command == "DEBUGON":
             player = self.gsm.current_state.player
             player.debug_collisions = True
@@ -266,6 +288,24 @@ class CheatConsoleState(BaseState):
                                  "Загляни в неизведанное. Но не везде..."]
 
 
+        elif command == "PROFCSV":
+            path = self.gsm.frame_profiler.dump_csv()
+            self.text_to_draw = ["Я всё записал.",
+                                 f"{len(self.gsm.frame_profiler.history)} кадров",
+                                 path]
+
+        elif command == "TRACEON":
+            self.gsm.start_trace()
+            self.text_to_draw = ["Я слежу за каждым твоим кадром.",
+                                 "Запись трассы начата"]
+
+        elif command == "TRACEOFF":
+            path = self.gsm.stop_trace()
+            if path:
+                self.text_to_draw = ["Трасса сохранена:", path, "Открой её в chrome://tracing"]
+            else:
+                self.text_to_draw = ["Нечего сохранять.", "Сначала TRACEON"]
+
         elif command == "DEBUGOFF":
             player = self.gsm.current_state.player
             player.debug_collisions = False
@@ -1,14 +1,17 @@
 import logging
 import arcade
-from arcade import SpriteList, camera, Camera2D
+from arcade import SpriteList, Camera2D
 
 from .base_state import BaseState
 from ..entities import Player
 from ..ui.health_bar import HealthBar
 from ..ui.vertical_bar import VerticalBar
+from ..ui.layout import LayoutEngine
 from src.world.camera import Camera
 from ..world.map_loader import MapLoader
 from config import constants as C
+from ..core.frame_profiler import frame_profiler
+from ..systems.animation_system import animation_system
 
 
 
@@ -18,6 +21,8 @@ class GameplayState(BaseState):
     Здесь происходит вся игровая логика.
     """
 
+    fixed_view = True
+
     def __init__(self, gsm, asset_loader):
         super().__init__("game", gsm, asset_loader)
 
@@ -52,6 +57,9 @@ class GameplayState(BaseState):
         if not success:
             print("⚠️ Не удалось загрузить Tiled карту, используем fallback")
 
+        # Камера (одна логика следования и зажима по границам карты)
+        self.camera = Camera(self.gsm.window.width, self.gsm.window.height, edge_buffer=self.tile_size)
+
         self.map_left = 0
         self.map_bottom = 0
         self.map_right = 0
@@ -63,9 +71,6 @@ class GameplayState(BaseState):
         # Получаем слой коллизий
         self.collision_layer = self.map_loader.get_collision_layer()
 
-        # Камера
-        self.camera = arcade.camera.Camera2D()
-
         # 6. Настраиваем игрока
         # Получаем позицию из game_data
         pos = self.player.data.get_player_position()
@@ -75,66 +80,55 @@ class GameplayState(BaseState):
         # 7. Скорость игрока пропорциональна размеру тайлов
         self.player.speed = self.tile_size / 8  # 8 пикселей за кадр для 64px тайла
 
-        # UI элементы
+        # Для карт с чанками - область вокруг игрока нужна сразу
+        self.map_loader.preload_around(self.player.center_x, self.player.center_y)
+
+        # UI элементы. Позиции - в пикселях обзора VIEWPORT_WIDTH x VIEWPORT_HEIGHT
+        # от точки привязки, раскладка пересчитывается только при смене размера окна
         self.ui_elements = []
+        self.layout = LayoutEngine()
 
-        # Вертикальная полоска 1 (слева) - фиксированная позиция при 1280x768
+        # Вертикальная полоска 1 (слева сверху)
         self.deepseek_bar = VerticalBar(
-            x=15,  # Отступ от левого края при 1280px
-            y=550,  # Отступ сверху при 768px (768 - 2*64 - 64)
+            x=15,
+            y=550,
             width=15,
             height=150,
             bg_color=arcade.color.PURPLE_NAVY,
             fill_color=arcade.color.PURPLE,
             icon_texture=asset_loader.load_ui_texture("deepseek")
         )
+        self.layout.add(self.deepseek_bar, "top_left", x=15, y=550 - C.VIEWPORT_HEIGHT)
         self.ui_elements.append(self.deepseek_bar)
 
         # Вертикальная полоска 2 (рядом с первой)
         self.fatigue_bar = VerticalBar(
-            x=50,  # Отступ от левого края при 1280px
-            y=550,  # Такая же высота как у первой
+            x=50,
+            y=550,
             width=15,
             height=150,
             bg_color=arcade.color.FRENCH_BEIGE,
             fill_color=arcade.color.BEIGE,
             icon_texture=asset_loader.load_ui_texture("fatigue")
         )
+        self.layout.add(self.fatigue_bar, "top_left", x=50, y=550 - C.VIEWPORT_HEIGHT)
         self.ui_elements.append(self.fatigue_bar)
 
-        # Шкала здоровья (снизу слева) - фиксированная позиция
+        # Шкала здоровья (снизу слева)
         self.health_bar = HealthBar(
             self.player,
-            x=150,  # Отступ от левого края при 1280px
-            y=50,  # Отступ от нижнего края при 768px
+            x=150,
+            y=50,
             width=200,
             height=20
         )
+        self.layout.add(self.health_bar, "bottom_left", x=150, y=50)
         self.ui_elements.append(self.health_bar)
 
-        # Сохраняем оригинальные координаты для масштабирования
-        for ui_element in self.ui_elements:
-            ui_element.original_x = ui_element.x
-            ui_element.original_y = ui_element.y
-            if hasattr(ui_element, 'width'):
-                ui_element.original_width = ui_element.width
-            if hasattr(ui_element, 'height'):
-                ui_element.original_height = ui_element.height
-
         # Устанавливаем начальные значения
         self.deepseek_bar.set_value(75, 100)
         self.fatigue_bar.set_value(30, 100)
 
-    def setup_map_limits(self, left, bottom, width, height):
-        """Устанавливает границы карты с учетом камеры"""
-        self.map_left = left
-        self.map_bottom = bottom
-        self.map_right = left + width
-        self.map_top = bottom + height
-
-        # Логируем границы для отладки
-        self.logger.debug(
-            f"Границы карты: L={self.map_left}, R={self.map_right}, B={self.map_bottom}, T={self.map_top}")
     def teleport_to(self, x: int, y: int, map: str = None):
         """
         Телепортирует игрока в указанные координаты.
@@ -142,7 +136,8 @@ class GameplayState(BaseState):
         """
         # Если нужно сменить карту
         if map:
-            path = f"maps/{map}.tmx"
+            # Без расширения - карта Tiled, иначе (.txt, .chunks) как указано
+            path = f"maps/{map}" if "." in map else f"maps/{map}.tmx"
             self.logger.info(f"Смена карты: {map}")
 
 
@@ -169,20 +164,10 @@ class GameplayState(BaseState):
         # Обновляем данные игрока
         self.player.data.set_player_position(tile_x, tile_y, map)
 
-        target_x = self.player.center_x
-        target_y = self.player.center_y
-
-        # 3. ОГРАНИЧЕНИЕ ПОЗИЦИИ (Замена set_map_bounds)
-        # Учитываем половину размера экрана, чтобы камера не показывала пустоту за краем
-        half_screen_w = self.gsm.window.width / 2
-        half_screen_h = self.gsm.window.height / 2
-
-        # Зажимаем камеру между границами карты
-        final_x = max(self.map_left + half_screen_w, min(target_x, self.map_right - half_screen_w))
-        final_y = max(self.map_bottom + half_screen_h, min(target_y, self.map_top - half_screen_h))
+        self.map_loader.preload_around(self.player.center_x, self.player.center_y)
 
-        # 4. ПРИМЕНЕНИЕ (Для мгновенного следования)
-        self.camera.position = (final_x, final_y)
+        # Камера мгновенно переезжает к игроку (с учетом границ карты)
+        self.camera.snap_to(self.player.center_x, self.player.center_y)
 
         self.logger.info(f"Телепорт в ({x}, {y}) на карте: {map or 'текущая'}")
         return True
@@ -214,6 +199,10 @@ class GameplayState(BaseState):
         print("▶️ ИГРА ВОЗОБНОВЛЕНА")
         self.is_paused = False
 
+    def is_animating(self) -> bool:
+        """Мир живёт всегда, пока игра не на паузе"""
+        return not self.is_paused
+
     def _handle_camera_input(self):
         """Обработка ввода для управления камерой"""
         if not self.input_manager:
@@ -223,21 +212,6 @@ class GameplayState(BaseState):
         # Нужно добавить соответствующие действия в InputManager
         # Пока оставим как TODO
 
-    def on_resize(self, width: int, height: int):
-        """Обновление при изменении размера окна"""
-        # Обновляем позиции UI элементов
-        if hasattr(self, 'ui_elements'):
-            for ui_element in self.ui_elements:
-                if hasattr(ui_element, 'on_resize'):
-                    ui_element.on_resize(width, height)
-
-        # Обновляем позиции вертикальных полосок
-        if hasattr(self, 'deepseek_bar'):
-            self.deepseek_bar.y = height - 2 * self.tile_size
-
-        if hasattr(self, 'fatigue_bar'):
-            self.fatigue_bar.y = height - 2 * self.tile_size
-
     def setup_map_limits(self, left, bottom, width, height):
         """Устанавливает границы карты с учетом камеры"""
         self.map_left = left
@@ -245,6 +219,9 @@ class GameplayState(BaseState):
         self.map_right = left + width
         self.map_top = bottom + height
 
+        # Камера пересчитает свои границы зажима
+        self.camera.set_map_bounds(left, bottom, width, height)
+
         # Логируем границы для отладки
         self.logger.debug(
             f"Границы карты: L={self.map_left}, R={self.map_right}, B={self.map_bottom}, T={self.map_top}")
@@ -254,51 +231,23 @@ class GameplayState(BaseState):
         if self.is_paused:
             return
 
-        self._handle_input()
-        self.player.update(delta_time, collision_layer=self.collision_layer)
+        with frame_profiler.section("player"):
+            self.player.update(delta_time, collision_layer=self.collision_layer)
+
+        # Общие часы анимаций: шаги игрока, анимированные тайлы (на паузе стоят)
+        animation_system.update(delta_time)
 
         # Обновляем события
         if hasattr(self.map_loader, 'event_manager') and self.map_loader.event_manager:
             self.map_loader.event_manager.update(delta_time)
-            self.map_loader.event_manager.check_collisions(self.player, self)
-
-        target_x = self.player.center_x
-        target_y = self.player.center_y
-
-        # Получаем реальные размеры viewport камеры
-        if hasattr(self.camera, 'viewport'):
-            viewport_rect = self.camera.viewport
-            half_screen_w = viewport_rect.width / 2
-            half_screen_h = viewport_rect.height / 2
-        else:
-            # Запасной вариант
-            half_screen_w = self.gsm.window.width / 2
-            half_screen_h = self.gsm.window.height / 2
-
-        # Увеличиваем границы на 1 тайл для плавного скроллинга
-        tile_buffer = self.tile_size
-
-        # Зажимаем камеру между границами карты с буфером
-        final_x = max(self.map_left + half_screen_w - tile_buffer,
-                      min(target_x, self.map_right - half_screen_w + tile_buffer))
-        final_y = max(self.map_bottom + half_screen_h - tile_buffer,
-                      min(target_y, self.map_top - half_screen_h + tile_buffer))
-
-        # Если карта меньше экрана - центрируем
-        if (self.map_right - self.map_left) < (half_screen_w * 2 - tile_buffer * 2):
-            final_x = (self.map_left + self.map_right) / 2
+            with frame_profiler.section("events"):
+                self.map_loader.event_manager.check_collisions(self.player, self)
 
-        if (self.map_top - self.map_bottom) < (half_screen_h * 2 - tile_buffer * 2):
-            final_y = (self.map_bottom + self.map_top) / 2
+        # Камера плавно следует за игроком
+        self.camera.follow_player(self.player.center_x, self.player.center_y, delta_time)
 
-        # Плавное следование камеры
-        current_x, current_y = self.camera.position
-        lerp_factor = 0.1  # Коэффициент плавности
-
-        final_x = current_x + (final_x - current_x) * lerp_factor
-        final_y = current_y + (final_y - current_y) * lerp_factor
-
-        self.camera.position = (final_x, final_y)
+        # Для карт с чанками - подгружаем область вокруг камеры
+        self.map_loader.update_streaming(*self.camera.position)
 
         # Обновляем UI
         for ui_element in self.ui_elements:
@@ -314,10 +263,14 @@ class GameplayState(BaseState):
             self._clear_viewport_borders()
 
         # Рисуем карту
-        self.map_loader.draw()
+        with frame_profiler.section("map_draw"):
+            self.map_loader.draw()
         self.map_loader.event_manager.draw()
         self.player_list.draw()
 
+        if frame_profiler.enabled:
+            frame_profiler.set_count("sprites", self.map_loader.get_sprite_count() + len(self.player_list))
+
         # Отладочная информация
         if hasattr(self.player, 'debug_collisions') and self.player.debug_collisions:
             self.player.draw_debug()
@@ -337,30 +290,33 @@ class GameplayState(BaseState):
         # Переключаемся на UI камеру
         self.default_camera.use()
 
-        # Координаты игрока
-        if self.player.debug_collisions:
-            text = f"x:{int(self.player.center_x // self.tile_size)} y:{int(self.player.center_y // self.tile_size)}"
-            arcade.Text(text,
-                        self.gsm.window.width - 3 * self.tile_size,
-                        self.gsm.window.height - self.tile_size,
-                        arcade.color.LIME,
-                        18).draw()
-
-        # Рисуем UI элементы
-        for ui_element in self.ui_elements:
-            ui_element.draw()
-
-    def _handle_input(self):
-        """Обработка ввода для игрового состояния"""
-        if not self.input_manager:
-            return
+        with frame_profiler.section("ui"):
+            # Координаты игрока
+            if self.player.debug_collisions:
+                text = f"x:{int(self.player.center_x // self.tile_size)} y:{int(self.player.center_y // self.tile_size)}"
+                arcade.Text(text,
+                            self.gsm.window.width - 3 * self.tile_size,
+                            self.gsm.window.height - self.tile_size,
+                            arcade.color.LIME,
+                            18).draw()
+
+            # Рисуем UI элементы
+            for ui_element in self.ui_elements:
+                ui_element.draw()
 
+    def on_action(self, action: str):
+        """Действия игрового состояния (движение игрок читает сам из InputManager)"""
         # ESC - открыть меню паузы
-        if self.input_manager.get_action("escape"):
+        if action == "escape":
             print("🔼 Нажата пауза")
             self._open_pause_menu()
-        if self.input_manager.get_action("cheat_console"):  # F2
+        elif action == "cheat_console":  # F2
             self.gsm.push_overlay("cheat_console")
+        elif action == "select":
+            # Взаимодействие с событием рядом (сундук)
+            event_manager = getattr(self.map_loader, 'event_manager', None)
+            if event_manager:
+                event_manager.interact(self.player, self)
 
     def _init_ui(self):
         """Инициализирует UI элементы"""
@@ -42,21 +42,6 @@ class LobbyState(BaseState):
         # Сбрасываем таймеры
         self.last_key_time = time.time()
 
-        # Принудительно обновляем камеру при входе
-        if self.gsm and self.gsm.window:
-            width, height = self.gsm.window.get_size()
-            self._update_camera_on_enter(width, height)
-
-    def _update_camera_on_enter(self, width: int, height: int):
-        """Обновляет камеру при входе в состояние"""
-        # Для лобби используем полный экран
-        if hasattr(self, 'camera') and self.camera:
-            self.camera.viewport = arcade.rect.XYWH(
-                width // 2,
-                height // 2,
-                width,
-                height
-            )
     def on_exit(self):
         """Выход из лобби"""
         print("ВЫХОД ИЗ ЛОББИ")
@@ -160,35 +145,32 @@ class LobbyState(BaseState):
             )
             text.draw()
 
-    def handle_key_press(self, key: int, modifiers: int):
-        """Обработка нажатия клавиш"""
-        if not self.gsm.input_manager:
-            return
-
+    def on_action(self, action: str):
+        """Обработка нажатых действий"""
         # Проверяем кд (чтобы не было слишком быстрых нажатий)
         current_time = time.time()
         if current_time - self.last_key_time < self.key_cooldown:
             return
 
         # Навигация ВВЕРХ
-        if self.gsm.input_manager.get_action("up"):
+        if action == "up":
             self.selected_index = max(0, self.selected_index - 1)
             self._play_menu_sound("select")
             self.last_key_time = current_time
 
         # Навигация ВНИЗ
-        elif self.gsm.input_manager.get_action("down"):
+        elif action == "down":
             self.selected_index = min(len(self.menu_items) - 1, self.selected_index + 1)
             self._play_menu_sound("select")
             self.last_key_time = current_time
 
         # Выбор пункта (ENTER/E)
-        elif self.gsm.input_manager.get_action("select"):
+        elif action == "select":
             self._select_menu_item()
             self.last_key_time = current_time
 
         # Выход (ESC)
-        elif self.gsm.input_manager.get_action("escape"):
+        elif action == "escape":
             self._confirm_exit()
             self.last_key_time = current_time
 
@@ -20,22 +20,22 @@ class LockPickingState(BaseState):
         if self.chest_event:
             self.status_text = f"Взломайте замок ({len(self.chest_event.lock_sequence)} символов)"
 
-    def handle_key_press(self, key, modifiers):
+    def on_action(self, action: str):
         if not self.chest_event:
             return
 
         # Влево
-        if self.gsm.input_manager.get_action("left"):
+        if action == "left":
             success, completed, sequence = self.chest_event.check_lock_attempt("<")
             self._handle_lock_result(success, completed, sequence)
 
         # Вправо
-        elif self.gsm.input_manager.get_action("right"):
+        elif action == "right":
             success, completed, sequence = self.chest_event.check_lock_attempt(">")
             self._handle_lock_result(success, completed, sequence)
 
         # Отмена
-        elif self.gsm.input_manager.get_action("escape"):
+        elif action == "escape":
             print("❌ Взлом отменен")
             self.gsm.pop_overlay()
 
@@ -45,6 +45,8 @@ class LockPickingState(BaseState):
         if completed:
             if success:
                 self.chest_event._open_chest(self.player)
+                # Сундук под overlay'ем сменил текстуру
+                self.gsm.invalidate_background()
                 self.status_text = "Замок взломан!"
                 # Закрываем через 1 секунду
                 arcade.schedule(self._close_overlay, 1.0)
@@ -120,31 +120,28 @@ class PauseMenuState(BaseState):
             ).draw()
 
 
-    def handle_key_press(self, key, modifiers):
-        """Обработка клавиш в меню паузы"""
-        if not self.gsm.input_manager:
-            return
-
+    def on_action(self, action: str):
+        """Обработка действий в меню паузы"""
         current_time = time.time()
         if current_time - self.last_key_time < self.key_cooldown:
             return
 
         # Навигация
-        if self.gsm.input_manager.get_action("up"):
+        if action == "up":
             self.selected_index = max(0, self.selected_index - 1)
             self.last_key_time = current_time
 
-        elif self.gsm.input_manager.get_action("down"):
+        elif action == "down":
             self.selected_index = min(len(self.menu_items) - 1, self.selected_index + 1)
             self.last_key_time = current_time
 
         # Выбор (ENTER)
-        elif self.gsm.input_manager.get_action("select"):
+        elif action == "select":
             self._select_menu_item()
             self.last_key_time = current_time
 
         # Назад (ESC) - закрыть меню паузы
-        elif self.gsm.input_manager.get_action("escape"):
+        elif action == "escape":
             self._close_pause_menu()
             self.last_key_time = current_time
 
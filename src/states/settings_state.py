@@ -16,6 +16,8 @@ class SettingsState(BaseState):
         # Пункты меню настроек
         self.menu_items = [
             {"text": "ГРОМКОСТЬ", "action": "volume", "value": 70},
+            {"text": "ЭНЕРГОСБЕРЕЖЕНИЕ", "action": "idle_throttle",
+             "toggle": self.game_data.settings.get("idle_throttle", True)},
             {"text": "УПРАВЛЕНИЕ", "action": "controls"},
             {"text": "ГРАФИКА", "action": "graphics"},
             {"text": "НАЗАД", "action": "back"}
@@ -160,6 +162,8 @@ class SettingsState(BaseState):
             # Текст пункта
             if "value" in item:
                 text = f"{item['text']}: {item['value']}%"
+            elif "toggle" in item:
+                text = f"{item['text']}: {'ВКЛ' if item['toggle'] else 'ВЫКЛ'}"
 
             arcade.Text(
                 text,
@@ -173,39 +177,37 @@ class SettingsState(BaseState):
                 bold=is_bold
             ).draw()
 
-    def handle_key_press(self, key, modifiers):
-        """Обработка клавиш в настройках"""
-        if not self.gsm.input_manager:
-            return
+    def on_action(self, action: str):
+        """Обработка действий в настройках"""
         current_time = time.time()
         if current_time - self.last_key_time < self.key_cooldown:
             return
 
         # Навигация
-        if self.gsm.input_manager.get_action("up"):
+        if action == "up":
             self.selected_index = max(0, self.selected_index - 1)
             self.last_key_time = current_time
 
-        elif self.gsm.input_manager.get_action("down"):
+        elif action == "down":
             self.selected_index = min(len(self.menu_items) - 1, self.selected_index + 1)
             self.last_key_time = current_time
 
         # Изменение значений
-        elif self.gsm.input_manager.get_action("left"):
+        elif action == "left":
             self._change_value(-10)
             self.last_key_time = current_time
 
-        elif self.gsm.input_manager.get_action("right"):
+        elif action == "right":
             self._change_value(+10)
             self.last_key_time = current_time
 
         # Выбор
-        elif self.gsm.input_manager.get_action("select"):
+        elif action == "select":
             self._select_menu_item()
             self.last_key_time = current_time
 
         # Назад
-        elif self.gsm.input_manager.get_action("escape"):
+        elif action == "escape":
             self._go_back()
             self.last_key_time = current_time
 
@@ -219,6 +221,18 @@ class SettingsState(BaseState):
                 new_value = max(0, min(100, item["value"] + delta))
                 item["value"] = new_value
                 print(f"Громкость изменена: {new_value}%")
+            elif "toggle" in item:
+                self._toggle_item(item)
+
+    def _toggle_item(self, item):
+        """Переключает пункт ВКЛ/ВЫКЛ и применяет настройку"""
+        item["toggle"] = not item["toggle"]
+        self.game_data.settings[item["action"]] = item["toggle"]
+
+        if item["action"] == "idle_throttle":
+            frame_pacer = getattr(self.gsm.window, 'frame_pacer', None)
+            if frame_pacer:
+                frame_pacer.set_enabled(item["toggle"])
 
     def _select_menu_item(self):
         """Обрабатывает выбор пункта"""
@@ -228,6 +242,8 @@ class SettingsState(BaseState):
         if selected["action"] == "volume":
             # Уже обрабатывается стрелками
             pass
+        elif selected["action"] == "idle_throttle":
+            self._toggle_item(selected)
         elif selected["action"] == "controls":
             print("Открываем настройки управления...")
         elif selected["action"] == "graphics":
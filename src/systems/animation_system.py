@@ -0,0 +1,252 @@
+import bisect
+import heapq
+import itertools
+import logging
+
+import arcade
+
+# Сдвиг при расчете кадра, чтобы граница кадра, посчитанная с ошибкой
+# округления, не давала тот же кадр (и то же время смены) повторно
+_EPSILON = 1e-9
+
+
+class Animation:
+    """
+    Неизменяемая последовательность кадров (текстур) с длительностями.
+    Один объект на всех, кто проигрывает эту анимацию (все тайлы с одним gid,
+    все шаги игрока вверх) - состояние хранит AnimationSystem.
+    """
+
+    __slots__ = ("frames", "starts", "duration", "loop")
+
+    def __init__(self, frames, frame_time=0.1, loop: bool = True):
+        """
+        Args:
+            frames: Текстуры кадров
+            frame_time: Длительность кадра в секундах - число или по числу на кадр
+            loop: Повторять по кругу (иначе остановиться на последнем кадре)
+        """
+        self.frames = tuple(frames)
+        if isinstance(frame_time, (int, float)):
+            frame_time = [frame_time] * len(self.frames)
+
+        starts = []
+        total = 0.0
+        for seconds in frame_time:
+            starts.append(total)
+            total += seconds
+        self.starts = tuple(starts)  # Начало каждого кадра от начала цикла
+        self.duration = total
+        self.loop = loop
+
+    @classmethod
+    def from_texture_animation(cls, texture_animation):
+        """Анимация тайла Tiled (arcade.TextureAnimation, длительности в мс)"""
+        keyframes = texture_animation.keyframes
+        return cls([keyframe.texture for keyframe in keyframes],
+                   [keyframe.duration / 1000 for keyframe in keyframes])
+
+    def frame_at(self, elapsed: float):
+        """
+        Кадр через elapsed секунд после старта.
+
+        Returns:
+            (индекс кадра, через сколько секунд от старта следующая смена кадра
+             или None, если анимация закончилась)
+        """
+        if len(self.frames) < 2 or self.duration <= 0:
+            return 0, None
+
+        cycle = 0.0
+        if self.loop:
+            cycles = elapsed // self.duration
+            cycle = cycles * self.duration
+            elapsed -= cycle
+        elif elapsed >= self.duration:
+            return len(self.frames) - 1, None
+
+        index = bisect.bisect_right(self.starts, elapsed) - 1
+        if index + 1 < len(self.starts):
+            return index, cycle + self.starts[index + 1]
+        if self.loop:
+            return index, cycle + self.duration
+        return index, self.duration
+
+
+class _Group:
+    """Спрайты, проигрывающие одну анимацию с одного момента (кадр у всех общий)"""
+
+    __slots__ = ("animation", "start", "sprites", "index", "next_change", "on_finish")
+
+    def __init__(self, animation, start, on_finish):
+        self.animation = animation
+        self.start = start
+        self.sprites = {}  # Упорядоченное множество спрайтов
+        self.index = 0
+        self.next_change = None  # Время часов следующей смены кадра (None - не запланирована)
+        self.on_finish = on_finish
+
+
+class AnimationSystem:
+    """
+    Анимации на общих часах.
+
+    Спрайты с одной анимацией и одним моментом старта (анимированные тайлы
+    Tiled стартуют вместе, в 0) объединены в группу, и кадр считается раз на
+    группу. Группы лежат в мин-куче по времени следующей смены кадра, как
+    события в EventScheduler: кадр стоит O(k log n), k - группы, у которых
+    сменился кадр, и текстуры меняются только у их спрайтов. Статичные
+    спрайты в систему не попадают и ничего не стоят.
+    """
+
+    def __init__(self):
+        self.logger = logging.getLogger(f"{self.__class__.__module__}.{self.__class__.__name__}")
+        self.time = 0.0  # Общие часы, секунды (сумма delta_time, пока игра не на паузе)
+
+        self._groups = {}  # (анимация, старт) -> _Group
+        self._by_sprite = {}  # спрайт -> _Group
+        self._heap = []  # (время смены, порядок, группа)
+        self._order = itertools.count()
+        self._converted = {}  # кадры тайла Tiled -> общий Animation
+
+        # Статистика (для отладки)
+        self.textures_changed = 0  # Смен текстуры на последнем update
+
+    def __len__(self):
+        return len(self._by_sprite)
+
+    # ПРОИГРЫВАНИЕ
+    def play(self, sprite, animation: Animation, start: float = None, on_finish=None):
+        """
+        Проигрывает анимацию на спрайте. Текстура первого кадра ставится сразу.
+        Повторный вызов с той же анимацией не перезапускает ее.
+
+        Args:
+            sprite: arcade.Sprite
+            animation: Animation
+            start: Момент старта по часам (None - сейчас). Одинаковый старт
+                   синхронизирует спрайты и объединяет их в группу
+            on_finish: on_finish(sprite) - когда закончилась анимация без повтора
+        """
+        current = self._by_sprite.get(sprite)
+        if current is not None and current.animation is animation and (start is None or current.start == start):
+            return
+
+        if start is None:
+            start = self.time
+        if current is not None:
+            self._detach(sprite, current)
+
+        key = (animation, start)
+        group = self._groups.get(key)
+        if group is None:
+            group = self._groups[key] = _Group(animation, start, on_finish)
+            group.index, next_elapsed = animation.frame_at(self.time - start + _EPSILON)
+            self._schedule(group, next_elapsed)
+
+        group.sprites[sprite] = None
+        self._by_sprite[sprite] = group
+        sprite.texture = animation.frames[group.index]
+
+        if group.next_change is None and not animation.loop:
+            self._finish(group)
+
+    def is_playing(self, sprite, animation: Animation = None) -> bool:
+        group = self._by_sprite.get(sprite)
+        return group is not None and (animation is None or group.animation is animation)
+
+    def stop(self, sprite, texture=None):
+        """Останавливает анимацию спрайта (texture - какую текстуру оставить)"""
+        group = self._by_sprite.get(sprite)
+        if group is not None:
+            self._detach(sprite, group)
+        if texture is not None:
+            sprite.texture = texture
+
+    def stop_all(self, sprites):
+        for sprite in sprites:
+            self.stop(sprite)
+
+    def clear(self):
+        self._groups.clear()
+        self._by_sprite.clear()
+        self._heap.clear()
+
+    # СЛОИ КАРТЫ
+    def add_layer(self, sprite_list) -> list:
+        """
+        Запускает анимированные тайлы слоя (arcade.TextureAnimationSprite из Tiled).
+        Все стартуют в 0 по часам - тайлы с одинаковыми кадрами идут синхронно
+        и попадают в одну группу.
+
+        Returns:
+            список анимированных спрайтов (для stop_all при выгрузке карты)
+        """
+        animated = []
+        for sprite in sprite_list:
+            if not isinstance(sprite, arcade.TextureAnimationSprite) or sprite._animation is None:
+                continue
+            keyframes = tuple((keyframe.texture, keyframe.duration) for keyframe in sprite.animation.keyframes)
+            animation = self._converted.get(keyframes)
+            if animation is None:
+                animation = self._converted[keyframes] = Animation.from_texture_animation(sprite.animation)
+            self.play(sprite, animation, start=0.0)
+            animated.append(sprite)
+        return animated
+
+    # ТИК
+    def update(self, delta_time: float) -> int:
+        """
+        Продвигает часы и меняет текстуры у групп, чей кадр сменился.
+
+        Returns:
+            сколько текстур сменено
+        """
+        self.time += delta_time
+        heap = self._heap
+        changed = 0
+        while heap and heap[0][0] <= self.time:
+            next_change, _, group = heapq.heappop(heap)
+            if group.next_change != next_change or not group.sprites:
+                continue  # Перепланирована или опустела
+
+            index, next_elapsed = group.animation.frame_at(self.time - group.start + _EPSILON)
+            self._schedule(group, next_elapsed)
+            if index != group.index:
+                group.index = index
+                texture = group.animation.frames[index]
+                for sprite in group.sprites:
+                    sprite.texture = texture
+                changed += len(group.sprites)
+
+            if group.next_change is None:
+                self._finish(group)
+
+        self.textures_changed = changed
+        return changed
+
+    def _schedule(self, group, next_elapsed):
+        if next_elapsed is None:
+            group.next_change = None
+            return
+        group.next_change = group.start + next_elapsed
+        heapq.heappush(self._heap, (group.next_change, next(self._order), group))
+
+    def _finish(self, group):
+        """Анимация без повтора дошла до конца: спрайты остаются на последнем кадре"""
+        sprites = list(group.sprites)
+        for sprite in sprites:
+            self._detach(sprite, group)
+        if group.on_finish:
+            for sprite in sprites:
+                group.on_finish(sprite)
+
+    def _detach(self, sprite, group):
+        del group.sprites[sprite]
+        del self._by_sprite[sprite]
+        if not group.sprites:
+            del self._groups[(group.animation, group.start)]
+
+
+# Глобальные часы анимаций (тикает GameplayState, пока игра не на паузе)
+animation_system = AnimationSystem()
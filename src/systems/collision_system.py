@@ -1,4 +1,7 @@
 import logging
+import time
+
+from ..core.frame_profiler import frame_profiler
 
 
 class CollisionSystem:
@@ -23,27 +26,30 @@ class CollisionSystem:
             # Если хитбокса нет - разрешаем движение
             return True, True
 
-        # Получаем углы хитбокса
-        corners = entity.hitbox.get_corners()
+        # Границы хитбокса (углы проверяем без промежуточного списка)
+        left, bottom, right, top = entity.hitbox.get_rect()
+        is_solid = game_map.is_solid_at_pixel
 
         can_move_x = True
         can_move_y = True
 
-        # Проверяем каждый угол с учетом смещения
-        for corner_x, corner_y in corners:
-            # Проверка по X
-            if dx != 0:
-                future_x = corner_x + dx
-                if game_map.is_solid_at_pixel(future_x, corner_y):
-                    can_move_x = False
-                    CollisionSystem.logger.debug(f"Коллизия по X в точке ({future_x}, {corner_y})")
-
-            # Проверка по Y
-            if dy != 0:
-                future_y = corner_y + dy
-                if game_map.is_solid_at_pixel(corner_x, future_y):
-                    can_move_y = False
-                    CollisionSystem.logger.debug(f"Коллизия по Y в точке ({corner_x}, {future_y})")
+        # Проверка по X: все 4 угла со смещением
+        if dx != 0:
+            future_left = left + dx
+            future_right = right + dx
+            if (is_solid(future_left, bottom) or is_solid(future_right, bottom) or
+                    is_solid(future_right, top) or is_solid(future_left, top)):
+                can_move_x = False
+                CollisionSystem.logger.debug("Коллизия по X при смещении %s", dx)
+
+        # Проверка по Y
+        if dy != 0:
+            future_bottom = bottom + dy
+            future_top = top + dy
+            if (is_solid(left, future_bottom) or is_solid(right, future_bottom) or
+                    is_solid(right, future_top) or is_solid(left, future_top)):
+                can_move_y = False
+                CollisionSystem.logger.debug("Коллизия по Y при смещении %s", dy)
 
         return can_move_x, can_move_y
 
@@ -96,10 +102,121 @@ class CollisionSystem:
         if not entity1.collides_with_entities or not entity2.collides_with_entities:
             return False
 
-        # Получаем прямоугольники коллизий
-        left1, bottom1, right1, top1 = entity1.get_collision_rect()
-        left2, bottom2, right2, top2 = entity2.get_collision_rect()
+        # Получаем прямоугольники коллизий и проверяем пересечение
+        return CollisionSystem.rects_overlap(entity1.get_collision_rect(), entity2.get_collision_rect())
+
+    @staticmethod
+    def rects_overlap(rect1, rect2):
+        """
+        Пересекаются ли два прямоугольника (касание границ - тоже пересечение).
 
-        # Проверяем пересечение
+        Args:
+            rect1, rect2: (left, bottom, right, top)
+        """
+        left1, bottom1, right1, top1 = rect1
+        left2, bottom2, right2, top2 = rect2
         return not (right1 < left2 or left1 > right2 or
-                    top1 < bottom2 or bottom1 > top2)
\ No newline at end of file
+                    top1 < bottom2 or bottom1 > top2)
+
+
+class SpatialHashBroadphase:
+    """
+    Broadphase коллизий сущность-сущность: пространственный хэш.
+
+    Каждый тик хитбоксы (get_collision_rect) раскладываются по клеткам
+    cell_size x cell_size, кандидаты - пары из общих клеток. Точная проверка -
+    CollisionSystem.rects_overlap, как в check_entity_collision.
+    Вместо O(N²) проверок - примерно O(N) при равномерной плотности.
+    """
+
+    def __init__(self, cell_size: float = 128):
+        """
+        Args:
+            cell_size: Размер клетки в пикселях. Лучше 1-2 размера типичного хитбокса
+        """
+        self.logger = logging.getLogger(f"{self.__class__.__module__}.{self.__class__.__name__}")
+        self.cell_size = cell_size
+        self._cells = {}
+
+        # Статистика последнего вызова (для профилировщика и отладки)
+        self.entity_count = 0
+        self.candidate_pairs = 0
+        self.collision_pairs = 0
+        self.last_ms = 0.0
+
+        # Накопленная статистика
+        self.calls = 0
+        self.total_ms = 0.0
+
+    def find_pairs(self, entities) -> list:
+        """
+        Пересекающиеся пары сущностей.
+        Сущности с выключенными collision_enabled/collides_with_entities пропускаются.
+
+        Args:
+            entities: Последовательность Entity (список, SpriteList)
+
+        Returns:
+            [(entity1, entity2), ...] - entity1 раньше entity2 в entities
+        """
+        start = time.perf_counter()
+        size = self.cell_size
+        cells = self._cells
+        cells.clear()
+
+        active = []
+        rects = []
+        for entity in entities:
+            if not entity.collision_enabled or not entity.collides_with_entities:
+                continue
+            rect = entity.get_collision_rect()
+            index = len(active)
+            active.append(entity)
+            rects.append(rect)
+
+            left, bottom, right, top = rect
+            for cx in range(int(left // size), int(right // size) + 1):
+                for cy in range(int(bottom // size), int(top // size) + 1):
+                    bucket = cells.get((cx, cy))
+                    if bucket is None:
+                        cells[(cx, cy)] = [index]
+                    else:
+                        bucket.append(index)
+
+        # Кандидаты: индексы в клетке идут по возрастанию, пара (i, j) всегда с i < j.
+        # Сущность в нескольких клетках может дать одну пару дважды - отсюда множество
+        candidates = set()
+        for bucket in cells.values():
+            if len(bucket) < 2:
+                continue
+            for k, i in enumerate(bucket):
+                for j in bucket[k + 1:]:
+                    candidates.add((i, j))
+
+        overlap = CollisionSystem.rects_overlap
+        pairs = [(active[i], active[j]) for i, j in sorted(candidates) if overlap(rects[i], rects[j])]
+
+        elapsed = time.perf_counter() - start
+        self.entity_count = len(active)
+        self.candidate_pairs = len(candidates)
+        self.collision_pairs = len(pairs)
+        self.last_ms = elapsed * 1000
+        self.calls += 1
+        self.total_ms += self.last_ms
+
+        if frame_profiler.enabled:
+            frame_profiler.add_time("broadphase", elapsed)
+            frame_profiler.set_count("entity_candidates", self.candidate_pairs)
+            frame_profiler.set_count("entity_collisions", self.collision_pairs)
+        return pairs
+
+    def get_stats(self) -> dict:
+        """Статистика для профилирования"""
+        return {
+            "entities": self.entity_count,
+            "candidate_pairs": self.candidate_pairs,
+            "collision_pairs": self.collision_pairs,
+            "last_ms": self.last_ms,
+            "mean_ms": self.total_ms / self.calls if self.calls else 0.0,
+            "calls": self.calls,
+        }
\ No newline at end of file
@@ -0,0 +1,181 @@
+import logging
+import time
+
+import numpy as np
+
+# 8 направлений: сначала прямые (при равной дистанции выбираются они), потом диагонали.
+# Индекс 8 - "стоять на месте" (цель, стена или недостижимая клетка)
+DIRECTIONS = ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1))
+NO_DIRECTION = len(DIRECTIONS)
+
+_DIAGONAL = 2 ** -0.5
+UNIT_VECTORS = tuple((dx * _DIAGONAL, dy * _DIAGONAL) if dx and dy else (float(dx), float(dy))
+                     for dx, dy in DIRECTIONS) + ((0.0, 0.0),)
+
+UNREACHED = np.iinfo(np.int32).max
+
+
+class FlowField:
+    """
+    Поле направлений к одной цели (обычно к игроку) по NavigationGrid.
+
+    Одно поле интеграции (BFS-волна от клетки цели, векторизовано NumPy)
+    пересчитывается только когда цель сменила клетку или изменилась карта.
+    Любое число сущностей читает направление за O(1): direction_at / steer,
+    или пачкой через directions_for.
+    """
+
+    def __init__(self, grid, max_distance: int = None):
+        """
+        Args:
+            grid: NavigationGrid (из MapLoader.get_navigation_grid)
+            max_distance: Радиус волны в клетках. Дальше поле не считается -
+                          на больших картах преследователи обычно рядом с игроком
+        """
+        self.logger = logging.getLogger(f"{self.__class__.__module__}.{self.__class__.__name__}")
+        self.grid = grid
+        self.max_distance = max_distance
+
+        stride = grid.stride
+        self._orthogonal = np.array([dx + dy * stride for dx, dy in DIRECTIONS[:4]], dtype=np.int64)
+        self._all = np.array([dx + dy * stride for dx, dy in DIRECTIONS], dtype=np.int64)
+
+        self._grid_version = None
+        self._blocked = None
+
+        size = len(grid.walkable)
+        self.distance = np.full(size, UNREACHED, dtype=np.int32)
+        self.direction = np.full(size, NO_DIRECTION, dtype=np.int8)
+        self._unit = np.array(UNIT_VECTORS, dtype=np.float32)
+
+        self.goal = None  # Индекс клетки цели в сетке
+        self._last_goal = None  # Цель, от которой посчитана текущая волна
+        self.cells = np.empty(0, dtype=np.int64)  # Клетки, до которых дошла волна (кроме цели)
+        self.recomputes = 0
+        self.last_compute_ms = 0.0
+
+    # ЦЕЛЬ
+    def update(self, x: float, y: float) -> bool:
+        """
+        Ставит цель в мировую точку (позицию игрока).
+        Пересчет только если сменилась клетка или версия сетки.
+
+        Returns:
+            True, если поле пересчитано
+        """
+        grid = self.grid
+        col = int(x // grid.tile_size)
+        row = int(y // grid.tile_size)
+        if not grid.in_bounds(col, row):
+            return False
+
+        goal = grid.index(col, row)
+        if goal == self.goal and self._grid_version == grid.version:
+            return False
+
+        self.goal = goal
+        self._compute()
+        return True
+
+    def _compute(self):
+        start = time.perf_counter()
+        grid = self.grid
+        if self._grid_version != grid.version:
+            self._blocked = np.frombuffer(bytes(grid.walkable), dtype=np.uint8) == 0
+            self._grid_version = grid.version
+
+        blocked = self._blocked
+        distance = self.distance
+
+        # Сбрасываем только клетки прошлой волны - с ограниченным радиусом это малая часть карты
+        distance[self.cells] = UNREACHED
+        self.direction[self.cells] = NO_DIRECTION
+        self.cells = np.empty(0, dtype=np.int64)
+        if self._last_goal is not None:
+            distance[self._last_goal] = UNREACHED
+
+        goal = self._last_goal = self.goal
+        if blocked[goal]:
+            # Цель в стене (например, игрок прижат к краю) - поле пустое
+            self.last_compute_ms = (time.perf_counter() - start) * 1000
+            return
+
+        # BFS по фронту: каждый шаг - соседи всего фронта одной операцией
+        distance[goal] = 0
+        frontier = np.array([goal], dtype=np.int64)
+        reached = []
+        step = 0
+        limit = self.max_distance
+        while frontier.size and (limit is None or step < limit):
+            step += 1
+            neighbors = (frontier[:, None] + self._orthogonal).ravel()
+            neighbors = np.unique(neighbors[~blocked[neighbors] & (distance[neighbors] == UNREACHED)])
+            distance[neighbors] = step
+            reached.append(neighbors)
+            frontier = neighbors
+
+        if reached:
+            self.cells = np.concatenate(reached)
+            self._compute_directions()
+        self.recomputes += 1
+        self.last_compute_ms = (time.perf_counter() - start) * 1000
+
+    def _compute_directions(self):
+        """Для каждой достигнутой клетки - сосед с наименьшей дистанцией (без срезания углов)"""
+        distance = self.distance
+        cells = self.cells
+        values = distance[cells[:, None] + self._all].astype(np.int64)
+
+        # Диагональ только если обе прямые клетки проходимы
+        blocked = self._blocked
+        stride = self.grid.stride
+        for k, (dx, dy) in enumerate(DIRECTIONS[4:], start=4):
+            corner = blocked[cells + dx] | blocked[cells + dy * stride]
+            values[corner, k] = UNREACHED
+
+        best = values.argmin(axis=1)
+        downhill = values[np.arange(cells.size), best] < distance[cells]
+        self.direction[cells[downhill]] = best[downhill]
+
+    # ЧТЕНИЕ
+    def direction_at(self, x: float, y: float):
+        """Единичный вектор движения из мировой точки, O(1). (0, 0) - стоять"""
+        grid = self.grid
+        col = int(x // grid.tile_size)
+        row = int(y // grid.tile_size)
+        if not grid.in_bounds(col, row):
+            return UNIT_VECTORS[NO_DIRECTION]
+        return UNIT_VECTORS[self.direction[(row + 1) * grid.stride + col + 1]]
+
+    def steer(self, entity):
+        """Направление для сущности по ее центру"""
+        return self.direction_at(entity.center_x, entity.center_y)
+
+    def distance_at(self, x: float, y: float):
+        """Шагов до цели по полю (None - недостижимо или вне радиуса)"""
+        grid = self.grid
+        col = int(x // grid.tile_size)
+        row = int(y // grid.tile_size)
+        if not grid.in_bounds(col, row):
+            return None
+        value = int(self.distance[(row + 1) * grid.stride + col + 1])
+        return None if value == UNREACHED else value
+
+    def directions_for(self, xs, ys):
+        """
+        Направления для многих агентов сразу.
+
+        Args:
+            xs, ys: массивы мировых координат
+
+        Returns:
+            массив (N, 2) единичных векторов
+        """
+        grid = self.grid
+        cols = np.floor_divide(xs, grid.tile_size).astype(np.int64)
+        rows = np.floor_divide(ys, grid.tile_size).astype(np.int64)
+        inside = (cols >= 0) & (cols < grid.width) & (rows >= 0) & (rows < grid.height)
+
+        codes = np.full(cols.shape, NO_DIRECTION, dtype=np.int8)
+        codes[inside] = self.direction[(rows[inside] + 1) * grid.stride + cols[inside] + 1]
+        return self._unit[codes]
@@ -0,0 +1,444 @@
+import heapq
+import itertools
+import logging
+import time
+from collections import OrderedDict, deque
+
+# Стоимость диагонального шага
+SQRT2 = 2 ** 0.5
+
+# Сколько раскрытий узлов делает поиск между проверками бюджета времени
+EXPANSIONS_PER_SLICE = 32
+
+# Глобальный счетчик версий навигационных сеток (новая карта = новая версия)
+_versions = itertools.count(1)
+
+# Таблица для bytes.translate: 1 (стена) -> 0, 0 -> 1
+_INVERT = bytes([1] + [0] * 255)
+
+
+class NavigationGrid:
+    """
+    Навигационная сетка: проходимость клеток в плоском bytearray.
+    Клетка (0, 0) - левая нижняя, как мировые координаты arcade.
+    Вокруг сетки рамка из стен, поэтому поиску не нужны проверки границ.
+    """
+
+    def __init__(self, width: int, height: int, tile_size: float = 70, blocked=None):
+        self.width = width
+        self.height = height
+        self.tile_size = tile_size
+
+        # Ширина строки с рамкой: индекс клетки = (y + 1) * stride + (x + 1)
+        self.stride = width + 2
+        self.walkable = bytearray(self.stride * (height + 2))
+        for y in range(height):
+            start = (y + 1) * self.stride + 1
+            self.walkable[start:start + width] = b"\x01" * width
+
+        if blocked is not None:
+            for x, y in blocked:
+                self.walkable[self.index(x, y)] = 0
+
+        self.version = next(_versions)
+
+    @classmethod
+    def from_map_loader(cls, map_loader):
+        """Строит сетку по коллизиям MapLoader (битмап текстовой карты или слой collisions Tiled)"""
+        grid = map_loader.tile_grid
+        if grid is not None:
+            nav = cls(grid.width, grid.height, grid.tile_size)
+            # В TileGrid строка 0 - верхняя, у нас - нижняя
+            for row in range(grid.height):
+                y = grid.height - 1 - row
+                start = row * grid.width
+                blocked_row = grid.blocked[start:start + grid.width]
+                nav_start = (y + 1) * nav.stride + 1
+                nav.walkable[nav_start:nav_start + grid.width] = blocked_row.translate(_INVERT)
+            return nav
+
+        tile_map = map_loader.tile_map
+        if tile_map is None:
+            raise ValueError("Навигационная сетка строится только по загруженной карте Tiled или текстовой")
+
+        tile_size = tile_map.tile_width * tile_map.scaling
+        nav = cls(tile_map.width, tile_map.height, tile_size)
+        for sprite in map_loader.collisions_layer or ():
+            # Стена может занимать несколько клеток - помечаем все, которые она перекрывает
+            left = int(sprite.left // tile_size)
+            right = int((sprite.right - 1e-6) // tile_size)
+            bottom = int(sprite.bottom // tile_size)
+            top = int((sprite.top - 1e-6) // tile_size)
+            for y in range(max(0, bottom), min(nav.height, top + 1)):
+                for x in range(max(0, left), min(nav.width, right + 1)):
+                    nav.walkable[nav.index(x, y)] = 0
+        return nav
+
+    def index(self, x: int, y: int) -> int:
+        return (y + 1) * self.stride + x + 1
+
+    def cell(self, index: int):
+        y, x = divmod(index, self.stride)
+        return x - 1, y - 1
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def is_walkable(self, x: int, y: int) -> bool:
+        return self.in_bounds(x, y) and self.walkable[self.index(x, y)] != 0
+
+    def set_blocked(self, x: int, y: int, blocked: bool = True):
+        """Меняет проходимость клетки (двери, разрушаемые стены). Старые пути в кэше устаревают"""
+        self.walkable[self.index(x, y)] = 0 if blocked else 1
+        self.version = next(_versions)
+
+    def world_to_cell(self, x: float, y: float):
+        return int(x // self.tile_size), int(y // self.tile_size)
+
+    def cell_to_world(self, x: int, y: int):
+        """Центр клетки в мировых координатах"""
+        return (x + 0.5) * self.tile_size, (y + 0.5) * self.tile_size
+
+
+class PathRequest:
+    """Запрос пути с разбивкой поиска по кадрам (Pathfinder.request / Pathfinder.update)"""
+
+    __slots__ = ("start", "goal", "callback", "search", "steps", "path", "done")
+
+    def __init__(self, start, goal, callback=None):
+        self.start = start
+        self.goal = goal
+        self.callback = callback
+        self.search = None  # Поиск, создается при первом шаге
+        self.steps = None  # Генератор срезов этого поиска
+        self.path = None
+        self.done = False
+
+
+class Pathfinder:
+    """
+    Поиск пути A* с jump point search по NavigationGrid.
+
+    Движение в 8 направлениях без срезания углов (диагональ только если
+    обе соседние клетки проходимы). Путь - список клеток-точек поворота,
+    между соседними точками движение по прямой или диагонали.
+    """
+
+    def __init__(self, grid: NavigationGrid, cache_size: int = 2048, jump_points: bool = True):
+        self.logger = logging.getLogger(f"{self.__class__.__module__}.{self.__class__.__name__}")
+        self.grid = grid
+        self.jump_points = jump_points
+
+        # (старт, цель, версия карты) -> путь (tuple) или None
+        self.cache = OrderedDict()
+        self.cache_size = cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+        # Очередь запросов с разбивкой по кадрам
+        self.queue = deque()
+
+    # СИНХРОННЫЙ API
+    def find_path(self, start, goal):
+        """
+        Ищет путь между клетками.
+
+        Args:
+            start: (x, y) клетка старта
+            goal: (x, y) клетка цели
+
+        Returns:
+            tuple клеток от старта до цели или None, если пути нет
+        """
+        key = (start, goal, self.grid.version)
+        cache = self.cache
+        if key in cache:
+            cache.move_to_end(key)
+            self.cache_hits += 1
+            return cache[key]
+
+        self.cache_misses += 1
+        search = self._search(start, goal)
+        for _ in search.run():
+            pass
+        return self._remember(key, search.path)
+
+    def find_paths(self, pairs):
+        """
+        Пакетный поиск для многих агентов за один тик.
+        Одинаковые пары (старт, цель) ищутся один раз.
+
+        Args:
+            pairs: список (start, goal)
+
+        Returns:
+            список путей в том же порядке
+        """
+        results = {}
+        paths = []
+        for pair in pairs:
+            path = results.get(pair)
+            if path is None and pair not in results:
+                path = results[pair] = self.find_path(*pair)
+            paths.append(path)
+        return paths
+
+    def find_world_path(self, start_x: float, start_y: float, goal_x: float, goal_y: float):
+        """Путь между мировыми точками - список центров клеток"""
+        grid = self.grid
+        path = self.find_path(grid.world_to_cell(start_x, start_y), grid.world_to_cell(goal_x, goal_y))
+        if path is None:
+            return None
+        return [grid.cell_to_world(x, y) for x, y in path]
+
+    def clear_cache(self):
+        self.cache.clear()
+
+    def _remember(self, key, path):
+        self.cache[key] = path
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return path
+
+    # РАЗБИВКА ПО КАДРАМ
+    def request(self, start, goal, callback=None) -> PathRequest:
+        """
+        Ставит поиск в очередь. Путь будет в request.path после request.done,
+        callback(path) вызывается по готовности. Из кэша отвечает сразу.
+        """
+        request = PathRequest(start, goal, callback)
+        key = (start, goal, self.grid.version)
+        if key in self.cache:
+            self.cache_hits += 1
+            self._finish(request, self.cache[key])
+        else:
+            self.queue.append(request)
+        return request
+
+    def update(self, budget_ms: float = 2.0):
+        """Продвигает очередь поисков, пока не кончится бюджет времени (вызывать раз в кадр)"""
+        deadline = time.perf_counter() + budget_ms / 1000
+        queue = self.queue
+        while queue and time.perf_counter() < deadline:
+            request = queue[0]
+            key = (request.start, request.goal, self.grid.version)
+            if request.search is None:
+                if key in self.cache:
+                    queue.popleft()
+                    self.cache_hits += 1
+                    self._finish(request, self.cache[key])
+                    continue
+                self.cache_misses += 1
+                request.search = self._search(request.start, request.goal)
+                request.steps = request.search.run()
+
+            # Один срез поиска; StopIteration - поиск закончен
+            try:
+                next(request.steps)
+            except StopIteration:
+                queue.popleft()
+                self._finish(request, self._remember(key, request.search.path))
+
+    @staticmethod
+    def _finish(request, path):
+        request.path = path
+        request.done = True
+        if request.callback:
+            request.callback(path)
+
+    # ПОИСК
+    def _search(self, start, goal):
+        """Создает поиск (его run() отдает управление каждые EXPANSIONS_PER_SLICE раскрытий)"""
+        return _Search(self.grid, start, goal, self.jump_points)
+
+
+class _Search:
+    """
+    Один поиск A*/JPS. run() - генератор срезов: каждый next() раскрывает
+    до EXPANSIONS_PER_SLICE узлов. Результат - в path после окончания генератора.
+    """
+
+    def __init__(self, grid: NavigationGrid, start, goal, jump_points: bool):
+        self.grid = grid
+        self.start = grid.index(*start) if grid.in_bounds(*start) else None
+        self.goal = grid.index(*goal) if grid.in_bounds(*goal) else None
+        self.jump_points = jump_points
+        self.path = None
+
+    def run(self):
+        grid = self.grid
+        walkable = grid.walkable
+        start, goal = self.start, self.goal
+        if start is None or goal is None or not walkable[start] or not walkable[goal]:
+            return
+        if start == goal:
+            self.path = (grid.cell(start),)
+            return
+
+        stride = grid.stride
+        goal_y, goal_x = divmod(goal, stride)
+
+        def heuristic(index):
+            # Октильное расстояние
+            y, x = divmod(index, stride)
+            dx = abs(x - goal_x)
+            dy = abs(y - goal_y)
+            return (dx + dy) + (SQRT2 - 2) * min(dx, dy)
+
+        successors = self._jump_successors if self.jump_points else self._neighbor_successors
+
+        open_heap = [(heuristic(start), 0.0, start)]
+        g_score = {start: 0.0}
+        parents = {start: None}
+        closed = set()
+        counter = 0
+
+        while open_heap:
+            _, g, current = heapq.heappop(open_heap)
+            if current in closed:
+                continue
+            if current == goal:
+                self.path = self._reconstruct(parents, current)
+                return
+            closed.add(current)
+
+            for neighbor, cost in successors(current, parents[current], goal):
+                if neighbor in closed:
+                    continue
+                new_g = g + cost
+                if new_g < g_score.get(neighbor, float("inf")):
+                    g_score[neighbor] = new_g
+                    parents[neighbor] = current
+                    heapq.heappush(open_heap, (new_g + heuristic(neighbor), new_g, neighbor))
+
+            counter += 1
+            if counter >= EXPANSIONS_PER_SLICE:
+                counter = 0
+                yield
+
+    def _reconstruct(self, parents, node):
+        cells = []
+        while node is not None:
+            cells.append(self.grid.cell(node))
+            node = parents[node]
+        cells.reverse()
+        return tuple(cells)
+
+    # Обычный A*: 8 соседей без срезания углов
+    def _neighbor_successors(self, current, parent, goal):
+        walkable = self.grid.walkable
+        stride = self.grid.stride
+        result = []
+        for step in (1, -1, stride, -stride):
+            if walkable[current + step]:
+                result.append((current + step, 1.0))
+        for dx in (1, -1):
+            for dy in (stride, -stride):
+                if walkable[current + dx] and walkable[current + dy] and walkable[current + dx + dy]:
+                    result.append((current + dx + dy, SQRT2))
+        return result
+
+    # JPS: обрезаем соседей по направлению прихода и прыгаем до точек поворота
+    def _jump_successors(self, current, parent, goal):
+        stride = self.grid.stride
+        result = []
+        cy, cx = divmod(current, stride)
+        for dx, dy in self._pruned_directions(current, parent):
+            jump_point = self._jump(current, dx, dy, goal)
+            if jump_point is not None:
+                jy, jx = divmod(jump_point, stride)
+                ax = abs(jx - cx)
+                ay = abs(jy - cy)
+                result.append((jump_point, max(ax, ay) + (SQRT2 - 1) * min(ax, ay)))
+        return result
+
+    def _pruned_directions(self, current, parent):
+        walkable = self.grid.walkable
+        stride = self.grid.stride
+
+        if parent is None:
+            # Старт - все направления, диагонали без срезания углов
+            directions = [(dx, dy) for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1))
+                          if walkable[current + dx + dy * stride]]
+            for dx in (1, -1):
+                for dy in (1, -1):
+                    if walkable[current + dx] and walkable[current + dy * stride]:
+                        directions.append((dx, dy))
+            return directions
+
+        py, px = divmod(parent, stride)
+        cy, cx = divmod(current, stride)
+        dx = (cx > px) - (cx < px)
+        dy = (cy > py) - (cy < py)
+        directions = []
+
+        if dx and dy:
+            can_y = walkable[current + dy * stride]
+            can_x = walkable[current + dx]
+            if can_y:
+                directions.append((0, dy))
+            if can_x:
+                directions.append((dx, 0))
+            if can_x and can_y:
+                directions.append((dx, dy))
+        elif dx:
+            can_up = walkable[current + stride]
+            can_down = walkable[current - stride]
+            if walkable[current + dx]:
+                directions.append((dx, 0))
+                if can_up:
+                    directions.append((dx, 1))
+                if can_down:
+                    directions.append((dx, -1))
+            if can_up:
+                directions.append((0, 1))
+            if can_down:
+                directions.append((0, -1))
+        else:
+            can_right = walkable[current + 1]
+            can_left = walkable[current - 1]
+            if walkable[current + dy * stride]:
+                directions.append((0, dy))
+                if can_right:
+                    directions.append((1, dy))
+                if can_left:
+                    directions.append((-1, dy))
+            if can_right:
+                directions.append((1, 0))
+            if can_left:
+                directions.append((-1, 0))
+        return directions
+
+    def _jump(self, current, dx, dy, goal):
+        """
+        Прыжок из current в направлении (dx, dy) до следующей точки поворота.
+        Итеративно - на больших открытых картах рекурсия упирается в лимит Python.
+        """
+        walkable = self.grid.walkable
+        stride = self.grid.stride
+        step_y = dy * stride
+        node = current + dx + step_y
+
+        while True:
+            if not walkable[node]:
+                return None
+            if node == goal:
+                return node
+
+            if dx and dy:
+                # По диагонали - точка поворота, если из нее есть прыжок по прямой
+                if self._jump(node, dx, 0, goal) is not None or self._jump(node, 0, dy, goal) is not None:
+                    return node
+                if not (walkable[node + dx] and walkable[node + step_y]):
+                    return None
+            elif dx:
+                # Вынужденный сосед: сверху/снизу стена закончилась
+                if (walkable[node + stride] and not walkable[node - dx + stride]) or \
+                        (walkable[node - stride] and not walkable[node - dx - stride]):
+                    return node
+            else:
+                if (walkable[node + 1] and not walkable[node + 1 - step_y]) or \
+                        (walkable[node - 1] and not walkable[node - 1 - step_y]):
+                    return node
+
+            node += dx + step_y
@@ -0,0 +1,163 @@
+from typing import NamedTuple
+
+import arcade
+
+from config import constants as C
+
+# Точки привязки: доля ширины и высоты опорного прямоугольника
+ANCHORS = {
+    "bottom_left": (0.0, 0.0), "bottom": (0.5, 0.0), "bottom_right": (1.0, 0.0),
+    "left": (0.0, 0.5), "center": (0.5, 0.5), "right": (1.0, 0.5),
+    "top_left": (0.0, 1.0), "top": (0.5, 1.0), "top_right": (1.0, 1.0),
+}
+
+# Сколько разных размеров окна помнит кэш (окно, полный экран, пара промежуточных)
+CACHE_LIMIT = 8
+
+
+class ScreenLayout(NamedTuple):
+    """
+    Размер окна и вписанный в него фиксированный обзор (VIEWPORT_WIDTH x
+    VIEWPORT_HEIGHT с черными полосами). Считается раз на размер окна.
+    """
+    width: int
+    height: int
+    scale: float
+    viewport_x: int
+    viewport_y: int
+    viewport_width: int
+    viewport_height: int
+
+    @property
+    def screen_rect(self):
+        return arcade.rect.XYWH(self.width // 2, self.height // 2, self.width, self.height)
+
+    @property
+    def viewport_rect(self):
+        return arcade.rect.XYWH(self.viewport_x + self.viewport_width // 2,
+                                self.viewport_y + self.viewport_height // 2,
+                                self.viewport_width, self.viewport_height)
+
+
+_screens = {}
+
+
+def screen_layout(width: int, height: int) -> ScreenLayout:
+    """Раскладка окна width x height (из кэша, если размер уже встречался)"""
+    screen = _screens.get((width, height))
+    if screen is None:
+        scale = min(width / C.VIEWPORT_WIDTH, height / C.VIEWPORT_HEIGHT)
+        viewport_width = int(C.VIEWPORT_WIDTH * scale)
+        viewport_height = int(C.VIEWPORT_HEIGHT * scale)
+        screen = ScreenLayout(width, height, scale,
+                              (width - viewport_width) // 2, (height - viewport_height) // 2,
+                              viewport_width, viewport_height)
+        if len(_screens) >= CACHE_LIMIT:
+            _screens.clear()
+        _screens[(width, height)] = screen
+    return screen
+
+
+class _Slot(NamedTuple):
+    element: object
+    anchor: tuple
+    x: float
+    y: float
+    width: float
+    height: float
+
+
+class LayoutEngine:
+    """
+    Декларативная раскладка UI по точкам привязки.
+
+    Элемент задается в пикселях опорного разрешения (VIEWPORT_WIDTH x
+    VIEWPORT_HEIGHT): точка привязки ("top_left", "bottom", ...) и смещение
+    центра элемента от нее. При смене размера окна все прямоугольники
+    считаются один раз и кэшируются по размеру - повторное применение
+    (переключение состояния, возврат из overlay) только раздает готовые
+    значения, а для того же размера не делает ничего.
+    """
+
+    def __init__(self, relative_to: str = "viewport"):
+        """
+        Args:
+            relative_to: "viewport" - привязка к фиксированному обзору (UI вместе
+                         с картинкой игры), "screen" - к краям окна (масштаб тот же)
+        """
+        self.relative_to = relative_to
+        self._slots = []
+        self._cache = {}  # (ширина, высота) -> [(x, y, width, height)]
+        self._applied = None  # Размер, для которого раскладка уже применена
+
+    def __len__(self):
+        return len(self._slots)
+
+    def add(self, element, anchor: str = "center", x: float = 0, y: float = 0,
+            width: float = None, height: float = None):
+        """
+        Добавляет элемент (нужны x, y, width, height - как у UIComponent).
+
+        Args:
+            anchor: Точка привязки (ключ ANCHORS)
+            x, y: Смещение центра элемента от точки привязки (опорные пиксели)
+            width, height: Размер в опорных пикселях (по умолчанию - текущий)
+        """
+        self._slots.append(_Slot(
+            element, ANCHORS[anchor], x, y,
+            element.width if width is None else width,
+            element.height if height is None else height,
+        ))
+        self.invalidate()
+        return element
+
+    def clear(self):
+        self._slots.clear()
+        self.invalidate()
+
+    def invalidate(self):
+        self._cache.clear()
+        self._applied = None
+
+    def compute(self, screen: ScreenLayout) -> list:
+        """Прямоугольники (x, y, width, height) элементов для этого окна"""
+        key = (screen.width, screen.height)
+        rects = self._cache.get(key)
+        if rects is not None:
+            return rects
+
+        scale = screen.scale
+        if self.relative_to == "screen":
+            left, bottom, width, height = 0, 0, screen.width, screen.height
+        else:
+            left, bottom = screen.viewport_x, screen.viewport_y
+            width, height = screen.viewport_width, screen.viewport_height
+
+        rects = []
+        for slot in self._slots:
+            anchor_x, anchor_y = slot.anchor
+            rects.append((left + anchor_x * width + slot.x * scale,
+                          bottom + anchor_y * height + slot.y * scale,
+                          slot.width * scale,
+                          slot.height * scale))
+
+        if len(self._cache) >= CACHE_LIMIT:
+            self._cache.clear()
+        self._cache[key] = rects
+        return rects
+
+    def apply(self, screen: ScreenLayout) -> bool:
+        """
+        Расставляет элементы под окно.
+
+        Returns:
+            False, если для этого размера раскладка уже применена
+        """
+        key = (screen.width, screen.height)
+        if key == self._applied:
+            return False
+
+        for slot, (x, y, width, height) in zip(self._slots, self.compute(screen)):
+            slot.element.set_rect(x, y, width, height)
+        self._applied = key
+        return True
@@ -1,3 +1,5 @@
+import math
+
 import arcade
 import logging
 
@@ -8,15 +10,26 @@ class Camera:
     """
     Камера, которая следует за игроком с ограничениями по границам карты.
     Поддерживает масштабирование и плавное следование.
+
+    Единственное место с логикой следования/ограничения камеры:
+    сглаживание не зависит от FPS, а границы зажима считаются
+    только при смене размера, зума или карты.
     """
 
-    def __init__(self, width, height):
+    # Кадр, к которому привязан follow_speed (раньше lerp делался раз в кадр при 60 FPS)
+    REFERENCE_FPS = 60
+
+    # Ближе этого (в пикселях) камера считается доехавшей до цели
+    SETTLE_DISTANCE = 0.01
+
+    def __init__(self, width, height, edge_buffer: float = 0):
         """
         Инициализация камеры.
 
         Args:
             width: ширина viewport (ширина окна)
             height: высота viewport (высота окна)
+            edge_buffer: насколько камере можно заходить за край карты (в пикселях)
         """
         self.logger = logging.getLogger(f"{self.__class__.__module__}.{self.__class__.__name__}")
         self.camera = arcade.camera.Camera2D()
@@ -35,10 +48,18 @@ class Camera:
 
         # Границы карты (установятся позже)
         self.map_bounds = None
+        self.edge_buffer = edge_buffer
 
-        # Плавное следование (0-1, чем больше - тем быстрее)
+        # Плавное следование (0-1, доля пути за кадр при 60 FPS)
         self.follow_speed = 0.1
 
+        # Кэш зажима: (min_x, max_x, min_y, max_y, half_w, half_h)
+        self._clamp = None
+
+        # Последняя цель следования - если она не сдвинулась и камера доехала, ничего не считаем
+        self._last_target = None
+        self.is_settled = False
+
         # Обновляем viewport
         self._update_viewport()
 
@@ -52,11 +73,30 @@ class Camera:
             self.viewport_width,
             self.viewport_height
         )
+        self._compute_clamp()
         self.logger.debug(f"Viewport обновлен: {self.camera.viewport}")
 
+    @property
+    def viewport(self):
+        """Viewport камеры в пикселях окна"""
+        return self.camera.viewport
+
+    @viewport.setter
+    def viewport(self, rect):
+        """Меняет viewport (ресайз окна) - границы зажима пересчитаются"""
+        if rect == self.camera.viewport:
+            return
+        self.camera.viewport = rect
+        self.viewport_width = rect.width
+        self.viewport_height = rect.height
+        self._compute_clamp()
+
     def resize(self, width: int, height: int):
         """Изменяет размер камеры"""
         self.camera.match_window()
+        self.viewport_width = width
+        self.viewport_height = height
+        self._compute_clamp()
 
     def set_map_bounds(self, left, bottom, width, height):
         """
@@ -76,66 +116,109 @@ class Camera:
             'width': width,
             'height': height
         }
+        self._compute_clamp()
         self.logger.info(f"Границы карты установлены: {self.map_bounds}")
 
-    def follow_player(self, player_x, player_y):
+    def _compute_clamp(self):
+        """
+        Считает границы, в которых может находиться центр камеры.
+        Вызывается только при смене viewport, карты или зума.
+        """
+        # Границы сменились - цель нужно пересчитать даже если игрок стоит
+        self._last_target = None
+        self.is_settled = False
+
+        # Видимая область задаётся проекцией (фиксированный обзор), а не viewport
+        projection = self.camera.projection
+        half_w = abs(projection.width) / 2 / self.zoom
+        half_h = abs(projection.height) / 2 / self.zoom
+
+        if not self.map_bounds:
+            self._clamp = (-math.inf, math.inf, -math.inf, math.inf, half_w, half_h)
+            return self._clamp
+
+        bounds = self.map_bounds
+        buffer = self.edge_buffer
+
+        min_x = bounds['left'] + half_w - buffer
+        max_x = bounds['right'] - half_w + buffer
+        if min_x > max_x:
+            # Карта полностью помещается по ширине - центрируем
+            min_x = max_x = (bounds['left'] + bounds['right']) / 2
+
+        min_y = bounds['bottom'] + half_h - buffer
+        max_y = bounds['top'] - half_h + buffer
+        if min_y > max_y:
+            # Карта полностью помещается по высоте - центрируем
+            min_y = max_y = (bounds['bottom'] + bounds['top']) / 2
+
+        self._clamp = (min_x, max_x, min_y, max_y, half_w, half_h)
+        self.logger.debug(f"Границы камеры пересчитаны: {self._clamp}")
+        return self._clamp
+
+    def clamp(self, x, y):
+        """Ограничивает точку границами камеры"""
+        min_x, max_x, min_y, max_y, _, _ = self._clamp
+        return max(min_x, min(max_x, x)), max(min_y, min(max_y, y))
+
+    def follow_player(self, player_x, player_y, delta_time: float = 1 / 60):
         """
         Плавное следование за игроком с учетом границ карты.
 
         Args:
             player_x: X координата игрока
             player_y: Y координата игрока
+            delta_time: время кадра (сглаживание не зависит от FPS)
         """
-        # Целевая позиция - позиция игрока
-        target_x = player_x
-        target_y = player_y
-
-        # Если есть границы карты - ограничиваем
-        if self.map_bounds:
-            # Вычисляем половину видимой области с учетом зума
-            half_viewport_width = (self.viewport_width / 2) / self.zoom
-            half_viewport_height = (self.viewport_height / 2) / self.zoom
-
-            # Проверяем, помещается ли вся карта на экране
-            map_fits_width = self.map_bounds['width'] <= self.viewport_width / self.zoom
-            map_fits_height = self.map_bounds['height'] <= self.viewport_height / self.zoom
-
-            if map_fits_width:
-                # Карта полностью помещается по ширине - центрируем
-                target_x = (self.map_bounds['left'] + self.map_bounds['right']) / 2
-                self.logger.debug(f"Карта помещается по ширине, центрируем: {target_x}")
-            else:
-                # Ограничиваем по границам
-                min_x = self.map_bounds['left'] + half_viewport_width
-                max_x = self.map_bounds['right'] - half_viewport_width
-                target_x = max(min_x, min(max_x, target_x))
-
-            if map_fits_height:
-                # Карта полностью помещается по высоте - центрируем
-                target_y = (self.map_bounds['bottom'] + self.map_bounds['top']) / 2
-                self.logger.debug(f"Карта помещается по высоте, центрируем: {target_y}")
-            else:
-                min_y = self.map_bounds['bottom'] + half_viewport_height
-                max_y = self.map_bounds['top'] - half_viewport_height
-                target_y = max(min_y, min(max_y, target_y))
-
-        # Плавное движение к цели
-        self.position = (
-            self.position[0] + (target_x - self.position[0]) * self.follow_speed,
-            self.position[1] + (target_y - self.position[1]) * self.follow_speed
-        )
-
-        # Обновляем камеру
+        # Игрок не двигался и камера уже доехала - делать нечего
+        if self.is_settled and self._last_target == (player_x, player_y):
+            return
+        self._last_target = (player_x, player_y)
+
+        min_x, max_x, min_y, max_y, _, _ = self._clamp
+        target_x = max(min_x, min(max_x, player_x))
+        target_y = max(min_y, min(max_y, player_y))
+
+        x, y = self.position
+        dx = target_x - x
+        dy = target_y - y
+
+        if -self.SETTLE_DISTANCE < dx < self.SETTLE_DISTANCE and -self.SETTLE_DISTANCE < dy < self.SETTLE_DISTANCE:
+            # Доехали - ставим ровно в цель и засыпаем до следующего движения
+            self.position = (target_x, target_y)
+            self.is_settled = True
+        else:
+            # Экспоненциальное сглаживание: за 1/60 с проходим follow_speed пути
+            alpha = 1 - (1 - self.follow_speed) ** (delta_time * self.REFERENCE_FPS)
+            self.position = (x + dx * alpha, y + dy * alpha)
+            self.is_settled = False
+
+        self._apply()
+
+    def snap_to(self, x, y):
+        """Мгновенно ставит камеру в точку (с учетом границ) - для телепорта"""
+        self.position = self.clamp(x, y)
+        self._last_target = (x, y)
+        self.is_settled = True
+        self._apply()
+
+    def visible_rect(self):
+        """Видимая область мира (для отсечения и событий)"""
+        _, _, _, _, half_w, half_h = self._clamp
+        x, y = self.position
+        return LRBT(x - half_w, x + half_w, y - half_h, y + half_h)
+
+    def _apply(self):
+        """Передает позицию и зум в Camera2D"""
         self.camera.position = self.position
         self.camera.zoom = self.zoom
 
-        self.logger.debug(f"Камера: позиция={self.position}, зум={self.zoom}")
-
     def zoom_in(self):
         """Приближение"""
         new_zoom = self.zoom * 1.1
         if new_zoom <= self.max_zoom:
             self.zoom = new_zoom
+            self._compute_clamp()
             self.logger.debug(f"Приближение: зум={self.zoom}")
 
     def zoom_out(self):
@@ -143,13 +226,15 @@ class Camera:
         new_zoom = self.zoom / 1.1
         if new_zoom >= self.min_zoom:
             self.zoom = new_zoom
+            self._compute_clamp()
             self.logger.debug(f"Отдаление: зум={self.zoom}")
 
     def reset_zoom(self):
         """Сброс масштаба"""
         self.zoom = 1.0
+        self._compute_clamp()
         self.logger.debug("Сброс зума: 1.0")
 
     def use(self):
         """Активирует камеру для отрисовки"""
-        self.camera.use()
\ No newline at end of file
+        self.camera.use()
@@ -0,0 +1,176 @@
+import json
+import logging
+import struct
+import threading
+import zlib
+from array import array
+from pathlib import Path
+
+
+class ChunkData:
+    """
+    Данные одного чанка, прочитанные с диска (без спрайтов).
+    tiles/blocked - строки чанка сверху вниз, как в текстовой карте.
+    """
+
+    __slots__ = ("cx", "cy", "col", "row", "width", "height", "tiles", "blocked", "events")
+
+    def __init__(self, cx, cy, col, row, width, height, tiles, blocked, events):
+        self.cx = cx
+        self.cy = cy
+        self.col = col  # Левая клетка чанка в сетке карты
+        self.row = row  # Верхняя клетка чанка в сетке карты
+        self.width = width
+        self.height = height
+        self.tiles = tiles
+        self.blocked = blocked
+        self.events = events  # Описания событий: dict(type, x, y, width, height, properties)
+
+
+class ChunkFile:
+    """
+    Индексированный файл чанков карты.
+
+    Формат (little-endian):
+        заголовок  "ITCM", версия, ширина, высота (в тайлах), размер чанка, typecode тайлов
+        индекс     (offset, length) на каждый чанк, построчно сверху вниз
+        данные     zlib(длина тайлов, длина событий, тайлы, битмап коллизий, события в JSON)
+
+    Версия 2: у каждого события сквозной номер "index" (порядок в слое объектов карты).
+
+    Чтение одного чанка - один seek и один read, остальная карта в память не попадает.
+    """
+
+    MAGIC = b"ITCM"
+    VERSION = 2
+    HEADER = struct.Struct("<4sHIIHc")
+    INDEX_ENTRY = struct.Struct("<QI")
+    CHUNK_HEADER = struct.Struct("<II")
+
+    def __init__(self, path):
+        self.logger = logging.getLogger(f"{self.__class__.__module__}.{self.__class__.__name__}")
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._file = open(self.path, "rb")
+
+        magic, version, self.width, self.height, self.chunk_size, typecode = self.HEADER.unpack(
+            self._file.read(self.HEADER.size))
+        if magic != self.MAGIC or version != self.VERSION:
+            self._file.close()
+            raise ValueError(f"{path}: не файл чанков (или неизвестная версия {version})")
+
+        self.typecode = typecode.decode()
+        self.chunks_x = -(-self.width // self.chunk_size)
+        self.chunks_y = -(-self.height // self.chunk_size)
+
+        count = self.chunks_x * self.chunks_y
+        raw_index = self._file.read(self.INDEX_ENTRY.size * count)
+        self.index = [self.INDEX_ENTRY.unpack_from(raw_index, i * self.INDEX_ENTRY.size) for i in range(count)]
+        self.logger.info(f"Файл чанков открыт: {self.width}x{self.height}, "
+                         f"чанков {self.chunks_x}x{self.chunks_y} по {self.chunk_size}")
+
+    def read_chunk(self, cx: int, cy: int) -> ChunkData:
+        """Читает и распаковывает чанк (потокобезопасно - вызывается из фонового потока)"""
+        offset, length = self.index[cy * self.chunks_x + cx]
+        with self._lock:
+            self._file.seek(offset)
+            payload = zlib.decompress(self._file.read(length))
+
+        tiles_length, events_length = self.CHUNK_HEADER.unpack_from(payload)
+        start = self.CHUNK_HEADER.size
+        tiles = array(self.typecode)
+        tiles.frombytes(payload[start:start + tiles_length])
+        start += tiles_length
+        blocked = bytearray(payload[start:start + len(tiles)])
+        start += len(tiles)
+        events = json.loads(payload[start:start + events_length]) if events_length else []
+
+        col = cx * self.chunk_size
+        row = cy * self.chunk_size
+        width = min(self.chunk_size, self.width - col)
+        height = min(self.chunk_size, self.height - row)
+        return ChunkData(cx, cy, col, row, width, height, tiles, blocked, events)
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+    @classmethod
+    def write(cls, path, grid, chunk_size: int = 32, events=()):
+        """
+        Режет TileGrid на чанки и записывает файл.
+
+        Args:
+            path: Куда писать
+            grid: TileGrid (например, из TextMapLoader.parse)
+            chunk_size: Размер чанка в тайлах
+            events: Описания событий в координатах карты (без масштаба, как объекты Tiled):
+                dict(type, x, y, width, height, properties) - попадают в чанк по своему центру.
+                Порядок в списке - сквозной номер события (из него id по умолчанию)
+        """
+        chunks_x = -(-grid.width // chunk_size)
+        chunks_y = -(-grid.height // chunk_size)
+
+        # Раскладываем события по чанкам (строки сетки считаются сверху)
+        chunk_events = {}
+        world_height = grid.height * grid.tile_size
+        for index, event in enumerate(events):
+            center_x = event["x"] + event["width"] / 2
+            center_y = event["y"] + event["height"] / 2
+            cx = min(chunks_x - 1, max(0, int(center_x // grid.tile_size) // chunk_size))
+            cy = min(chunks_y - 1, max(0, int((world_height - center_y) // grid.tile_size) // chunk_size))
+            chunk_events.setdefault((cx, cy), []).append(dict(event, index=index))
+
+        payloads = []
+        for cy in range(chunks_y):
+            for cx in range(chunks_x):
+                col, row = cx * chunk_size, cy * chunk_size
+                width = min(chunk_size, grid.width - col)
+                height = min(chunk_size, grid.height - row)
+
+                tiles = array(grid.tiles.typecode)
+                blocked = bytearray()
+                for r in range(row, row + height):
+                    start = r * grid.width + col
+                    tiles.extend(grid.tiles[start:start + width])
+                    blocked += grid.blocked[start:start + width]
+
+                tiles_bytes = tiles.tobytes()
+                event_list = chunk_events.get((cx, cy))
+                events_bytes = json.dumps(event_list, ensure_ascii=False).encode() if event_list else b""
+                payloads.append(zlib.compress(
+                    cls.CHUNK_HEADER.pack(len(tiles_bytes), len(events_bytes)) + tiles_bytes + bytes(blocked) + events_bytes
+                ))
+
+        offset = cls.HEADER.size + cls.INDEX_ENTRY.size * len(payloads)
+        with open(path, "wb") as f:
+            f.write(cls.HEADER.pack(cls.MAGIC, cls.VERSION, grid.width, grid.height, chunk_size,
+                                    grid.tiles.typecode.encode()))
+            for payload in payloads:
+                f.write(cls.INDEX_ENTRY.pack(offset, len(payload)))
+                offset += len(payload)
+            for payload in payloads:
+                f.write(payload)
+
+        return path
+
+
+def main():
+    """Конвертация текстовой карты: python -m src.world.chunk_file res/maps/forest.txt res/maps/forest.chunks"""
+    import argparse
+
+    from src.world.text_map_loader import TextMapLoader
+
+    parser = argparse.ArgumentParser(description="Конвертация текстовой карты в файл чанков")
+    parser.add_argument("source")
+    parser.add_argument("target")
+    parser.add_argument("--chunk-size", type=int, default=32)
+    args = parser.parse_args()
+
+    grid = TextMapLoader().parse(args.source)
+    ChunkFile.write(args.target, grid, chunk_size=args.chunk_size)
+    print(f"✅ {args.source} -> {args.target} ({grid.width}x{grid.height}, чанк {args.chunk_size})")
+
+
+if __name__ == "__main__":
+    main()
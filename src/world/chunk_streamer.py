@@ -0,0 +1,233 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import arcade
+
+
+class LoadedChunk:
+    """Чанк в памяти: данные с диска, спрайты и созданные события"""
+
+    __slots__ = ("data", "sprites", "walls", "events")
+
+    def __init__(self, data, sprites, walls):
+        self.data = data
+        self.sprites = sprites  # SpriteList для отрисовки
+        self.walls = walls  # SpriteList стен (те же спрайты) со spatial hash
+        self.events = []
+
+
+class ChunkStreamer:
+    """
+    Потоковая подгрузка карты по чанкам вокруг камеры.
+
+    Фоновый поток читает чанк из ChunkFile и собирает его спрайты и слой стен,
+    основной поток только подключает готовый чанк: слой стен в список слоев
+    коллизий, события в EventManager. Чанки дальше evict_radius выгружаются вместе
+    с событиями, так что в памяти всегда не больше (2 * evict_radius + 1)^2 чанков.
+    При повторной загрузке события создаются заново из данных чанка, а их состояние
+    (открытые сундуки) EventManager.add_event восстанавливает из MapEventState.
+    """
+
+    def __init__(self, chunk_file, tile_loader, event_manager, tile_size: float = 70,
+                 load_radius: int = 1, evict_radius: int = 2, max_attach_per_frame: int = 2):
+        """
+        Args:
+            chunk_file: ChunkFile
+            tile_loader: TextMapLoader с загруженными данными тайлов (текстуры и проходимость)
+            event_manager: EventManager, в который подгружаются события чанков
+            tile_size: Размер тайла в мире
+            load_radius: Радиус загрузки в чанках вокруг камеры
+            evict_radius: Радиус выгрузки (больше load_radius, чтобы чанки не мигали на границе)
+            max_attach_per_frame: Сколько готовых чанков подключать за кадр
+        """
+        self.logger = logging.getLogger(f"{self.__class__.__module__}.{self.__class__.__name__}")
+        self.chunk_file = chunk_file
+        self.tile_loader = tile_loader
+        self.event_manager = event_manager
+        self.tile_size = tile_size
+        self.load_radius = load_radius
+        self.evict_radius = max(evict_radius, load_radius)
+        self.max_attach_per_frame = max_attach_per_frame
+
+        self.chunk_pixels = chunk_file.chunk_size * tile_size
+        self.world_height = chunk_file.height * tile_size
+
+        # Текстуры атласа нужны фоновому потоку - загружаем заранее в основном
+        self.textures = tile_loader.load_textures()
+        # Масштаб карты: спрайты тайлов и координаты событий из файла чанков
+        self.scale = tile_size / tile_loader.SPRITESHEET_TILE
+
+        # (cx, cy) -> LoadedChunk / Future
+        self.chunks = {}
+        self.pending = {}
+        self._center = None
+
+        # Слои стен загруженных чанков. Список не пересоздается (его держит GameplayState),
+        # меняется только содержимое - целыми чанками, без поспрайтовых remove
+        self.collisions_layer = []
+
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chunk-loader")
+
+    # КООРДИНАТЫ
+    def chunk_at(self, x: float, y: float):
+        """Чанк (cx, cy) под мировой точкой. cy считается сверху, как строки файла"""
+        cx = int(x // self.chunk_pixels)
+        cy = int((self.world_height - y) // self.chunk_pixels)
+        return cx, cy
+
+    def _wanted(self, center, radius):
+        cx, cy = center
+        for y in range(max(0, cy - radius), min(self.chunk_file.chunks_y, cy + radius + 1)):
+            for x in range(max(0, cx - radius), min(self.chunk_file.chunks_x, cx + radius + 1)):
+                yield x, y
+
+    # ЗАГРУЗКА
+    def update(self, x: float, y: float):
+        """Вызывается каждый кадр с центром камеры"""
+        center = self.chunk_at(x, y)
+        if center != self._center:
+            self._center = center
+            self._request_around(center)
+            self._evict_far()
+
+        if self.pending:
+            self._attach_finished()
+
+    def preload(self, x: float, y: float):
+        """Синхронно загружает чанки вокруг точки (старт карты, телепорт)"""
+        center = self.chunk_at(x, y)
+        self._center = center
+        self._evict_far()
+        for key in self._wanted(center, self.load_radius):
+            if key in self.chunks:
+                continue
+            future = self.pending.pop(key, None)
+            chunk = future.result() if future else self._build_chunk(*key)
+            self._attach(key, chunk)
+
+    def _request_around(self, center):
+        # Ближние чанки ставим в очередь первыми
+        wanted = sorted(self._wanted(center, self.load_radius),
+                        key=lambda key: abs(key[0] - center[0]) + abs(key[1] - center[1]))
+        for key in wanted:
+            if key not in self.chunks and key not in self.pending:
+                self.pending[key] = self.executor.submit(self._build_chunk, *key)
+
+    def _build_chunk(self, cx: int, cy: int) -> LoadedChunk:
+        """Фоновый поток: чтение с диска и сборка спрайтов (без обращений к GL)"""
+        data = self.chunk_file.read_chunk(cx, cy)
+        # lazy - буферы GL создадутся в основном потоке при первой отрисовке
+        sprites = arcade.SpriteList(use_spatial_hash=False, lazy=True)
+        walls = arcade.SpriteList(use_spatial_hash=True, lazy=True)
+
+        tile_size = self.tile_size
+        textures = self.textures
+        texture_count = len(textures)
+        top = self.world_height
+        index = 0
+        for row in range(data.row, data.row + data.height):
+            center_y = top - (row + 0.5) * tile_size
+            for col in range(data.col, data.col + data.width):
+                tile_id = data.tiles[index]
+                texture = textures[tile_id] if tile_id < texture_count else textures[0]
+                sprite = arcade.Sprite(texture, scale=self.scale,
+                                       center_x=(col + 0.5) * tile_size, center_y=center_y)
+                sprites.append(sprite)
+                if data.blocked[index]:
+                    walls.append(sprite)
+                index += 1
+
+        return LoadedChunk(data, sprites, walls)
+
+    def _attach_finished(self):
+        attached = 0
+        for key, future in list(self.pending.items()):
+            if attached >= self.max_attach_per_frame:
+                break
+            if not future.done():
+                continue
+            del self.pending[key]
+            if not self._is_near(key, self.evict_radius):
+                # Камера успела уехать, пока чанк грузился
+                continue
+            try:
+                self._attach(key, future.result())
+            except Exception as e:
+                self.logger.error(f"Ошибка загрузки чанка {key}: {e}")
+            attached += 1
+
+    def _attach(self, key, chunk: LoadedChunk):
+        """Основной поток: подключаем стены и события чанка"""
+        self.collisions_layer.append(chunk.walls)
+
+        if self.event_manager and chunk.data.events:
+            for description in chunk.data.events:
+                # Сквозной номер из файла чанков: id и размеры те же, что при полной
+                # загрузке карты - по id после выгрузки восстанавливается состояние
+                description = dict(description)
+                index = description.pop("index")
+                event = self.event_manager.create_event(SimpleNamespace(**description), self.scale, index)
+                if event:
+                    self.event_manager.add_event(event)
+                    chunk.events.append(event)
+
+        self.chunks[key] = chunk
+        self.logger.debug(f"Чанк {key} загружен, в памяти: {len(self.chunks)}")
+
+    # ВЫГРУЗКА
+    def _is_near(self, key, radius) -> bool:
+        cx, cy = self._center
+        return abs(key[0] - cx) <= radius and abs(key[1] - cy) <= radius
+
+    def _evict_far(self):
+        for key in list(self.chunks):
+            if not self._is_near(key, self.evict_radius):
+                self._detach(key)
+
+        # Не начатые загрузки далеких чанков отменяем
+        for key in list(self.pending):
+            if not self._is_near(key, self.evict_radius) and self.pending[key].cancel():
+                del self.pending[key]
+
+    def _detach(self, key):
+        chunk = self.chunks.pop(key)
+        self.collisions_layer.remove(chunk.walls)
+
+        # Состояние событий уже в MapEventState (сохраняется при изменении) - сами объекты не держим
+        for event in chunk.events:
+            self.event_manager.remove_event(event)
+        chunk.events.clear()
+
+        self.logger.debug(f"Чанк {key} выгружен")
+
+    # ЗАПРОСЫ
+    def is_solid_at_pixel(self, x: float, y: float) -> bool:
+        """Коллизия по битмапу загруженного чанка. Незагруженная область считается стеной"""
+        size = self.tile_size
+        col = int(x // size)
+        row = int((self.world_height - y) // size)
+        if col < 0 or row < 0 or col >= self.chunk_file.width or row >= self.chunk_file.height:
+            return True
+
+        chunk_size = self.chunk_file.chunk_size
+        chunk = self.chunks.get((col // chunk_size, row // chunk_size))
+        if chunk is None:
+            return True
+        data = chunk.data
+        return data.blocked[(row - data.row) * data.width + (col - data.col)] != 0
+
+    def get_sprite_count(self) -> int:
+        return sum(len(chunk.sprites) for chunk in self.chunks.values())
+
+    def draw(self):
+        for chunk in self.chunks.values():
+            chunk.sprites.draw()
+
+    def shutdown(self):
+        """Останавливает фоновый поток и закрывает файл"""
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        self.chunk_file.close()
+        self.chunks.clear()
+        self.pending.clear()
+        self.collisions_layer.clear()
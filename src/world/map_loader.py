@@ -1,8 +1,10 @@
 import arcade
 import logging
 
+from src.core.game_data import game_data
 from src.core.resource_manager import resource_manager
 from src.events.event_manager import EventManager
+from src.systems.animation_system import animation_system
 from pathlib import Path
 
 class MapLoader:
@@ -16,6 +18,7 @@ class MapLoader:
         self.event_manager = None
 
         # Загруженная карта
+        self.map_name = None  # Путь относительно res/ - ключ сохраненного состояния событий
         self.tile_map = None
         self.scene = None
 
@@ -25,6 +28,18 @@ class MapLoader:
         self.collisions_layer = None
         self.containers_layer = None
 
+        # Анимированные тайлы Tiled (кадры меняет animation_system)
+        self.animated_tiles = []
+
+        # Скомпилированная сетка для текстовых карт (для Tiled - None)
+        self.tile_grid = None
+
+        # Потоковая загрузка по чанкам (для карт .chunks)
+        self.streamer = None
+
+        # Навигационная сетка для поиска пути (строится по запросу)
+        self.navigation_grid = None
+
         # Границы карты
         self.bounds = None
 
@@ -52,104 +67,32 @@ class MapLoader:
 
     def _create_chest_sprites_from_layer(self, containers_layer, scale):
         """Создает спрайты сундуков из визуального слоя и связывает с событиями"""
-        print(f"🎨 Создание спрайтов для {len(containers_layer)} контейнеров...")
-        print(f"📏 Размер тайла: {self.tile_map.tile_width}x{self.tile_map.tile_height}")
-
-        from src.entities.chest import ChestSprite
-
-        created_count = 0
-
-        for i, tile_sprite in enumerate(containers_layer):
-            # Позиция тайла в мире
-            sprite_x = tile_sprite.center_x
-            sprite_y = tile_sprite.center_y
-
-            # Координаты в тайлах (для сравнения с Tiled)
-            tile_x = sprite_x / self.tile_map.tile_width
-            tile_y = sprite_y / self.tile_map.tile_height
-
-            # Ищем ближайшее событие сундука (увеличиваем радиус поиска)
-            chest_event = self.event_manager._find_nearest_chest_event(sprite_x, sprite_y,
-                                                                       max_distance=self.tile_map.tile_width * 5)
-
-            if chest_event:
-                # Получаем координаты события
-                ex, ey, ew, eh = chest_event.rect
-                event_center_x = ex + ew / 2
-                event_center_y = ey + eh / 2
-
-                event_tile_x = event_center_x / self.tile_map.tile_width
-                event_tile_y = event_center_y / self.tile_map.tile_height
-
-                print(f"   ✅ Найдено событие: {chest_event.event_id}")
-                print(f"   📍 Событие (пиксели): ({event_center_x:.0f}, {event_center_y:.0f})")
-                print(f"   📍 Событие (тайлы): ({event_tile_x:.1f}, {event_tile_y:.1f})")
-
-                # Проверяем, совпадают ли координаты в тайлах (округленно)
-                if (abs(tile_x - event_tile_x) < 1.0 and abs(tile_y - event_tile_y) < 1.0):
-                    print(f"   🎯 Координаты совпадают в пределах 1 тайла!")
-                else:
-                    print(
-                        f"   ⚠️ Координаты не совпадают: разница ({tile_x - event_tile_x:.1f}, {tile_y - event_tile_y:.1f}) тайлов")
-
-                # Загружаем текстуры
-                try:
-                    texture_closed = self.rm.load_texture("containers/chest.png")
-                    texture_open = self.rm.load_texture("containers/chest_opened.png")
-
-                    # Создаем спрайт сундука
-                    sprite = ChestSprite(
-                        texture=texture_closed,
-                        texture_open=texture_open,
-                        x=sprite_x,
-                        y=sprite_y,
-                        event=chest_event
-                    )
-
-                    # Связываем спрайт с событием
-                    chest_event.set_sprite(sprite)
-                    self.event_manager.chest_sprites.append(sprite)
-
-                    # Делаем оригинальный тайл невидимым
-                    tile_sprite.visible = False
-
-                    created_count += 1
-                    print(f"   🎉 Спрайт создан и связан!")
-
-                except Exception as e:
-                    print(f"   ❌ Ошибка создания спрайта: {e}")
-            else:
-                print(f"   ❌ Событие не найдено")
-
-        print(f"\n📊 ИТОГО: Создано {created_count} из {len(containers_layer)} спрайтов сундуков")
-
-    def _find_chest_event_near(self, x, y, max_distance=32):
-        """Находит событие сундука рядом с координатами"""
-        if not self.event_manager:
-            return None
-
-        for event in self.event_manager.events:
-            if event.type == "chest":
-                # Проверяем расстояние до центра зоны события
-                ex, ey, ew, eh = event.rect
-                event_center_x = ex + ew / 2
-                event_center_y = ey + eh / 2
-
-                distance = ((x - event_center_x) ** 2 + (y - event_center_y) ** 2) ** 0.5
-
-                if distance < max_distance:
-                    return event
-        return None
+        tile_width = self.tile_map.tile_width * self.tile_map.scaling
+        tile_height = self.tile_map.tile_height * self.tile_map.scaling
+        print(f"🎨 Создание спрайтов для {len(containers_layer)} контейнеров (тайл {tile_width}x{tile_height})")
+
+        self.event_manager.link_chest_sprites(containers_layer, tile_width, tile_height,
+                                              map_rows=self.tile_map.height,
+                                              max_distance=tile_width * 5)
 
     def load(self, map_file: str, scale: float = 1.0) -> bool:
         """
-        Загружает Tiled карту.
+        Загружает Tiled карту (.tmx) или старую текстовую карту (.txt).
         """
         try:
             self.event_manager = EventManager()
+            animation_system.stop_all(self.animated_tiles)
+            self.animated_tiles = []
+            self.tile_map = None
+            self.tile_grid = None
+            self.navigation_grid = None
+            if self.streamer:
+                self.streamer.shutdown()
+                self.streamer = None
 
             # Используем pathlib для кроссплатформенных путей
             map_file_path = Path(map_file)
+            self.map_name = map_file_path.as_posix()
 
             # Полный путь к файлу
             project_root = Path(self.rm.get_project_root())
@@ -171,6 +114,11 @@ class MapLoader:
                 self._calculate_bounds()
                 return False
 
+            if map_file_path.suffix.lower() == ".txt":
+                return self._load_text_map(map_path, scale)
+            if map_file_path.suffix.lower() == ".chunks":
+                return self._load_chunked_map(map_path, scale)
+
             # Загружаем карту через Arcade - передаем строку
             self.tile_map = arcade.load_tilemap(
                 str(map_path),  # Преобразуем Path в строку
@@ -191,12 +139,19 @@ class MapLoader:
             print(
                 f"📊 Слои загружены: ground={bool(self.ground_layer)}, walls={bool(self.walls_layer)}, containers={bool(self.containers_layer)}")
 
-            # Загружаем события
+            # Загружаем события и возвращаем им сохраненное состояние (открытые сундуки)
             self._load_events(scale)
+            self.event_manager.attach_state(game_data.get_event_state(self.map_name))
 
             # Создаем сцену для отрисовки
             self.scene = arcade.Scene.from_tilemap(self.tile_map)
 
+            # Анимированные тайлы всех слоев - на общие часы анимаций
+            for sprite_list in self.tile_map.sprite_lists.values():
+                self.animated_tiles.extend(animation_system.add_layer(sprite_list))
+            if self.animated_tiles:
+                print(f"🎞️ Анимированных тайлов: {len(self.animated_tiles)}")
+
             # Скрываем невидимые слои
             if self.collisions_layer:
                 for sprite in self.collisions_layer:
@@ -217,8 +172,80 @@ class MapLoader:
             traceback.print_exc()
             return False
 
+    def _load_text_map(self, map_path: Path, scale: float) -> bool:
+        """Загружает старую текстовую карту в те же слои, что и Tiled"""
+        # Ленивый импорт
+        from src.world.text_map_loader import TextMapLoader
+
+        loader = TextMapLoader()
+        self.tile_grid = loader.parse(map_path, tile_size=TextMapLoader.SPRITESHEET_TILE * scale)
+        self.ground_layer, self.collisions_layer = loader.build_sprite_lists(self.tile_grid)
+        self.walls_layer = None
+        self.containers_layer = None
+
+        # Стены лежат в ground, collisions - только индекс для проверок, в сцену не добавляем
+        self.scene = arcade.Scene()
+        self.scene.add_sprite_list("ground", sprite_list=self.ground_layer)
+
+        self._calculate_bounds()
+        print(f"✅ Текстовая карта загружена: {self.tile_grid.width}x{self.tile_grid.height}")
+        return True
+
+    def _load_chunked_map(self, map_path: Path, scale: float) -> bool:
+        """
+        Открывает карту из файла чанков. Спрайты, стены и события
+        подгружаются вокруг камеры через update_streaming.
+        """
+        # Ленивый импорт
+        from src.world.chunk_file import ChunkFile
+        from src.world.chunk_streamer import ChunkStreamer
+        from src.world.text_map_loader import TextMapLoader
+
+        tile_loader = TextMapLoader()
+        tile_loader.load_tile_data()
+
+        # События чанков восстанавливаются по одному при подгрузке
+        self.event_manager.attach_state(game_data.get_event_state(self.map_name))
+        self.streamer = ChunkStreamer(
+            ChunkFile(map_path),
+            tile_loader,
+            self.event_manager,
+            tile_size=TextMapLoader.SPRITESHEET_TILE * scale,
+        )
+        self.ground_layer = None
+        self.walls_layer = None
+        self.containers_layer = None
+        self.collisions_layer = self.streamer.collisions_layer
+        self.scene = None
+
+        self._calculate_bounds()
+        print(f"✅ Карта с чанками открыта: {self.streamer.chunk_file.width}x{self.streamer.chunk_file.height}")
+        return True
+
+    def update_streaming(self, x: float, y: float):
+        """Подгружает/выгружает чанки вокруг центра камеры (для обычных карт ничего не делает)"""
+        if self.streamer:
+            self.streamer.update(x, y)
+
+    def preload_around(self, x: float, y: float):
+        """Синхронно загружает чанки вокруг точки - чтобы игрок не появился в пустоте"""
+        if self.streamer:
+            self.streamer.preload(x, y)
+
     def _calculate_bounds(self):
         """Вычисляет границы карты"""
+        if self.streamer:
+            width = self.streamer.chunk_file.width * self.streamer.tile_size
+            height = self.streamer.world_height
+            self.bounds = {'left': 0, 'bottom': 0, 'right': width, 'top': height, 'width': width, 'height': height}
+            return
+
+        if self.tile_grid:
+            width = self.tile_grid.width * self.tile_grid.tile_size
+            height = self.tile_grid.height * self.tile_grid.tile_size
+            self.bounds = {'left': 0, 'bottom': 0, 'right': width, 'top': height, 'width': width, 'height': height}
+            return
+
         if not self.tile_map:
             self.bounds = {'left': 0, 'right': 0, 'bottom': 0, 'top': 0, 'width': 0, 'height': 0}
             return
@@ -253,6 +280,22 @@ class MapLoader:
         hits = arcade.check_for_collision_with_list(temp_sprite, self.collisions_layer)
         return len(hits) > 0
 
+    def is_solid_at_pixel(self, x: float, y: float) -> bool:
+        """Проверка точки для CollisionSystem: у текстовых карт - по битмапу, без спрайтов"""
+        if self.tile_grid:
+            return self.tile_grid.is_solid_at_pixel(x, y)
+        if self.streamer:
+            return self.streamer.is_solid_at_pixel(x, y)
+        return self.is_solid_at(x, y)
+
+    def get_navigation_grid(self):
+        """Навигационная сетка по слою коллизий (строится один раз на карту)"""
+        if self.navigation_grid is None:
+            # Ленивый импорт
+            from src.systems.pathfinding import NavigationGrid
+            self.navigation_grid = NavigationGrid.from_map_loader(self)
+        return self.navigation_grid
+
     def get_collision_layer(self):
         """Возвращает слой коллизий"""
         return self.collisions_layer
@@ -262,10 +305,25 @@ class MapLoader:
         print("bounds - ", self.bounds)
         return self.bounds
 
+    def get_sprite_count(self) -> int:
+        """Количество спрайтов карты и событий (для профилировщика)"""
+        count = 0
+        if self.tile_map:
+            count += sum(len(sprite_list) for sprite_list in self.tile_map.sprite_lists.values())
+        elif self.ground_layer:
+            count += len(self.ground_layer)
+        elif self.streamer:
+            count += self.streamer.get_sprite_count()
+        if self.event_manager:
+            count += len(self.event_manager.sprites)
+        return count
+
     def draw(self):
         """Отрисовывает карту"""
         if self.scene:
             self.scene.draw()
+        elif self.streamer:
+            self.streamer.draw()
 
     def update_events(self, delta_time: float, player, game_state):
         """Обновляет события"""
@@ -0,0 +1,190 @@
+import logging
+from array import array
+from pathlib import Path
+
+import arcade
+
+from src.core.resource_manager import resource_manager
+from src.world.tile import Tile
+
+
+class TileGrid:
+    """
+    Скомпилированная карта: id тайлов в плоском array ('B', если id < 256, иначе 'H') и битмап
+    проходимости в bytearray (1 = стена). Строка 0 - верхняя строка файла.
+    """
+
+    __slots__ = ("width", "height", "tile_size", "tiles", "blocked")
+
+    def __init__(self, width: int, height: int, tiles: array, blocked: bytearray, tile_size: float = 70):
+        self.width = width
+        self.height = height
+        self.tile_size = tile_size
+        self.tiles = tiles
+        self.blocked = blocked
+
+    def tile_at(self, col: int, row: int) -> int:
+        """id тайла в клетке (row считается сверху, как в файле)"""
+        return self.tiles[row * self.width + col]
+
+    def is_blocked(self, col: int, row: int) -> bool:
+        """Стена ли в клетке. За пределами карты - всегда стена"""
+        if 0 <= col < self.width and 0 <= row < self.height:
+            return self.blocked[row * self.width + col] != 0
+        return True
+
+    def is_solid_at_pixel(self, x: float, y: float) -> bool:
+        """Проверка коллизии в мировых координатах (ось Y вверх, как в arcade)"""
+        col = int(x // self.tile_size)
+        row = self.height - 1 - int(y // self.tile_size)
+        if 0 <= col < self.width and 0 <= row < self.height:
+            return self.blocked[row * self.width + col] != 0
+        return True
+
+    def cell_center(self, col: int, row: int):
+        """Центр клетки в мировых координатах"""
+        size = self.tile_size
+        return (col + 0.5) * size, (self.height - row - 0.5) * size
+
+
+class TextMapLoader:
+    """
+    Импорт старых текстовых карт (res/maps/*.txt).
+    Карта - строки с id тайлов через пробел, tiledata.txt - пары строк
+    "NNN.png" / "true|false" (заблокирован ли тайл).
+    """
+
+    # Старые картинки тайлов (000.png ...) не сохранились - берем тайлы из общего атласа
+    SPRITESHEET = "tiles/tiles_spritesheet.png"
+    SPRITESHEET_TILE = 70
+    SPRITESHEET_SPACING = 2
+    SPRITESHEET_COLUMNS = 12
+    SPRITESHEET_COUNT = 156
+
+    def __init__(self, tile_data_file: str = "maps/tiledata.txt"):
+        self.logger = logging.getLogger(f"{self.__class__.__module__}.{self.__class__.__name__}")
+        self.rm = resource_manager
+        self.tile_data_file = tile_data_file
+
+        # id тайла -> (имя картинки, заблокирован)
+        self.tile_data = None
+        # Таблица проходимости по id (bytes, для translate/map)
+        self.blocked_lookup = None
+        # Токен из файла карты (b"7", b"007") -> id
+        self.token_ids = None
+        # id тайла -> Tile (с текстурой), создаются один раз
+        self.tiles = {}
+
+    def load_tile_data(self, path=None) -> dict:
+        """Читает tiledata.txt и собирает таблицу проходимости"""
+        path = Path(path) if path else Path(self.rm.get_resource_path(self.tile_data_file))
+        lines = [line.strip() for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+        if len(lines) % 2:
+            raise ValueError(f"{path}: нечетное число строк, ожидаются пары 'NNN.png' / 'true|false'")
+
+        tile_data = {}
+        for name, flag in zip(lines[0::2], lines[1::2]):
+            flag = flag.lower()
+            if flag not in ("true", "false"):
+                raise ValueError(f"{path}: для {name} ожидается true/false, получено '{flag}'")
+            tile_data[int(Path(name).stem)] = (name, flag == "true")
+
+        # Таблица на 256 id, чтобы для байтовых карт работал bytes.translate
+        lookup = bytearray(max(256, max(tile_data) + 1))
+        token_ids = {}
+        for tile_id, (name, is_blocked) in tile_data.items():
+            lookup[tile_id] = is_blocked
+            for token in (str(tile_id), f"{tile_id:03d}", Path(name).stem):
+                token_ids[token.encode()] = tile_id
+
+        self.tile_data = tile_data
+        self.blocked_lookup = bytes(lookup)
+        self.token_ids = token_ids
+        self.logger.info(f"Данные тайлов загружены: {len(tile_data)} шт.")
+        return tile_data
+
+    def parse(self, path, tile_size: float = 70) -> TileGrid:
+        """
+        Компилирует текстовую карту в TileGrid.
+        Разбор идет целиком по байтам файла, без объектов на каждую клетку:
+        токены переводятся в id словарем, битмап строится через bytes.translate.
+        """
+        if self.blocked_lookup is None:
+            self.load_tile_data()
+
+        data = Path(path).read_bytes()
+        rows = data.split(b"\n")
+        while rows and not rows[-1].strip():
+            rows.pop()
+        if not rows:
+            raise ValueError(f"{path}: пустая карта")
+
+        width = len(rows[0].split())
+        height = len(rows)
+
+        tokens = data.split()
+        if len(tokens) != width * height:
+            raise ValueError(f"{path}: карта не прямоугольная ({len(tokens)} тайлов при {width}x{height})")
+
+        try:
+            if max(self.tile_data) < 256:
+                raw = bytes(map(self.token_ids.__getitem__, tokens))
+                tiles = array("B", raw)
+                blocked = bytearray(raw.translate(self.blocked_lookup))
+            else:
+                tiles = array("H", map(self.token_ids.__getitem__, tokens))
+                blocked = bytearray(map(self.blocked_lookup.__getitem__, tiles))
+        except KeyError as e:
+            raise ValueError(f"{path}: тайл {e.args[0].decode()} отсутствует в {self.tile_data_file}") from None
+
+        return TileGrid(width, height, tiles, blocked, tile_size)
+
+    def get_tile(self, tile_id: int, textures) -> Tile:
+        """Tile для id (текстура из атласа, проходимость из tiledata)"""
+        tile = self.tiles.get(tile_id)
+        if tile is None:
+            texture = textures[tile_id] if tile_id < len(textures) else textures[0]
+            tile = Tile(texture, self.tile_data[tile_id][1])
+            self.tiles[tile_id] = tile
+        return tile
+
+    def load_textures(self):
+        """Текстуры тайлов из атласа (отступ между тайлами - spacing справа и снизу)"""
+        spacing = self.SPRITESHEET_SPACING
+        return self.rm.load_spritesheet(
+            self.SPRITESHEET,
+            size=(self.SPRITESHEET_TILE, self.SPRITESHEET_TILE),
+            columns=self.SPRITESHEET_COLUMNS,
+            count=self.SPRITESHEET_COUNT,
+            margin=(0, spacing, 0, spacing),
+        )
+
+    def build_sprite_lists(self, grid: TileGrid):
+        """
+        Создает спрайты для отрисовки и слой коллизий.
+        Слой коллизий содержит те же спрайты стен, что и ground - без дублей.
+
+        Returns:
+            (ground_layer, collisions_layer)
+        """
+        textures = self.load_textures()
+        scale = grid.tile_size / self.SPRITESHEET_TILE
+
+        ground_layer = arcade.SpriteList(use_spatial_hash=False)
+        collisions_layer = arcade.SpriteList(use_spatial_hash=True)
+
+        tiles = grid.tiles
+        blocked = grid.blocked
+        width = grid.width
+        for row in range(grid.height):
+            for col in range(width):
+                index = row * width + col
+                tile = self.get_tile(tiles[index], textures)
+                x, y = grid.cell_center(col, row)
+                sprite = arcade.Sprite(tile.texture, scale=scale, center_x=x, center_y=y)
+                ground_layer.append(sprite)
+                if blocked[index]:
+                    collisions_layer.append(sprite)
+
+        self.logger.info(f"Спрайты карты созданы: {len(ground_layer)}, стен: {len(collisions_layer)}")
+        return ground_layer, collisions_layer